@@ -6,6 +6,8 @@ d = { 'settings': { 'branch': 'main',
                 'git_url': 'https://github.com/Beforerr/space-analysis.py',
                 'lib_path': 'src/space_analysis'},
   'syms': { 'space_analysis.core': { 'space_analysis.core.Dataset': ('core.html#dataset', 'space_analysis/core.py'),
+                                     'space_analysis.core.Dataset.from_records': ( 'core.html#dataset.from_records',
+                                                                                   'space_analysis/core.py'),
                                      'space_analysis.core.DensityVariable': ('core.html#densityvariable', 'space_analysis/core.py'),
                                      'space_analysis.core.Instrument': ('core.html#instrument', 'space_analysis/core.py'),
                                      'space_analysis.core.Instrument.add_dataset': ( 'core.html#instrument.add_dataset',
@@ -17,14 +19,21 @@ d = { 'settings': { 'branch': 'main',
                                                                                      'space_analysis/core.py'),
                                      'space_analysis.core.TempVariable': ('core.html#tempvariable', 'space_analysis/core.py'),
                                      'space_analysis.core.Variable': ('core.html#variable', 'space_analysis/core.py'),
+                                     'space_analysis.core.Variable.many': ('core.html#variable.many', 'space_analysis/core.py'),
+                                     'space_analysis.core.Variable.try_validate_many': ( 'core.html#variable.try_validate_many',
+                                                                                         'space_analysis/core.py'),
                                      'space_analysis.core.Variables': ('core.html#variables', 'space_analysis/core.py'),
                                      'space_analysis.core.Variables.add_variable': ( 'core.html#variables.add_variable',
                                                                                      'space_analysis/core.py'),
                                      'space_analysis.core.VelocityVariable': ('core.html#velocityvariable', 'space_analysis/core.py'),
                                      'space_analysis.core.add_v': ('core.html#add_v', 'space_analysis/core.py'),
+                                     'space_analysis.core.frame_records': ('core.html#frame_records', 'space_analysis/core.py'),
                                      'space_analysis.core.list2dict': ('core.html#list2dict', 'space_analysis/core.py'),
+                                     'space_analysis.core.list_adapter': ('core.html#list_adapter', 'space_analysis/core.py'),
                                      'space_analysis.core.normalize': ('core.html#normalize', 'space_analysis/core.py'),
-                                     'space_analysis.core.normalize_t': ('core.html#normalize_t', 'space_analysis/core.py')},
+                                     'space_analysis.core.normalize_t': ('core.html#normalize_t', 'space_analysis/core.py'),
+                                     'space_analysis.core.validate_many': ('core.html#validate_many', 'space_analysis/core.py'),
+                                     'space_analysis.core.validate_records': ('core.html#validate_records', 'space_analysis/core.py')},
             'space_analysis.ds.config': { 'space_analysis.ds.config.Config': ( 'data_structure/config.html#config',
                                                                                'space_analysis/ds/config.py'),
                                           'space_analysis.ds.config.Config.set_default_timerange': ( 'data_structure/config.html#config.set_default_timerange',
@@ -41,6 +50,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                     'space_analysis/ds/config.py')},
             'space_analysis.ds.spz.io': { 'space_analysis.ds.spz.io.get_data_and_time': ( 'data_structure/speasy/io.html#get_data_and_time',
                                                                                           'space_analysis/ds/spz/io.py'),
+                                          'space_analysis.ds.spz.io.get_masks': ( 'data_structure/speasy/io.html#get_masks',
+                                                                                  'space_analysis/ds/spz/io.py'),
                                           'space_analysis.ds.spz.io.is_scalar': ( 'data_structure/speasy/io.html#is_scalar',
                                                                                   'space_analysis/ds/spz/io.py'),
                                           'space_analysis.ds.spz.io.spzvar2pldf': ( 'data_structure/speasy/io.html#spzvar2pldf',
@@ -55,10 +66,16 @@ d = { 'settings': { 'branch': 'main',
                                                                                      'space_analysis/ds/spz/plot.py')},
             'space_analysis.ds.spz.utils': { 'space_analysis.ds.spz.utils.get_time_resolution': ( 'data_structure/speasy/utils.html#get_time_resolution',
                                                                                                   'space_analysis/ds/spz/utils.py')},
-            'space_analysis.ds.tplot.formulary': { 'space_analysis.ds.tplot.formulary.tplot_Alfven_speed': ( 'plasma/formulary_tplot.html#tplot_alfven_speed',
+            'space_analysis.ds.tplot.formulary': { 'space_analysis.ds.tplot.formulary.align_like': ( 'plasma/formulary_tplot.html#align_like',
+                                                                                                     'space_analysis/ds/tplot/formulary.py'),
+                                                   'space_analysis.ds.tplot.formulary.tplot_Alfven_speed': ( 'plasma/formulary_tplot.html#tplot_alfven_speed',
                                                                                                              'space_analysis/ds/tplot/formulary.py'),
+                                                   'space_analysis.ds.tplot.formulary.ts_Alfven_current': ( 'plasma/formulary_tplot.html#ts_alfven_current',
+                                                                                                            'space_analysis/ds/tplot/formulary.py'),
                                                    'space_analysis.ds.tplot.formulary.ts_Alfven_speed': ( 'plasma/formulary_tplot.html#ts_alfven_speed',
-                                                                                                          'space_analysis/ds/tplot/formulary.py')},
+                                                                                                          'space_analysis/ds/tplot/formulary.py'),
+                                                   'space_analysis.ds.tplot.formulary.ts_beta': ( 'plasma/formulary_tplot.html#ts_beta',
+                                                                                                  'space_analysis/ds/tplot/formulary.py')},
             'space_analysis.ds.tplot.plot': { 'space_analysis.ds.tplot.plot.Config': ( 'data_structure/tplot/plot.html#config',
                                                                                        'space_analysis/ds/tplot/plot.py'),
                                               'space_analysis.ds.tplot.plot.PanelConfig': ( 'data_structure/tplot/plot.html#panelconfig',
@@ -69,22 +86,52 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                'space_analysis/ds/tplot/plot.py'),
                                               'space_analysis.ds.tplot.plot.export': ( 'data_structure/tplot/plot.html#export',
                                                                                        'space_analysis/ds/tplot/plot.py'),
+                                              'space_analysis.ds.tplot.plot.load_array': ( 'data_structure/tplot/plot.html#load_array',
+                                                                                           'space_analysis/ds/tplot/plot.py'),
                                               'space_analysis.ds.tplot.plot.load_data': ( 'data_structure/tplot/plot.html#load_data',
                                                                                           'space_analysis/ds/tplot/plot.py'),
+                                              'space_analysis.ds.tplot.plot.load_panels': ( 'data_structure/tplot/plot.html#load_panels',
+                                                                                            'space_analysis/ds/tplot/plot.py'),
                                               'space_analysis.ds.tplot.plot.plot': ( 'data_structure/tplot/plot.html#plot',
                                                                                      'space_analysis/ds/tplot/plot.py'),
                                               'space_analysis.ds.tplot.plot.process': ( 'data_structure/tplot/plot.html#process',
                                                                                         'space_analysis/ds/tplot/plot.py'),
                                               'space_analysis.ds.tplot.plot.process_panel': ( 'data_structure/tplot/plot.html#process_panel',
                                                                                               'space_analysis/ds/tplot/plot.py'),
+                                              'space_analysis.ds.tplot.plot.process_panels': ( 'data_structure/tplot/plot.html#process_panels',
+                                                                                               'space_analysis/ds/tplot/plot.py'),
+                                              'space_analysis.ds.tplot.plot.publish': ( 'data_structure/tplot/plot.html#publish',
+                                                                                        'space_analysis/ds/tplot/plot.py'),
+                                              'space_analysis.ds.tplot.plot.select_array': ( 'data_structure/tplot/plot.html#select_array',
+                                                                                             'space_analysis/ds/tplot/plot.py'),
+                                              'space_analysis.ds.tplot.plot.source_key': ( 'data_structure/tplot/plot.html#source_key',
+                                                                                           'space_analysis/ds/tplot/plot.py'),
                                               'space_analysis.ds.tplot.plot.update_panel': ( 'data_structure/tplot/plot.html#update_panel',
                                                                                              'space_analysis/ds/tplot/plot.py'),
                                               'space_analysis.ds.tplot.plot.update_tvar': ( 'data_structure/tplot/plot.html#update_tvar',
                                                                                             'space_analysis/ds/tplot/plot.py')},
             'space_analysis.ds.tplot.trans': { 'space_analysis.ds.tplot.trans.TransformOp': ( 'data_structure/tplot/trans.html#transformop',
                                                                                               'space_analysis/ds/tplot/trans.py'),
+                                               'space_analysis.ds.tplot.trans.TransformOp.__call__': ( 'data_structure/tplot/trans.html#transformop.__call__',
+                                                                                                       'space_analysis/ds/tplot/trans.py'),
+                                               'space_analysis.ds.tplot.trans.TransformOp.kwargs': ( 'data_structure/tplot/trans.html#transformop.kwargs',
+                                                                                                     'space_analysis/ds/tplot/trans.py'),
                                                'space_analysis.ds.tplot.trans.TransformOp.map_transform_func': ( 'data_structure/tplot/trans.html#transformop.map_transform_func',
                                                                                                                  'space_analysis/ds/tplot/trans.py'),
+                                               'space_analysis.ds.tplot.trans.array_transform_func': ( 'data_structure/tplot/trans.html#array_transform_func',
+                                                                                                       'space_analysis/ds/tplot/trans.py'),
+                                               'space_analysis.ds.tplot.trans.da_avg': ( 'data_structure/tplot/trans.html#da_avg',
+                                                                                         'space_analysis/ds/tplot/trans.py'),
+                                               'space_analysis.ds.tplot.trans.da_magnitude': ( 'data_structure/tplot/trans.html#da_magnitude',
+                                                                                               'space_analysis/ds/tplot/trans.py'),
+                                               'space_analysis.ds.tplot.trans.da_magnitude_join': ( 'data_structure/tplot/trans.html#da_magnitude_join',
+                                                                                                    'space_analysis/ds/tplot/trans.py'),
+                                               'space_analysis.ds.tplot.trans.da_mva': ( 'data_structure/tplot/trans.html#da_mva',
+                                                                                         'space_analysis/ds/tplot/trans.py'),
+                                               'space_analysis.ds.tplot.trans.da_mva_rename': ( 'data_structure/tplot/trans.html#da_mva_rename',
+                                                                                                'space_analysis/ds/tplot/trans.py'),
+                                               'space_analysis.ds.tplot.trans.da_slice': ( 'data_structure/tplot/trans.html#da_slice',
+                                                                                           'space_analysis/ds/tplot/trans.py'),
                                                'space_analysis.ds.tplot.trans.magnitude': ( 'data_structure/tplot/trans.html#magnitude',
                                                                                             'space_analysis/ds/tplot/trans.py'),
                                                'space_analysis.ds.tplot.trans.magnitude_join': ( 'data_structure/tplot/trans.html#magnitude_join',
@@ -97,6 +144,30 @@ d = { 'settings': { 'branch': 'main',
                                                                                                  'space_analysis/ds/tplot/trans.py')},
             'space_analysis.ds.tplot.utils': { 'space_analysis.ds.tplot.utils.get_time_resolution': ( 'data_structure/tplot/utils.html#get_time_resolution',
                                                                                                       'space_analysis/ds/tplot/utils.py')},
+            'space_analysis.ds.ts.align': { 'space_analysis.ds.ts.align.ClockIndex': ( 'data_structure/timeseries/align.html#clockindex',
+                                                                                       'space_analysis/ds/ts/align.py'),
+                                            'space_analysis.ds.ts.align.align': ( 'data_structure/timeseries/align.html#align',
+                                                                                  'space_analysis/ds/ts/align.py'),
+                                            'space_analysis.ds.ts.align.as_ns': ( 'data_structure/timeseries/align.html#as_ns',
+                                                                                  'space_analysis/ds/ts/align.py'),
+                                            'space_analysis.ds.ts.align.clock_index': ( 'data_structure/timeseries/align.html#clock_index',
+                                                                                        'space_analysis/ds/ts/align.py'),
+                                            'space_analysis.ds.ts.align.interp_index': ( 'data_structure/timeseries/align.html#interp_index',
+                                                                                         'space_analysis/ds/ts/align.py'),
+                                            'space_analysis.ds.ts.align.interp_linear': ( 'data_structure/timeseries/align.html#interp_linear',
+                                                                                          'space_analysis/ds/ts/align.py'),
+                                            'space_analysis.ds.ts.align.interp_to': ( 'data_structure/timeseries/align.html#interp_to',
+                                                                                      'space_analysis/ds/ts/align.py'),
+                                            'space_analysis.ds.ts.align.set_sorted': ( 'data_structure/timeseries/align.html#set_sorted',
+                                                                                       'space_analysis/ds/ts/align.py')},
+            'space_analysis.ds.ts.features': { 'space_analysis.ds.ts.features.bin_stats': ( 'data_structure/timeseries/features.html#bin_stats',
+                                                                                            'space_analysis/ds/ts/features.py'),
+                                               'space_analysis.ds.ts.features.combine_bins': ( 'data_structure/timeseries/features.html#combine_bins',
+                                                                                               'space_analysis/ds/ts/features.py'),
+                                               'space_analysis.ds.ts.features.features': ( 'data_structure/timeseries/features.html#features',
+                                                                                           'space_analysis/ds/ts/features.py'),
+                                               'space_analysis.ds.ts.features.rolling_features': ( 'data_structure/timeseries/features.html#rolling_features',
+                                                                                                   'space_analysis/ds/ts/features.py')},
             'space_analysis.ds.ts.io': { 'space_analysis.ds.ts.io.create_data_array': ( 'data_structure/timeseries/io.html#create_data_array',
                                                                                         'space_analysis/ds/ts/io.py'),
                                          'space_analysis.ds.ts.io.df2ts': ( 'data_structure/timeseries/io.html#df2ts',
@@ -107,6 +178,22 @@ d = { 'settings': { 'branch': 'main',
                                                                               'space_analysis/ds/ts/io.py'),
                                          'space_analysis.ds.ts.io.pldf2ts': ( 'data_structure/timeseries/io.html#pldf2ts',
                                                                               'space_analysis/ds/ts/io.py')},
+            'space_analysis.ds.ts.mva': { 'space_analysis.ds.ts.mva.batch_mva': ( 'data_structure/timeseries/mva.html#batch_mva',
+                                                                                  'space_analysis/ds/ts/mva.py'),
+                                          'space_analysis.ds.ts.mva.blocks': ( 'data_structure/timeseries/mva.html#blocks',
+                                                                               'space_analysis/ds/ts/mva.py'),
+                                          'space_analysis.ds.ts.mva.cumsum0': ( 'data_structure/timeseries/mva.html#cumsum0',
+                                                                                'space_analysis/ds/ts/mva.py'),
+                                          'space_analysis.ds.ts.mva.mva': ( 'data_structure/timeseries/mva.html#mva',
+                                                                            'space_analysis/ds/ts/mva.py'),
+                                          'space_analysis.ds.ts.mva.orient': ( 'data_structure/timeseries/mva.html#orient',
+                                                                               'space_analysis/ds/ts/mva.py'),
+                                          'space_analysis.ds.ts.mva.rolling_mva': ( 'data_structure/timeseries/mva.html#rolling_mva',
+                                                                                    'space_analysis/ds/ts/mva.py'),
+                                          'space_analysis.ds.ts.mva.sliding_mva': ( 'data_structure/timeseries/mva.html#sliding_mva',
+                                                                                    'space_analysis/ds/ts/mva.py'),
+                                          'space_analysis.ds.ts.mva.window_covariance': ( 'data_structure/timeseries/mva.html#window_covariance',
+                                                                                          'space_analysis/ds/ts/mva.py')},
             'space_analysis.ds.ts.plot': { 'space_analysis.ds.ts.plot._tsplot': ( 'data_structure/timeseries/plot.html#_tsplot',
                                                                                   'space_analysis/ds/ts/plot.py'),
                                            'space_analysis.ds.ts.plot.broadcast': ( 'data_structure/timeseries/plot.html#broadcast',
@@ -128,7 +215,13 @@ d = { 'settings': { 'branch': 'main',
             'space_analysis.ds.ts.utils': { 'space_analysis.ds.ts.utils.get_time_resolution': ( 'data_structure/timeseries/utils.html#get_time_resolution',
                                                                                                 'space_analysis/ds/ts/utils.py')},
             'space_analysis.io.cdf': { 'space_analysis.io.cdf.cdf2pl': ('io/cdf.html#cdf2pl', 'space_analysis/io/cdf.py'),
-                                       'space_analysis.io.cdf.inspect_cdf': ('io/cdf.html#inspect_cdf', 'space_analysis/io/cdf.py')},
+                                       'space_analysis.io.cdf.cdf_schema': ('io/cdf.html#cdf_schema', 'space_analysis/io/cdf.py'),
+                                       'space_analysis.io.cdf.inspect_cdf': ('io/cdf.html#inspect_cdf', 'space_analysis/io/cdf.py'),
+                                       'space_analysis.io.cdf.read_cdf': ('io/cdf.html#read_cdf', 'space_analysis/io/cdf.py'),
+                                       'space_analysis.io.cdf.read_cdfs': ('io/cdf.html#read_cdfs', 'space_analysis/io/cdf.py'),
+                                       'space_analysis.io.cdf.record_bounds': ('io/cdf.html#record_bounds', 'space_analysis/io/cdf.py'),
+                                       'space_analysis.io.cdf.scan_cdf': ('io/cdf.html#scan_cdf', 'space_analysis/io/cdf.py'),
+                                       'space_analysis.io.cdf.var_columns': ('io/cdf.html#var_columns', 'space_analysis/io/cdf.py')},
             'space_analysis.meta': { 'space_analysis.meta.DensityDataset': ( 'data_structure/meta.html#densitydataset',
                                                                              'space_analysis/meta.py'),
                                      'space_analysis.meta.MagDataset': ('data_structure/meta.html#magdataset', 'space_analysis/meta.py'),
@@ -140,14 +233,30 @@ d = { 'settings': { 'branch': 'main',
                                                                               'space_analysis/meta.py')},
             'space_analysis.missions.juno.fgm': { 'space_analysis.missions.juno.fgm.UnpackConvert': ( 'missions/juno/fgm.html#unpackconvert',
                                                                                                       'space_analysis/missions/juno/fgm.py'),
+                                                  'space_analysis.missions.juno.fgm.UnpackConvert.__init__': ( 'missions/juno/fgm.html#unpackconvert.__init__',
+                                                                                                               'space_analysis/missions/juno/fgm.py'),
                                                   'space_analysis.missions.juno.fgm.UnpackConvert._all_members': ( 'missions/juno/fgm.html#unpackconvert._all_members',
                                                                                                                    'space_analysis/missions/juno/fgm.py'),
                                                   'space_analysis.missions.juno.fgm.UnpackConvert._extract_file': ( 'missions/juno/fgm.html#unpackconvert._extract_file',
                                                                                                                     'space_analysis/missions/juno/fgm.py'),
+                                                  'space_analysis.missions.juno.fgm.default_processor': ( 'missions/juno/fgm.html#default_processor',
+                                                                                                          'space_analysis/missions/juno/fgm.py'),
                                                   'space_analysis.missions.juno.fgm.download_data': ( 'missions/juno/fgm.html#download_data',
                                                                                                       'space_analysis/missions/juno/fgm.py'),
+                                                  'space_analysis.missions.juno.fgm.download_many': ( 'missions/juno/fgm.html#download_many',
+                                                                                                      'space_analysis/missions/juno/fgm.py'),
+                                                  'space_analysis.missions.juno.fgm.is_up_to_date': ( 'missions/juno/fgm.html#is_up_to_date',
+                                                                                                      'space_analysis/missions/juno/fgm.py'),
+                                                  'space_analysis.missions.juno.fgm.jno_table': ( 'missions/juno/fgm.html#jno_table',
+                                                                                                  'space_analysis/missions/juno/fgm.py'),
+                                                  'space_analysis.missions.juno.fgm.juno_fgm_dir': ( 'missions/juno/fgm.html#juno_fgm_dir',
+                                                                                                     'space_analysis/missions/juno/fgm.py'),
                                                   'space_analysis.missions.juno.fgm.load_jno_lbl': ( 'missions/juno/fgm.html#load_jno_lbl',
                                                                                                      'space_analysis/missions/juno/fgm.py'),
+                                                  'space_analysis.missions.juno.fgm.member_output': ( 'missions/juno/fgm.html#member_output',
+                                                                                                      'space_analysis/missions/juno/fgm.py'),
+                                                  'space_analysis.missions.juno.fgm.scan_juno_fgm': ( 'missions/juno/fgm.html#scan_juno_fgm',
+                                                                                                      'space_analysis/missions/juno/fgm.py'),
                                                   'space_analysis.missions.juno.fgm.unpack_and_convert': ( 'missions/juno/fgm.html#unpack_and_convert',
                                                                                                            'space_analysis/missions/juno/fgm.py'),
                                                   'space_analysis.missions.juno.fgm.unzip_convert_lbl': ( 'missions/juno/fgm.html#unzip_convert_lbl',
@@ -162,15 +271,55 @@ d = { 'settings': { 'branch': 'main',
                                                                                                             'space_analysis/missions/wind/plasma.py'),
                                                      'space_analysis.missions.wind.plasma.load_data': ( 'missions/wind/plasma.html#load_data',
                                                                                                         'space_analysis/missions/wind/plasma.py')},
-            'space_analysis.plasma.formulary.numpy': { 'space_analysis.plasma.formulary.numpy.np_Alfven_current': ( 'plasma/formulary_numpy.html#np_alfven_current',
+            'space_analysis.plasma.formulary.numpy': { 'space_analysis.plasma.formulary.numpy.Alfven_current_factor': ( 'plasma/formulary_numpy.html#alfven_current_factor',
+                                                                                                                        'space_analysis/plasma/formulary/numpy.py'),
+                                                       'space_analysis.plasma.formulary.numpy.Alfven_speed_factor': ( 'plasma/formulary_numpy.html#alfven_speed_factor',
+                                                                                                                      'space_analysis/plasma/formulary/numpy.py'),
+                                                       'space_analysis.plasma.formulary.numpy.beta_factor': ( 'plasma/formulary_numpy.html#beta_factor',
+                                                                                                              'space_analysis/plasma/formulary/numpy.py'),
+                                                       'space_analysis.plasma.formulary.numpy.fast_Alfven_current': ( 'plasma/formulary_numpy.html#fast_alfven_current',
+                                                                                                                      'space_analysis/plasma/formulary/numpy.py'),
+                                                       'space_analysis.plasma.formulary.numpy.fast_Alfven_speed': ( 'plasma/formulary_numpy.html#fast_alfven_speed',
+                                                                                                                    'space_analysis/plasma/formulary/numpy.py'),
+                                                       'space_analysis.plasma.formulary.numpy.fast_beta': ( 'plasma/formulary_numpy.html#fast_beta',
+                                                                                                            'space_analysis/plasma/formulary/numpy.py'),
+                                                       'space_analysis.plasma.formulary.numpy.fast_gradient_current': ( 'plasma/formulary_numpy.html#fast_gradient_current',
+                                                                                                                        'space_analysis/plasma/formulary/numpy.py'),
+                                                       'space_analysis.plasma.formulary.numpy.fast_inertial_length': ( 'plasma/formulary_numpy.html#fast_inertial_length',
+                                                                                                                       'space_analysis/plasma/formulary/numpy.py'),
+                                                       'space_analysis.plasma.formulary.numpy.gradient_current_factor': ( 'plasma/formulary_numpy.html#gradient_current_factor',
+                                                                                                                          'space_analysis/plasma/formulary/numpy.py'),
+                                                       'space_analysis.plasma.formulary.numpy.inertial_length_factor': ( 'plasma/formulary_numpy.html#inertial_length_factor',
+                                                                                                                         'space_analysis/plasma/formulary/numpy.py'),
+                                                       'space_analysis.plasma.formulary.numpy.np_Alfven_current': ( 'plasma/formulary_numpy.html#np_alfven_current',
                                                                                                                     'space_analysis/plasma/formulary/numpy.py'),
                                                        'space_analysis.plasma.formulary.numpy.np_Alfven_speed': ( 'plasma/formulary_numpy.html#np_alfven_speed',
                                                                                                                   'space_analysis/plasma/formulary/numpy.py'),
+                                                       'space_analysis.plasma.formulary.numpy.np_beta': ( 'plasma/formulary_numpy.html#np_beta',
+                                                                                                          'space_analysis/plasma/formulary/numpy.py'),
                                                        'space_analysis.plasma.formulary.numpy.np_gradient_current': ( 'plasma/formulary_numpy.html#np_gradient_current',
                                                                                                                       'space_analysis/plasma/formulary/numpy.py'),
                                                        'space_analysis.plasma.formulary.numpy.np_inertial_length': ( 'plasma/formulary_numpy.html#np_inertial_length',
                                                                                                                      'space_analysis/plasma/formulary/numpy.py')},
-            'space_analysis.plasma.formulary.polars': { 'space_analysis.plasma.formulary.polars.df_Alfven_current': ( 'plasma/formulary_polars.html#df_alfven_current',
+            'space_analysis.plasma.formulary.polars': { 'space_analysis.plasma.formulary.polars.PlasmaExpr': ( 'plasma/formulary_polars.html#plasmaexpr',
+                                                                                                               'space_analysis/plasma/formulary/polars.py'),
+                                                        'space_analysis.plasma.formulary.polars.PlasmaExpr.Alfven_current': ( 'plasma/formulary_polars.html#plasmaexpr.alfven_current',
+                                                                                                                              'space_analysis/plasma/formulary/polars.py'),
+                                                        'space_analysis.plasma.formulary.polars.PlasmaExpr.Alfven_speed': ( 'plasma/formulary_polars.html#plasmaexpr.alfven_speed',
+                                                                                                                            'space_analysis/plasma/formulary/polars.py'),
+                                                        'space_analysis.plasma.formulary.polars.PlasmaExpr.__init__': ( 'plasma/formulary_polars.html#plasmaexpr.__init__',
+                                                                                                                        'space_analysis/plasma/formulary/polars.py'),
+                                                        'space_analysis.plasma.formulary.polars.PlasmaExpr.beta': ( 'plasma/formulary_polars.html#plasmaexpr.beta',
+                                                                                                                    'space_analysis/plasma/formulary/polars.py'),
+                                                        'space_analysis.plasma.formulary.polars.PlasmaExpr.gradient_current': ( 'plasma/formulary_polars.html#plasmaexpr.gradient_current',
+                                                                                                                                'space_analysis/plasma/formulary/polars.py'),
+                                                        'space_analysis.plasma.formulary.polars.PlasmaExpr.inertial_length': ( 'plasma/formulary_polars.html#plasmaexpr.inertial_length',
+                                                                                                                               'space_analysis/plasma/formulary/polars.py'),
+                                                        'space_analysis.plasma.formulary.polars.PlasmaExpr.thermal_spd2temp': ( 'plasma/formulary_polars.html#plasmaexpr.thermal_spd2temp',
+                                                                                                                                'space_analysis/plasma/formulary/polars.py'),
+                                                        'space_analysis.plasma.formulary.polars.col_expr': ( 'plasma/formulary_polars.html#col_expr',
+                                                                                                             'space_analysis/plasma/formulary/polars.py'),
+                                                        'space_analysis.plasma.formulary.polars.df_Alfven_current': ( 'plasma/formulary_polars.html#df_alfven_current',
                                                                                                                       'space_analysis/plasma/formulary/polars.py'),
                                                         'space_analysis.plasma.formulary.polars.df_Alfven_speed': ( 'plasma/formulary_polars.html#df_alfven_speed',
                                                                                                                     'space_analysis/plasma/formulary/polars.py'),
@@ -184,10 +333,32 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                         'space_analysis/plasma/formulary/polars.py'),
                                                         'space_analysis.plasma.formulary.polars.ldf_Alfven_speed': ( 'plasma/formulary_polars.html#ldf_alfven_speed',
                                                                                                                      'space_analysis/plasma/formulary/polars.py'),
+                                                        'space_analysis.plasma.formulary.polars.pl_Alfven_current': ( 'plasma/formulary_polars.html#pl_alfven_current',
+                                                                                                                      'space_analysis/plasma/formulary/polars.py'),
+                                                        'space_analysis.plasma.formulary.polars.pl_Alfven_speed': ( 'plasma/formulary_polars.html#pl_alfven_speed',
+                                                                                                                    'space_analysis/plasma/formulary/polars.py'),
+                                                        'space_analysis.plasma.formulary.polars.pl_beta': ( 'plasma/formulary_polars.html#pl_beta',
+                                                                                                            'space_analysis/plasma/formulary/polars.py'),
+                                                        'space_analysis.plasma.formulary.polars.pl_gradient_current': ( 'plasma/formulary_polars.html#pl_gradient_current',
+                                                                                                                        'space_analysis/plasma/formulary/polars.py'),
+                                                        'space_analysis.plasma.formulary.polars.pl_inertial_length': ( 'plasma/formulary_polars.html#pl_inertial_length',
+                                                                                                                       'space_analysis/plasma/formulary/polars.py'),
+                                                        'space_analysis.plasma.formulary.polars.pl_thermal_spd2temp': ( 'plasma/formulary_polars.html#pl_thermal_spd2temp',
+                                                                                                                        'space_analysis/plasma/formulary/polars.py'),
                                                         'space_analysis.plasma.formulary.polars.thermal_spd2temp': ( 'plasma/formulary_polars.html#thermal_spd2temp',
                                                                                                                      'space_analysis/plasma/formulary/polars.py')},
-            'space_analysis.plasma.mhd_waves': { 'space_analysis.plasma.mhd_waves.VpVg_fs': ( 'plasma/mhd_waves.html#vpvg_fs',
-                                                                                              'space_analysis/plasma/mhd_waves.py')},
+            'space_analysis.plasma.mhd_waves': { 'space_analysis.plasma.mhd_waves.VpVg': ( 'plasma/mhd_waves.html#vpvg',
+                                                                                           'space_analysis/plasma/mhd_waves.py'),
+                                                 'space_analysis.plasma.mhd_waves.VpVg_fs': ( 'plasma/mhd_waves.html#vpvg_fs',
+                                                                                              'space_analysis/plasma/mhd_waves.py'),
+                                                 'space_analysis.plasma.mhd_waves.angle_grid': ( 'plasma/mhd_waves.html#angle_grid',
+                                                                                                 'space_analysis/plasma/mhd_waves.py'),
+                                                 'space_analysis.plasma.mhd_waves.iter_VpVg': ( 'plasma/mhd_waves.html#iter_vpvg',
+                                                                                                'space_analysis/plasma/mhd_waves.py'),
+                                                 'space_analysis.plasma.mhd_waves.magnetosonic': ( 'plasma/mhd_waves.html#magnetosonic',
+                                                                                                   'space_analysis/plasma/mhd_waves.py'),
+                                                 'space_analysis.plasma.mhd_waves.output_keys': ( 'plasma/mhd_waves.html#output_keys',
+                                                                                                  'space_analysis/plasma/mhd_waves.py')},
             'space_analysis.plot.basic': { 'space_analysis.plot.basic.savefig': ( 'plot/matplotlib.html#savefig',
                                                                                   'space_analysis/plot/basic.py')},
             'space_analysis.simulation.warpx': { 'space_analysis.simulation.warpx.CustomSimulation': ( 'simulation/warpx.html#customsimulation',
@@ -236,6 +407,64 @@ d = { 'settings': { 'branch': 'main',
                                                                                                    'space_analysis/simulation/warpx.py')},
             'space_analysis.utils.basic': { 'space_analysis.utils.basic.resample': ( 'utils/basic.html#resample',
                                                                                      'space_analysis/utils/basic.py')},
+            'space_analysis.utils.cache': { 'space_analysis.utils.cache.CacheStats': ( 'utils/cache.html#cachestats',
+                                                                                       'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.CacheStats.add': ( 'utils/cache.html#cachestats.add',
+                                                                                           'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.CacheStats.hit_rate': ( 'utils/cache.html#cachestats.hit_rate',
+                                                                                                'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.ChunkCache': ( 'utils/cache.html#chunkcache',
+                                                                                       'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.ChunkCache.__init__': ( 'utils/cache.html#chunkcache.__init__',
+                                                                                                'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.ChunkCache._store': ( 'utils/cache.html#chunkcache._store',
+                                                                                              'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.ChunkCache._write': ( 'utils/cache.html#chunkcache._write',
+                                                                                              'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.ChunkCache.chunk_path': ( 'utils/cache.html#chunkcache.chunk_path',
+                                                                                                  'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.ChunkCache.clear': ( 'utils/cache.html#chunkcache.clear',
+                                                                                             'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.ChunkCache.evict': ( 'utils/cache.html#chunkcache.evict',
+                                                                                             'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.ChunkCache.files': ( 'utils/cache.html#chunkcache.files',
+                                                                                             'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.ChunkCache.get': ( 'utils/cache.html#chunkcache.get',
+                                                                                           'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.ChunkCache.size': ( 'utils/cache.html#chunkcache.size',
+                                                                                            'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.Coalescer': ( 'utils/cache.html#coalescer',
+                                                                                      'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.Coalescer.__call__': ( 'utils/cache.html#coalescer.__call__',
+                                                                                               'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.Coalescer.__init__': ( 'utils/cache.html#coalescer.__init__',
+                                                                                               'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.TTLCache': ( 'utils/cache.html#ttlcache',
+                                                                                     'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.TTLCache.__init__': ( 'utils/cache.html#ttlcache.__init__',
+                                                                                              'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.TTLCache._file': ( 'utils/cache.html#ttlcache._file',
+                                                                                           'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.TTLCache._fresh': ( 'utils/cache.html#ttlcache._fresh',
+                                                                                            'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.TTLCache._load': ( 'utils/cache.html#ttlcache._load',
+                                                                                           'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.TTLCache.clear': ( 'utils/cache.html#ttlcache.clear',
+                                                                                           'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.TTLCache.get': ( 'utils/cache.html#ttlcache.get',
+                                                                                         'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.chunk_starts': ( 'utils/cache.html#chunk_starts',
+                                                                                         'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.fetch_split': ( 'utils/cache.html#fetch_split',
+                                                                                        'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.safe_name': ( 'utils/cache.html#safe_name',
+                                                                                      'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.split_timerange': ( 'utils/cache.html#split_timerange',
+                                                                                            'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.tmp_suffix': ( 'utils/cache.html#tmp_suffix',
+                                                                                       'space_analysis/utils/cache.py'),
+                                            'space_analysis.utils.cache.to_datetime': ( 'utils/cache.html#to_datetime',
+                                                                                        'space_analysis/utils/cache.py')},
             'space_analysis.utils.cdas': { 'space_analysis.utils.cdas.Variables': ( 'utils/cdas.html#variables',
                                                                                     'space_analysis/utils/cdas.py'),
                                            'space_analysis.utils.cdas.Variables.check_products': ( 'utils/cdas.html#variables.check_products',
@@ -248,15 +477,82 @@ d = { 'settings': { 'branch': 'main',
                                                                                               'space_analysis/utils/cdas.py'),
                                            'space_analysis.utils.cdas.Variables.to_polars': ( 'utils/cdas.html#variables.to_polars',
                                                                                               'space_analysis/utils/cdas.py'),
+                                           'space_analysis.utils.cdas.__getattr__': ( 'utils/cdas.html#__getattr__',
+                                                                                      'space_analysis/utils/cdas.py'),
+                                           'space_analysis.utils.cdas._get_data': ( 'utils/cdas.html#_get_data',
+                                                                                    'space_analysis/utils/cdas.py'),
+                                           'space_analysis.utils.cdas.cdas_fetch': ( 'utils/cdas.html#cdas_fetch',
+                                                                                     'space_analysis/utils/cdas.py'),
+                                           'space_analysis.utils.cdas.clip_time': ( 'utils/cdas.html#clip_time',
+                                                                                    'space_analysis/utils/cdas.py'),
+                                           'space_analysis.utils.cdas.combine_pieces': ( 'utils/cdas.html#combine_pieces',
+                                                                                         'space_analysis/utils/cdas.py'),
+                                           'space_analysis.utils.cdas.da2pldf': ('utils/cdas.html#da2pldf', 'space_analysis/utils/cdas.py'),
+                                           'space_analysis.utils.cdas.get_cdas': ( 'utils/cdas.html#get_cdas',
+                                                                                   'space_analysis/utils/cdas.py'),
                                            'space_analysis.utils.cdas.get_data': ( 'utils/cdas.html#get_data',
                                                                                    'space_analysis/utils/cdas.py'),
                                            'space_analysis.utils.cdas.get_dataset_variables': ( 'utils/cdas.html#get_dataset_variables',
-                                                                                                'space_analysis/utils/cdas.py')},
-            'space_analysis.utils.lbl': {'space_analysis.utils.lbl.load_lbl': ('io/lbl.html#load_lbl', 'space_analysis/utils/lbl.py')},
+                                                                                                'space_analysis/utils/cdas.py'),
+                                           'space_analysis.utils.cdas.get_polars': ( 'utils/cdas.html#get_polars',
+                                                                                     'space_analysis/utils/cdas.py'),
+                                           'space_analysis.utils.cdas.get_variables': ( 'utils/cdas.html#get_variables',
+                                                                                        'space_analysis/utils/cdas.py')},
+            'space_analysis.utils.imports': { 'space_analysis.utils.imports.import_time': ( 'utils/imports.html#import_time',
+                                                                                            'space_analysis/utils/imports.py'),
+                                              'space_analysis.utils.imports.lazy_import': ( 'utils/imports.html#lazy_import',
+                                                                                            'space_analysis/utils/imports.py'),
+                                              'space_analysis.utils.imports.loaded_modules': ( 'utils/imports.html#loaded_modules',
+                                                                                               'space_analysis/utils/imports.py'),
+                                              'space_analysis.utils.imports.run_python': ( 'utils/imports.html#run_python',
+                                                                                           'space_analysis/utils/imports.py')},
+            'space_analysis.utils.lbl': { 'space_analysis.utils.lbl.UnsupportedTableError': ( 'io/lbl.html#unsupportedtableerror',
+                                                                                              'space_analysis/utils/lbl.py'),
+                                          'space_analysis.utils.lbl.decode_column': ( 'io/lbl.html#decode_column',
+                                                                                      'space_analysis/utils/lbl.py'),
+                                          'space_analysis.utils.lbl.label_statements': ( 'io/lbl.html#label_statements',
+                                                                                         'space_analysis/utils/lbl.py'),
+                                          'space_analysis.utils.lbl.load_lbl': ('io/lbl.html#load_lbl', 'space_analysis/utils/lbl.py'),
+                                          'space_analysis.utils.lbl.parse_label': ( 'io/lbl.html#parse_label',
+                                                                                    'space_analysis/utils/lbl.py'),
+                                          'space_analysis.utils.lbl.parse_value': ( 'io/lbl.html#parse_value',
+                                                                                    'space_analysis/utils/lbl.py'),
+                                          'space_analysis.utils.lbl.read_lbl': ('io/lbl.html#read_lbl', 'space_analysis/utils/lbl.py'),
+                                          'space_analysis.utils.lbl.read_table': ('io/lbl.html#read_table', 'space_analysis/utils/lbl.py'),
+                                          'space_analysis.utils.lbl.table_columns': ( 'io/lbl.html#table_columns',
+                                                                                      'space_analysis/utils/lbl.py'),
+                                          'space_analysis.utils.lbl.table_offset': ( 'io/lbl.html#table_offset',
+                                                                                     'space_analysis/utils/lbl.py')},
             'space_analysis.utils.math': { 'space_analysis.utils.math.cosd': ('utils/math.html#cosd', 'space_analysis/utils/math.py'),
                                            'space_analysis.utils.math.sind': ('utils/math.html#sind', 'space_analysis/utils/math.py')},
-            'space_analysis.utils.mission': { 'space_analysis.utils.mission.find_instrument': ( 'examples/mission_info.html#find_instrument',
+            'space_analysis.utils.mission': { 'space_analysis.utils.mission.MissionCatalog': ( 'examples/mission_info.html#missioncatalog',
+                                                                                               'space_analysis/utils/mission.py'),
+                                              'space_analysis.utils.mission.MissionCatalog.__init__': ( 'examples/mission_info.html#missioncatalog.__init__',
+                                                                                                        'space_analysis/utils/mission.py'),
+                                              'space_analysis.utils.mission.MissionCatalog.from_missions': ( 'examples/mission_info.html#missioncatalog.from_missions',
+                                                                                                             'space_analysis/utils/mission.py'),
+                                              'space_analysis.utils.mission.MissionCatalog.from_yaml': ( 'examples/mission_info.html#missioncatalog.from_yaml',
+                                                                                                         'space_analysis/utils/mission.py'),
+                                              'space_analysis.utils.mission.MissionCatalog.query': ( 'examples/mission_info.html#missioncatalog.query',
+                                                                                                     'space_analysis/utils/mission.py'),
+                                              'space_analysis.utils.mission._compile_catalog': ( 'examples/mission_info.html#_compile_catalog',
+                                                                                                 'space_analysis/utils/mission.py'),
+                                              'space_analysis.utils.mission._read_cdas_instruments': ( 'examples/mission_info.html#_read_cdas_instruments',
+                                                                                                       'space_analysis/utils/mission.py'),
+                                              'space_analysis.utils.mission.cadence_expr': ( 'examples/mission_info.html#cadence_expr',
+                                                                                             'space_analysis/utils/mission.py'),
+                                              'space_analysis.utils.mission.catalog_rows': ( 'examples/mission_info.html#catalog_rows',
+                                                                                             'space_analysis/utils/mission.py'),
+                                              'space_analysis.utils.mission.dataset_rows': ( 'examples/mission_info.html#dataset_rows',
+                                                                                             'space_analysis/utils/mission.py'),
+                                              'space_analysis.utils.mission.find_instrument': ( 'examples/mission_info.html#find_instrument',
                                                                                                 'space_analysis/utils/mission.py'),
+                                              'space_analysis.utils.mission.flat_instruments': ( 'examples/mission_info.html#flat_instruments',
+                                                                                                 'space_analysis/utils/mission.py'),
+                                              'space_analysis.utils.mission.load_catalog': ( 'examples/mission_info.html#load_catalog',
+                                                                                             'space_analysis/utils/mission.py'),
+                                              'space_analysis.utils.mission.load_cdas_instruments': ( 'examples/mission_info.html#load_cdas_instruments',
+                                                                                                      'space_analysis/utils/mission.py'),
                                               'space_analysis.utils.mission.merge_dfs': ( 'examples/mission_info.html#merge_dfs',
                                                                                           'space_analysis/utils/mission.py'),
                                               'space_analysis.utils.mission.parse_mission_yaml': ( 'examples/mission_info.html#parse_mission_yaml',
@@ -265,9 +561,50 @@ d = { 'settings': { 'branch': 'main',
                                                                                                'space_analysis/utils/mission.py'),
                                               'space_analysis.utils.mission.parse_missions_yaml': ( 'examples/mission_info.html#parse_missions_yaml',
                                                                                                     'space_analysis/utils/mission.py')},
-            'space_analysis.utils.pds': { 'space_analysis.utils.pds.pds_download': ( 'utils/pds.html#pds_download',
-                                                                                     'space_analysis/utils/pds.py')},
-            'space_analysis.utils.speasy': { 'space_analysis.utils.speasy.SVariables': ( 'utils/speasy.html#svariables',
+            'space_analysis.utils.pds': { 'space_analysis.utils.pds.HashRegistry': ( 'utils/pds.html#hashregistry',
+                                                                                     'space_analysis/utils/pds.py'),
+                                          'space_analysis.utils.pds.HashRegistry.__init__': ( 'utils/pds.html#hashregistry.__init__',
+                                                                                              'space_analysis/utils/pds.py'),
+                                          'space_analysis.utils.pds.HashRegistry._read': ( 'utils/pds.html#hashregistry._read',
+                                                                                           'space_analysis/utils/pds.py'),
+                                          'space_analysis.utils.pds.HashRegistry.get': ( 'utils/pds.html#hashregistry.get',
+                                                                                         'space_analysis/utils/pds.py'),
+                                          'space_analysis.utils.pds.HashRegistry.set': ( 'utils/pds.html#hashregistry.set',
+                                                                                         'space_analysis/utils/pds.py'),
+                                          'space_analysis.utils.pds.body_offset': ( 'utils/pds.html#body_offset',
+                                                                                    'space_analysis/utils/pds.py'),
+                                          'space_analysis.utils.pds.fetch_url': ('utils/pds.html#fetch_url', 'space_analysis/utils/pds.py'),
+                                          'space_analysis.utils.pds.fetch_urls': ( 'utils/pds.html#fetch_urls',
+                                                                                   'space_analysis/utils/pds.py'),
+                                          'space_analysis.utils.pds.pds_download': ( 'utils/pds.html#pds_download',
+                                                                                     'space_analysis/utils/pds.py'),
+                                          'space_analysis.utils.pds.response_validator': ( 'utils/pds.html#response_validator',
+                                                                                           'space_analysis/utils/pds.py')},
+            'space_analysis.utils.speasy': { 'space_analysis.utils.speasy.InventoryIndex': ( 'utils/speasy.html#inventoryindex',
+                                                                                             'space_analysis/utils/speasy.py'),
+                                             'space_analysis.utils.speasy.InventoryIndex.__contains__': ( 'utils/speasy.html#inventoryindex.__contains__',
+                                                                                                          'space_analysis/utils/speasy.py'),
+                                             'space_analysis.utils.speasy.InventoryIndex.__init__': ( 'utils/speasy.html#inventoryindex.__init__',
+                                                                                                      'space_analysis/utils/speasy.py'),
+                                             'space_analysis.utils.speasy.InventoryIndex._rows': ( 'utils/speasy.html#inventoryindex._rows',
+                                                                                                   'space_analysis/utils/speasy.py'),
+                                             'space_analysis.utils.speasy.InventoryIndex.build': ( 'utils/speasy.html#inventoryindex.build',
+                                                                                                   'space_analysis/utils/speasy.py'),
+                                             'space_analysis.utils.speasy.InventoryIndex.coverage': ( 'utils/speasy.html#inventoryindex.coverage',
+                                                                                                      'space_analysis/utils/speasy.py'),
+                                             'space_analysis.utils.speasy.InventoryIndex.from_inventory': ( 'utils/speasy.html#inventoryindex.from_inventory',
+                                                                                                            'space_analysis/utils/speasy.py'),
+                                             'space_analysis.utils.speasy.InventoryIndex.load': ( 'utils/speasy.html#inventoryindex.load',
+                                                                                                  'space_analysis/utils/speasy.py'),
+                                             'space_analysis.utils.speasy.InventoryIndex.parameters': ( 'utils/speasy.html#inventoryindex.parameters',
+                                                                                                        'space_analysis/utils/speasy.py'),
+                                             'space_analysis.utils.speasy.InventoryIndex.save': ( 'utils/speasy.html#inventoryindex.save',
+                                                                                                  'space_analysis/utils/speasy.py'),
+                                             'space_analysis.utils.speasy.InventoryIndex.search': ( 'utils/speasy.html#inventoryindex.search',
+                                                                                                    'space_analysis/utils/speasy.py'),
+                                             'space_analysis.utils.speasy.InventoryIndex.validate': ( 'utils/speasy.html#inventoryindex.validate',
+                                                                                                      'space_analysis/utils/speasy.py'),
+                                             'space_analysis.utils.speasy.SVariables': ( 'utils/speasy.html#svariables',
                                                                                          'space_analysis/utils/speasy.py'),
                                              'space_analysis.utils.speasy.SpeasyVariable.preview': ( 'utils/speasy.html#speasyvariable.preview',
                                                                                                      'space_analysis/utils/speasy.py'),
@@ -303,12 +640,18 @@ d = { 'settings': { 'branch': 'main',
                                                                                                          'space_analysis/utils/speasy.py'),
                                              'space_analysis.utils.speasy.Variables.to_polars': ( 'utils/speasy.html#variables.to_polars',
                                                                                                   'space_analysis/utils/speasy.py'),
+                                             'space_analysis.utils.speasy.fetch_data': ( 'utils/speasy.html#fetch_data',
+                                                                                         'space_analysis/utils/speasy.py'),
+                                             'space_analysis.utils.speasy.get_cached_polars_ldf': ( 'utils/speasy.html#get_cached_polars_ldf',
+                                                                                                    'space_analysis/utils/speasy.py'),
                                              'space_analysis.utils.speasy.get_data': ( 'utils/speasy.html#get_data',
                                                                                        'space_analysis/utils/speasy.py'),
                                              'space_analysis.utils.speasy.get_dataset_index': ( 'utils/speasy.html#get_dataset_index',
                                                                                                 'space_analysis/utils/speasy.py'),
                                              'space_analysis.utils.speasy.get_dataset_parameters': ( 'utils/speasy.html#get_dataset_parameters',
                                                                                                      'space_analysis/utils/speasy.py'),
+                                             'space_analysis.utils.speasy.get_inventory_index': ( 'utils/speasy.html#get_inventory_index',
+                                                                                                  'space_analysis/utils/speasy.py'),
                                              'space_analysis.utils.speasy.get_parameter_index': ( 'utils/speasy.html#get_parameter_index',
                                                                                                   'space_analysis/utils/speasy.py'),
                                              'space_analysis.utils.speasy.get_polars_ldf': ( 'utils/speasy.html#get_polars_ldf',
@@ -316,4 +659,8 @@ d = { 'settings': { 'branch': 'main',
                                              'space_analysis.utils.speasy.get_products': ( 'utils/speasy.html#get_products',
                                                                                            'space_analysis/utils/speasy.py'),
                                              'space_analysis.utils.speasy.get_provider': ( 'utils/speasy.html#get_provider',
-                                                                                           'space_analysis/utils/speasy.py')}}}
+                                                                                           'space_analysis/utils/speasy.py'),
+                                             'space_analysis.utils.speasy.index_meta': ( 'utils/speasy.html#index_meta',
+                                                                                         'space_analysis/utils/speasy.py'),
+                                             'space_analysis.utils.speasy.spz_fetch': ( 'utils/speasy.html#spz_fetch',
+                                                                                        'space_analysis/utils/speasy.py')}}}
@@ -5,8 +5,10 @@ __all__ = ['model_config', 'Variable', 'Variables', 'MagVariable', 'DensityVaria
            'Dataset', 'Instrument', 'InstrumentSuite', 'Mission']
 
 # %% ../../nbs/00_core.ipynb 1
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
 from datetime import datetime, timedelta
+from functools import cache
+from typing import Iterable, Mapping
 
 # %% ../../nbs/00_core.ipynb 2
 model_config = ConfigDict(extra="allow")
@@ -34,6 +36,62 @@ def add_v(self, name, v):
     return getattr(self, name).update({v.name: v})
 
 # %% ../../nbs/00_core.ipynb 6
+@cache
+def list_adapter(cls: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[cls])
+
+
+def frame_records(df) -> list[dict]:
+    """Rows of data frame `df`, where nulls are missing values"""
+    return [
+        {k: v for k, v in r.items() if v is not None} for r in df.iter_rows(named=True)
+    ]
+
+
+def validate_records(cls: type[BaseModel], records: Iterable[Mapping]):
+    """Validate `records` into `cls` instances, `None` for invalid rows, along with the errors of each invalid row"""
+    if hasattr(records, "to_dicts"):  # data frames
+        records = frame_records(records)
+    records = list(records)
+    rows = range(len(records))
+    models = [None] * len(records)
+    errors = {}
+    while rows:
+        try:
+            valid = list_adapter(cls).validate_python([records[i] for i in rows])
+        except ValidationError as e:
+            bad = set()
+            for err in e.errors(include_url=False):
+                j, *loc = err["loc"]
+                errors.setdefault(rows[j], []).append({**err, "loc": tuple(loc)})
+                bad.add(j)
+            # validate the valid rows again, now that the invalid ones are known
+            rows = [i for j, i in enumerate(rows) if j not in bad]
+            continue
+        for i, m in zip(rows, valid):
+            models[i] = m
+        break
+    return models, errors
+
+
+def validate_many(cls: type[BaseModel], records: Iterable[Mapping]) -> list:
+    """Validate `records` into `cls` instances, raising a `ValidationError` listing the errors of all invalid rows"""
+    models, errors = validate_records(cls, records)
+    if errors:
+        line_errors = [
+            {
+                "type": err["type"],
+                "loc": (i, *err["loc"]),
+                "input": err["input"],
+                **({"ctx": err["ctx"]} if "ctx" in err else {}),
+            }
+            for i, errs in sorted(errors.items())
+            for err in errs
+        ]
+        raise ValidationError.from_exception_data(cls.__name__, line_errors)
+    return models
+
+# %% ../../nbs/00_core.ipynb 8
 class Variable(BaseModel):
     model_config = model_config
 
@@ -48,6 +106,16 @@ class Variable(BaseModel):
     dataset: str = None  # the dataset that this variable belongs to
     parameter: list[str] = None  # the parameter(s) that this variable represents
 
+    @classmethod
+    def many(cls, records: Iterable[Mapping]) -> list["Variable"]:
+        """Variables validated in bulk from `records` (mappings or a data frame)"""
+        return validate_many(cls, records)
+
+    @classmethod
+    def try_validate_many(cls, records: Iterable[Mapping]):
+        """Like `many`, but returning `None` for invalid rows along with the errors of each invalid row"""
+        return validate_records(cls, records)
+
 
 class Variables(BaseModel):
     timerange: list[datetime] = None
@@ -56,7 +124,7 @@ class Variables(BaseModel):
     def add_variable(self, v):
         add_v(self, "variables", v)
 
-# %% ../../nbs/00_core.ipynb 8
+# %% ../../nbs/00_core.ipynb 10
 class MagVariable(Variable):
     B_cols: list[str] = None
 
@@ -75,7 +143,7 @@ class TempVariable(Variable):
     para_temp: str = None
     perp_temp: str | list[str] = None
 
-# %% ../../nbs/00_core.ipynb 10
+# %% ../../nbs/00_core.ipynb 12
 class Dataset(Variables):
     model_config = model_config
 
@@ -84,7 +152,17 @@ class Dataset(Variables):
     parameters: list[str] = None  # list of parameter names (core variables)
     ts: timedelta = None  # time resolution (all variables in one dataset have the same time resolution)
 
-# %% ../../nbs/00_core.ipynb 12
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Mapping],  # variable fields, one record per variable
+        variable_type: type[Variable] = Variable,
+        **kwargs,  # fields of the dataset
+    ):
+        """Dataset whose variables are validated in bulk from `records`"""
+        return cls(variables=list2dict(variable_type.many(records)), **kwargs)
+
+# %% ../../nbs/00_core.ipynb 17
 class Instrument(BaseModel):
     model_config = model_config
 
@@ -5,8 +5,10 @@ __all__ = ['to_dataarray', 'to_dataarrays', 'spzvar2pldf', 'spzvars2pldf']
 
 # %% ../../../../nbs/data_structure/speasy/01_io.ipynb 0
 from speasy import SpeasyVariable
+import numpy as np
 import xarray as xr
 import polars as pl
+from ..ts.align import align
 
 # %% ../../../../nbs/data_structure/speasy/01_io.ipynb 2
 def is_scalar(v: SpeasyVariable):
@@ -16,28 +18,60 @@ def is_scalar(v: SpeasyVariable):
     return len(v.shape) == 2 and v.shape[1] == 1
 
 
-def get_data_and_time(v: SpeasyVariable):
-    v = v.replace_fillval_by_nan()
+def get_masks(v: SpeasyVariable):
+    """
+    Element-wise mask of fill values and record-wise mask of valid records, computed in a single vectorised pass.
+
+    A record is valid if none of its values is a fill value and all of them are within `[VALIDMIN, VALIDMAX]`.
+    The record-wise mask is `None` if the variable has no valid range.
+    """
     data = v.values
-    time = v.time
-    v_valid_mins = v.meta.get("VALIDMIN", [])
-    v_valid_maxs = v.meta.get("VALIDMAX", [])
-
-    all_cond_axis = tuple(range(1, data.ndim))
-    for v_valid_min in v_valid_mins:
-        cond = (data >= v_valid_min).all(axis=all_cond_axis)
-        data, time = data[cond], time[cond]
-    for v_valid_max in v_valid_maxs:
-        cond = (data <= v_valid_max).all(axis=all_cond_axis)
-        data, time = data[cond], time[cond]
-    return data, time
+    fill = data == v.fill_value if v.fill_value is not None else None
+
+    v_valid_mins = np.atleast_1d(v.meta.get("VALIDMIN", []))
+    v_valid_maxs = np.atleast_1d(v.meta.get("VALIDMAX", []))
+    if not (v_valid_mins.size or v_valid_maxs.size):
+        return fill, None
+
+    valid = ~fill if fill is not None else np.ones(data.shape, dtype=bool)
+    if v_valid_mins.size:
+        valid &= data >= v_valid_mins.max()
+    if v_valid_maxs.size:
+        valid &= data <= v_valid_maxs.min()
+    return fill, valid.all(axis=tuple(range(1, data.ndim)))
+
+
+def get_data_and_time(v: SpeasyVariable, drop_invalid=True):
+    """
+    Values, time and valid records of the variable.
+
+    Fill values are replaced by NaN and invalid records are dropped if `drop_invalid`, otherwise their mask is returned.
+    The arrays of the variable are returned as is (without copy) when there is nothing to replace or drop.
+    """
+    data, time = v.values, v.time
+    fill, valid = get_masks(v)
+
+    if valid is not None and drop_invalid:
+        # records with fill values are invalid, so there is no need to replace them
+        if valid.all():
+            return data, time, None
+        return data[valid], time[valid], None
+
+    if fill is not None and fill.any():
+        data = np.where(fill, np.nan, data)
+    return data, time, valid
 
 # %% ../../../../nbs/data_structure/speasy/01_io.ipynb 3
-def to_dataarray(v: SpeasyVariable):
+def to_dataarray(
+    v: SpeasyVariable,
+    drop_invalid=True,  # drop invalid records, otherwise replace them by NaN
+):
     """
     Notes: scalar timeseries of `ndim==2` is a design choice to be consistent with what Pandas does.
     """
-    data, time = get_data_and_time(v)
+    data, time, valid = get_data_and_time(v, drop_invalid)
+    if valid is not None and not valid.all():
+        data = np.where(np.expand_dims(valid, tuple(range(1, data.ndim))), data, np.nan)
 
     time_coord = xr.DataArray(time, dims="time")
     attrs = dict(v.meta, units=v.unit, long_name=v.name)
@@ -48,20 +82,24 @@ def to_dataarray(v: SpeasyVariable):
     return xr.DataArray(values, coords=coords, name=v.name, attrs=attrs)
 
 
-def to_dataarrays(vs: list[SpeasyVariable]):
-    return [to_dataarray(v) for v in vs]
+def to_dataarrays(vs: list[SpeasyVariable], **kwargs):
+    return [to_dataarray(v, **kwargs) for v in vs]
 
 # %% ../../../../nbs/data_structure/speasy/01_io.ipynb 4
-def spzvar2pldf(var: SpeasyVariable):
+def spzvar2pldf(
+    var: SpeasyVariable,
+    drop_invalid=True,  # drop invalid records, otherwise set them to null
+):
     # see SpeasyVariable.to_dataframe
-    data, time = get_data_and_time(var)
-    return (
-        pl.DataFrame(data, schema=var.columns).with_columns(time=pl.Series(time)).lazy()
-    )  # Need to `lazy` last or ShapeError: unable to add a column of length xxxx to a DataFrame of height yyyy
+    data, time, valid = get_data_and_time(var, drop_invalid)
+    df = pl.DataFrame(data, schema=var.columns).with_columns(time=pl.Series(time))
+    if valid is not None:
+        df = df.with_columns(
+            pl.when(pl.lit(pl.Series(valid))).then(pl.col(var.columns))
+        )
+    return df.lazy()  # Need to `lazy` last or ShapeError: unable to add a column of length xxxx to a DataFrame of height yyyy
 
 
-def spzvars2pldf(vars: list[SpeasyVariable]):
-    # join all dataframes into a single one on the time column
-    if len(vars) == 1:
-        return spzvar2pldf(vars[0])
-    return pl.concat([spzvar2pldf(var) for var in vars], how="align")
+def spzvars2pldf(vars: list[SpeasyVariable], **kwargs):
+    """Join all variables into a single dataframe, aligned onto the time of the first one (see `align`)"""
+    return align([spzvar2pldf(var) for var in vars], **kwargs)
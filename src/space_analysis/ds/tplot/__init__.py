@@ -1,9 +1,10 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../../../nbs/data_structure/tplot/01_tplot.ipynb.
 
 # %% auto 0
-__all__ = ['get_data', 'store_data', 'export2csv']
+__all__ = ['get_data', 'to_dataarray', 'store_data', 'export2csv']
 
 # %% ../../../../nbs/data_structure/tplot/01_tplot.ipynb 0
+import numpy as np
 import pytplot
 from xarray import DataArray
 
@@ -19,6 +20,16 @@ def get_data(tvar: str | list[str], **args):
         return [_get_data(t) for t in tvar]
 
 
+def to_dataarray(name: str, data: dict) -> DataArray:
+    """`DataArray` from tplot-like data `{"x": times, "y": values}`, without storing it"""
+    time = np.asarray(data["x"])
+    if time.dtype.kind in "fi":  # unix seconds
+        time = (time * 1e9).astype(np.int64).view("datetime64[ns]")
+    values = np.asarray(data["y"])
+    dims = ["time", *(f"v{i}" for i in range(1, values.ndim))]
+    return DataArray(values, coords={"time": time}, dims=dims, name=name)
+
+
 def store_data(da: DataArray):
     pytplot.store_data(da.name, data={"x": da.time, "y": da.values})
     return da.name
@@ -1,36 +1,102 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../../../nbs/plasma/00_formulary_tplot.ipynb.
 
 # %% auto 0
-__all__ = ['ts_Alfven_speed', 'tplot_Alfven_speed']
+__all__ = ['align_like', 'ts_Alfven_speed', 'ts_Alfven_current', 'ts_beta', 'tplot_Alfven_speed']
 
 # %% ../../../../nbs/plasma/00_formulary_tplot.ipynb 1
+import numpy as np
 import pytplot
 from xarray import DataArray
-from ...plasma.formulary.numpy import np_Alfven_speed
+from ...plasma.formulary.numpy import np_Alfven_speed, np_Alfven_current
+from ...plasma.formulary.numpy import np_beta, DEFAULT_CURRENT_UNIT
+from ..ts.align import clock_index, interp_index
 from . import store_data
 from loguru import logger
 
 # %% ../../../../nbs/plasma/00_formulary_tplot.ipynb 2
+def align_like(
+    da: DataArray,
+    ref: DataArray,
+    time="time",
+    method="linear",
+    indexes: list = None,  # clock indexes already computed, reused and extended
+) -> np.ndarray:
+    """Values of `da` at the times of `ref`"""
+    src, dst = da.coords[time], ref.coords[time]
+    if src.equals(dst):
+        return da.to_numpy()
+    logger.info(f"Time of {da.name} and {ref.name} are not the same, interpolating")
+    idx = next(
+        (
+            idx
+            for s, d, m, idx in indexes or []
+            if m == method and s.equals(src) and d.equals(dst)
+        ),
+        None,
+    )
+    if idx is None:
+        idx = clock_index(src.values, dst.values, method)
+        if indexes is not None:
+            indexes.append((src, dst, method, idx))
+    return interp_index(da.to_numpy(), idx)
+
+# %% ../../../../nbs/plasma/00_formulary_tplot.ipynb 3
 def ts_Alfven_speed(
     B: DataArray,  # magnetic field in the plasma, could be a component, as plasmapy will take `abs` of it
     density: DataArray,  # particle density of the plasma
     name="Alfven_speed",
     time="time",
+    indexes: list = None,  # clock indexes onto `B`, shared between calls, see `align_like`
     **kwargs,
 ):
-    if not B.coords[time].equals(density.coords[time]):
-        logger.info(
-            "Time of B and density are not the same, interpolating density to B"
-        )
-        density = density.interp_like(B)
-
-    Alfven_speed = np_Alfven_speed(B=B.to_numpy(), density=density.to_numpy(), **kwargs)
+    density = align_like(density, B, time, indexes=indexes)
+    Alfven_speed = np_Alfven_speed(B=B.to_numpy(), density=density, **kwargs)
 
     return DataArray(
         Alfven_speed, coords={time: B.coords[time]}, dims=[time], name=name
     )
 
 
+def ts_Alfven_current(
+    B: DataArray,
+    density: DataArray,
+    name="Alfven_current",
+    time="time",
+    indexes: list = None,
+    current_unit=DEFAULT_CURRENT_UNIT,
+    **kwargs,  # passed to `np_Alfven_speed`
+):
+    n = align_like(density, B, time, indexes=indexes)
+    Alfven_speed = np_Alfven_speed(B=B.to_numpy(), density=n, fast=True, **kwargs)
+    units = {k: v for k, v in kwargs.items() if k in ("speed_unit", "n_unit")}
+    current = np_Alfven_current(
+        Alfven_speed, n, current_unit=current_unit, fast=True, **units
+    )
+
+    return DataArray(current, coords={time: B.coords[time]}, dims=[time], name=name)
+
+
+def ts_beta(
+    B: DataArray,  # magnitude of the magnetic field
+    density: DataArray,
+    temperature: DataArray,
+    name="beta",
+    time="time",
+    indexes: list = None,
+    **kwargs,
+):
+    indexes = (
+        [] if indexes is None else indexes
+    )  # temperature and density often share a clock
+    beta = np_beta(
+        T=align_like(temperature, B, time, indexes=indexes),
+        n=align_like(density, B, time, indexes=indexes),
+        B=B.to_numpy(),
+        **kwargs,
+    )
+    return DataArray(beta, coords={time: B.coords[time]}, dims=[time], name=name)
+
+
 def tplot_Alfven_speed(
     B: str,  # magnetic field in the plasma, could be a component, as plasmapy will take `abs` of it
     density: str,  # particle density of the plasma
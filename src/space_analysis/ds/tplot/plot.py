@@ -1,8 +1,8 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../../../nbs/data_structure/tplot/02_plot.ipynb.
 
 # %% auto 0
-__all__ = ['ProcessConfig', 'PanelConfig', 'Config', 'update_panel', 'plot', 'export', 'process', 'load_data', 'update_tvar',
-           'process_panel']
+__all__ = ['ProcessConfig', 'PanelConfig', 'Config', 'update_panel', 'plot', 'export', 'process', 'load_data', 'select_array',
+           'load_array', 'source_key', 'load_panels', 'update_tvar', 'publish', 'process_panel', 'process_panels']
 
 # %% ../../../../nbs/data_structure/tplot/02_plot.ipynb 0
 from pydantic import (
@@ -14,13 +14,15 @@ from ..config import PanelConfig as PanelConfigBase
 from .trans import TransformOp
 
 import pyspedas
-from cdasws import CdasWs
+from ...utils.cdas import get_data as cdas_get_data
 
 import pytplot
 from pytplot import tplot, options
 import matplotlib.pyplot as plt
 from loguru import logger
-from . import export2csv
+from concurrent.futures import ThreadPoolExecutor
+from . import export2csv, store_data, to_dataarray
+from xarray import DataArray
 
 from matplotlib.pyplot import Figure, Axes
 
@@ -93,17 +95,16 @@ def export(tvars2plot: list, config: Config, plot_kwargs: dict = dict(), **kwarg
     return fig, axes
 
 # %% ../../../../nbs/data_structure/tplot/02_plot.ipynb 4
-def process(tvar: str | list[str], config: ProcessConfig):
+def process(data: str | list[str] | DataArray, config: ProcessConfig):
+    """Apply the transforms of `config`, in memory if `data` is a `DataArray`"""
     for tran in config.trans:
-        tvar = tran.transform_func(
-            tvar, **tran.model_dump(exclude=["name", "transform_func"])
-        )
-    return tvar
+        data = tran(data)
+    return data
 
 # %% ../../../../nbs/data_structure/tplot/02_plot.ipynb 5
-def load_data(config: PanelConfig, load_func=None):
+def load_data(config: PanelConfig, load_func=None, notplot=False):
     if isinstance(config, list):
-        return [load_data(c) for c in config]
+        return [load_data(c, load_func, notplot) for c in config]
 
     timerange = [time.isoformat() for time in config.timerange]
     var = config.id
@@ -113,9 +114,13 @@ def load_data(config: PanelConfig, load_func=None):
             mod = getattr(pyspedas, config.satellite)
             load_func = getattr(mod, config.instrument)
         elif config.ds:
-            cdas = CdasWs()
-            status, data = cdas.get_data(config.ds, var, timerange[0], timerange[1])
-            pytplot.store_data(var, {"x": data[var].Epoch, "y": data[var]})
+            names = var if isinstance(var, list) else [var]
+            data = cdas_get_data(config.ds, timerange, names)
+            data = {v: {"x": data[v].Epoch, "y": data[v]} for v in names}
+            if notplot:
+                return data
+            for v in names:
+                pytplot.store_data(v, data[v])
             return var
         else:
             logger.error("No load function provided")
@@ -132,10 +137,72 @@ def load_data(config: PanelConfig, load_func=None):
         load_args["datatype"] = config.datatype
     if config.probe is not None:
         load_args["probe"] = config.probe
+    if notplot:
+        load_args["notplot"] = True
 
     return load_func(**load_args)
 
 # %% ../../../../nbs/data_structure/tplot/02_plot.ipynb 6
+def select_array(data: dict, var: str = None) -> DataArray | None:
+    """`DataArray` of `var` (or the first variable if `var` is not given) from tplot-like `notplot` data"""
+    if not data:
+        logger.error(f"No data loaded for {var}")
+        return None
+    if var is None:
+        var = next(iter(data))
+    elif var not in data:
+        # with shared loads, another variable of the source would be silently plotted instead
+        logger.error(f"{var} is not in the loaded data: {list(data)}")
+        return None
+    return to_dataarray(var, data[var])
+
+
+def load_array(config: PanelConfig, load_func=None) -> DataArray | None:
+    """Load the panel data as a `DataArray`, without storing it in `pytplot`"""
+    if isinstance(config, list):
+        return [load_array(c, load_func) for c in config]
+
+    data: dict = load_data(config, load_func, notplot=True)
+    return select_array(data, config.id)
+
+# %% ../../../../nbs/data_structure/tplot/02_plot.ipynb 7
+def source_key(config: PanelConfig):
+    """Panels with the same key are loaded from the same source with a single request"""
+    return (
+        config.satellite,
+        config.instrument,
+        config.datatype,
+        config.probe,
+        config.ds,
+        tuple(config.timerange),
+    )
+
+
+def load_panels(
+    configs: list[PanelConfig],
+    load_func=None,
+    max_workers: int = None,  # The number of sources loaded concurrently.
+) -> list[DataArray | None]:
+    """Load panels as `DataArray`s, each distinct source once and concurrently"""
+    sources: dict[tuple, list[PanelConfig]] = {}
+    for config in configs:
+        sources.setdefault(source_key(config), []).append(config)
+
+    def load(panels: list[PanelConfig]):
+        ids = {c.id for c in panels}
+        varnames = None if None in ids else sorted(ids)
+        if varnames is not None and len(varnames) == 1:
+            varnames = varnames[0]
+        return load_data(
+            panels[0].model_copy(update={"id": varnames}), load_func, notplot=True
+        )
+
+    with ThreadPoolExecutor(max_workers) as pool:
+        data = dict(zip(sources, pool.map(load, sources.values())))
+    logger.debug(f"Loaded {len(sources)} sources for {len(configs)} panels")
+    return [select_array(data[source_key(c)], c.id) for c in configs]
+
+# %% ../../../../nbs/data_structure/tplot/02_plot.ipynb 8
 def update_tvar(tvar, config: PanelConfig):
     options(tvar, "thick", 2)
     # options(tvar, "char_size", 16)
@@ -149,17 +216,50 @@ def update_tvar(tvar, config: PanelConfig):
     return tvar
 
 
+def publish(data: str | DataArray, config: PanelConfig):
+    """Store the processed panel data in `pytplot` for rendering, once"""
+    if isinstance(data, DataArray):
+        tvar = store_data(data)
+        if "legend_names" in data.attrs:
+            options(tvar, "legend_names", data.attrs["legend_names"])
+    else:
+        tvar = data
+    return update_tvar(tvar, config=config)
+
+
 def process_panel(
     config: PanelConfig,
     process_func=process,
-    load_func=load_data,
-    update_func=update_tvar,
+    load_func=load_array,
+    update_func=publish,
 ):
-    tvar = load_func(config)
+    data = load_func(config)
+
+    if isinstance(data, list):
+        data = data[0]
 
-    if isinstance(tvar, list):
-        tvar = tvar[0]
+    processed = process_func(data, config=config.process)
+    logger.debug(f"Processed: {getattr(processed, 'name', processed)}")
+    return update_func(processed, config=config)
 
-    tvar_processed = process_func(tvar, config=config.process)
-    logger.debug(f"Processed tvar: {tvar_processed}")
-    return update_func(tvar_processed, config=config)
+
+def process_panels(
+    configs: list[PanelConfig],
+    process_func=process,
+    load_func=load_panels,
+    update_func=publish,
+    max_workers: int = None,
+):
+    """Load and process panels concurrently, then publish them for rendering in order"""
+    arrays = load_func(configs, max_workers=max_workers)
+
+    def _process(data, config: PanelConfig):
+        return None if data is None else process_func(data, config=config.process)
+
+    with ThreadPoolExecutor(max_workers) as pool:
+        processed = list(pool.map(_process, arrays, configs))
+    # `pytplot` stores are not thread-safe
+    return [
+        None if data is None else update_func(data, config=c)
+        for data, c in zip(processed, configs)
+    ]
@@ -1,7 +1,8 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../../../nbs/data_structure/tplot/03_trans.ipynb.
 
 # %% auto 0
-__all__ = ['magnitude', 'mva', 'magnitude_join', 'mva_rename', 'TransformOp', 'transform_func']
+__all__ = ['magnitude', 'mva', 'magnitude_join', 'mva_rename', 'da_magnitude', 'da_magnitude_join', 'da_mva', 'da_mva_rename',
+           'da_slice', 'da_avg', 'TransformOp', 'transform_func', 'array_transform_func']
 
 # %% ../../../../nbs/data_structure/tplot/03_trans.ipynb 0
 from pydantic import (
@@ -10,15 +11,19 @@ from pydantic import (
     model_validator,
 )
 
-import pyspedas
-from pytplot import options, split_vec, join_vec
+import numpy as np
+from datetime import timedelta
+from xarray import DataArray
+from ...utils.imports import lazy_import
 from ..ts import B_TsOption
-from pyspedas import minvar_matrix_make, tvector_rotate
-from pyspedas.analysis.tvectot import tvectot
+from ..ts.mva import mva as mva_eig
 import sys
 
 from typing import Callable
 
+_pytplot = lazy_import("pytplot")
+_pyspedas = lazy_import("pyspedas")
+
 # %% ../../../../nbs/data_structure/tplot/03_trans.ipynb 1
 # if "slice-1" in config.trans:
 #     tvar = split_vec(tvar)[:1]
@@ -27,27 +32,83 @@ from typing import Callable
 
 
 def magnitude(tvar: str):
+    from pyspedas.analysis.tvectot import tvectot
+
     tvar2plot = tvectot(tvar, join_component=False)
-    options(tvar2plot, "legend_names", None)
+    _pytplot.options(tvar2plot, "legend_names", None)
     return tvar2plot
 
 
 def mva(tvar: str):
-    minvar_matrix_make(tvar)
-    tvar2plot = tvector_rotate(tvar + "_mva_mat", tvar)[0]
+    _pyspedas.minvar_matrix_make(tvar)
+    tvar2plot = _pyspedas.tvector_rotate(tvar + "_mva_mat", tvar)[0]
     return tvar2plot
 
 
 def magnitude_join(tvar: str):
+    from pyspedas.analysis.tvectot import tvectot
+
     tvar2plot = tvectot(tvar, join_component=True)
     return tvar2plot
 
 
 def mva_rename(tvar: str, legend_names=B_TsOption["legend_names"]):
-    options(tvar, "legend_names", legend_names)
+    _pytplot.options(tvar, "legend_names", legend_names)
     return tvar
 
-# %% ../../../../nbs/data_structure/tplot/03_trans.ipynb 2
+# %% ../../../../nbs/data_structure/tplot/03_trans.ipynb 3
+def da_magnitude(da: DataArray):
+    """Magnitude of the vector `da`, as `tvectot(join_component=False)`"""
+    return DataArray(
+        np.linalg.norm(da.values, axis=-1),
+        coords={"time": da.time},
+        dims=["time"],
+        name=f"{da.name}_tot",
+        attrs={**da.attrs, "legend_names": None},
+    )
+
+
+def da_magnitude_join(da: DataArray):
+    """Components and magnitude of the vector `da`, as `tvectot(join_component=True)`"""
+    values = np.column_stack([da.values, np.linalg.norm(da.values, axis=-1)])
+    return DataArray(
+        values,
+        coords={"time": da.time},
+        dims=da.dims,
+        name=f"{da.name}_tot",
+        attrs=da.attrs,
+    )
+
+
+def da_mva(da: DataArray):
+    """Rotate the vector `da` into the minimum variance frame of the whole interval"""
+    B = da.values[:, :3]
+    _, eigvecs = mva_eig(B)
+    return DataArray(
+        B @ eigvecs,
+        coords={"time": da.time},
+        dims=da.dims,
+        name=f"{da.name}_rot",
+        attrs=da.attrs,
+    )
+
+
+def da_mva_rename(da: DataArray, legend_names=B_TsOption["legend_names"]):
+    return da.assign_attrs(legend_names=legend_names)
+
+
+def da_slice(da: DataArray, stop: int):
+    """First `stop` components of `da`, the component itself if `stop` is 1"""
+    return da[:, 0] if stop == 1 else da[:, :stop]
+
+
+def da_avg(da: DataArray, res: float = 60.0):
+    """Average `da` over `res` seconds, labelled at the bin centre, as `pyspedas.avg_data`"""
+    width = timedelta(seconds=res)
+    avg = da.resample(time=width).mean()
+    return avg.assign_coords(time=avg.time + np.timedelta64(width / 2))
+
+# %% ../../../../nbs/data_structure/tplot/03_trans.ipynb 5
 class TransformOp(BaseModel):
     """Transformation operation"""
 
@@ -57,18 +118,43 @@ class TransformOp(BaseModel):
     name: str
 
     transform_func: Callable[[str], str] = None
+    array_func: Callable[[DataArray], DataArray] = None
 
     @model_validator(mode="after")
     def map_transform_func(self):
         self.transform_func = transform_func(self.name)
+        self.array_func = array_transform_func(self.name)
         return self
 
+    @property
+    def kwargs(self):
+        return self.model_dump(exclude=["name", "transform_func", "array_func"])
+
+    def __call__(self, data: str | list[str] | DataArray):
+        """Apply the operation to a tplot variable name or in memory to a `DataArray`"""
+        if not isinstance(data, DataArray):
+            return self.transform_func(data, **self.kwargs)
+        if self.array_func is None:
+            raise ValueError(f"No in-memory transform for {self.name}")
+        return self.array_func(data, **self.kwargs)
+
 
 def transform_func(name):
     transform_func_maps = {
-        "avg": pyspedas.avg_data,
-        "slice-1": lambda tvar: split_vec(tvar)[:1],
-        "slice-3": lambda tvar: join_vec(split_vec(tvar)[:3]),
+        "avg": _pyspedas.avg_data,
+        "slice-1": lambda tvar: _pytplot.split_vec(tvar)[:1],
+        "slice-3": lambda tvar: _pytplot.join_vec(_pytplot.split_vec(tvar)[:3]),
     }
     func = transform_func_maps.get(name, None) or getattr(sys.modules[__name__], name)
     return func
+
+
+def array_transform_func(name):
+    array_func_maps = {
+        "avg": da_avg,
+        "slice-1": lambda da: da_slice(da, 1),
+        "slice-3": lambda da: da_slice(da, 3),
+    }
+    return array_func_maps.get(name, None) or getattr(
+        sys.modules[__name__], f"da_{name}", None
+    )
@@ -4,8 +4,11 @@
 __all__ = ['B_TsOption', 'V_TsOption', 'n_TsOption', 'ts_options', 'TsOption', 'set_ts_option']
 
 # %% ../../../../nbs/data_structure/timeseries/timeseries.ipynb 0
+from typing import TYPE_CHECKING
 from typing_extensions import TypedDict
-from xarray import DataArray
+
+if TYPE_CHECKING:
+    from xarray import DataArray
 
 # %% ../../../../nbs/data_structure/timeseries/timeseries.ipynb 1
 class TsOption(TypedDict):
@@ -39,7 +42,7 @@ ts_options = {
 }
 
 
-def set_ts_option(da: DataArray, type="B", options_dict=ts_options):
+def set_ts_option(da: "DataArray", type="B", options_dict=ts_options):
     da.attrs["long_name"] = options_dict[type]["title"]
     da.attrs["units"] = options_dict[type]["units"]
     if "v_dim" in da.dims:
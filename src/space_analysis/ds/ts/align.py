@@ -0,0 +1,175 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../../nbs/data_structure/timeseries/align.ipynb.
+
+# %% auto 0
+__all__ = ['AlignMethods', 'interp_linear', 'align', 'ClockIndex', 'as_ns', 'clock_index', 'interp_index', 'interp_to']
+
+# %% ../../../../nbs/data_structure/timeseries/align.ipynb 1
+import numpy as np
+import polars as pl
+from datetime import timedelta
+from typing import Literal, NamedTuple
+from ...utils.basic import resample
+
+# %% ../../../../nbs/data_structure/timeseries/align.ipynb 2
+def set_sorted(
+    df: pl.LazyFrame | pl.DataFrame, time="time", dtype=None
+) -> pl.LazyFrame:
+    """Flag the time column as sorted (and cast it to `dtype`) so that joins skip the sortedness check."""
+    col = pl.col(time) if dtype is None else pl.col(time).cast(dtype)
+    return df.lazy().with_columns(col.set_sorted())
+
+# %% ../../../../nbs/data_structure/timeseries/align.ipynb 3
+def interp_linear(
+    ref: pl.LazyFrame,  # reference frame, whose time is the clock to interpolate onto
+    df: pl.LazyFrame,
+    time="time",
+    tolerance: timedelta = None,  # maximum distance to the neighbouring samples
+) -> pl.LazyFrame:
+    """Linearly interpolate `df` onto the time of `ref` with a backward and a forward as-of join.
+
+    Columns of `df` already in `ref` are suffixed with `_right`, as with `join_asof`.
+    """
+    cols = [c for c in df.collect_schema().names() if c != time]
+    ref_cols = set(ref.collect_schema().names())
+    names = {c: f"{c}_right" if c in ref_cols else c for c in cols}
+    if clash := [n for c, n in names.items() if c in ref_cols and n in ref_cols]:
+        raise ValueError(f"Columns {clash} are already in the reference frame")
+
+    def neighbour(suffix):
+        return df.select(
+            time,
+            pl.col(time).alias(f"{time}{suffix}"),
+            *[pl.col(c).alias(f"{c}{suffix}") for c in cols],
+        )
+
+    t0, t1 = pl.col(f"{time}__0"), pl.col(f"{time}__1")
+    weight = (pl.col(time) - t0).dt.total_nanoseconds() / (
+        t1 - t0
+    ).dt.total_nanoseconds()
+
+    return (
+        ref.join_asof(
+            neighbour("__0"), on=time, strategy="backward", tolerance=tolerance
+        )
+        .join_asof(neighbour("__1"), on=time, strategy="forward", tolerance=tolerance)
+        .with_columns(
+            pl.when(t0 == t1)
+            .then(pl.col(f"{c}__0"))
+            .otherwise(
+                pl.col(f"{c}__0") + weight * (pl.col(f"{c}__1") - pl.col(f"{c}__0"))
+            )
+            .alias(names[c])
+            for c in cols
+        )
+        .drop(
+            f"{time}__0",
+            f"{time}__1",
+            *[f"{c}{s}" for c in cols for s in ("__0", "__1")],
+        )
+    )
+
+# %% ../../../../nbs/data_structure/timeseries/align.ipynb 4
+AlignMethods = Literal["exact", "nearest", "backward", "forward", "linear", "mean"]
+
+
+def align(
+    dfs: list[pl.LazyFrame | pl.DataFrame],
+    method: AlignMethods = "exact",
+    ref: int = 0,  # index of the reference frame, whose time is the common clock
+    tolerance: timedelta = None,  # maximum time distance of a matched sample
+    every: timedelta = None,  # bin width for `method="mean"`
+    time="time",
+) -> pl.LazyFrame:
+    """
+    Align time-sorted frames onto the clock of a reference frame.
+
+    - `exact`: outer join on the exact timestamps of all frames
+    - `nearest`, `backward` and `forward`: as-of join with the given strategy
+    - `linear`: linear interpolation between the neighbouring samples
+    - `mean`: bin-averaged resampling of all frames onto bins of width `every`, bins without a sample of the reference frame are dropped
+    """
+    if not dfs:
+        raise ValueError("No frames to align")
+    if method == "exact":
+        dtype = dfs[ref].lazy().collect_schema()[time]
+        return pl.concat([set_sorted(df, time, dtype) for df in dfs], how="align")
+    if method == "mean":
+        dfs = [resample(df, every, time_column=time) for df in dfs]
+        method, tolerance = "backward", timedelta(0)  # bins are on the same grid
+
+    ref_df = set_sorted(dfs[ref], time)
+    dtype = ref_df.collect_schema()[time]
+
+    for i, df in enumerate(dfs):
+        if i == ref:
+            continue
+        df = set_sorted(df, time, dtype)
+        if method == "linear":
+            ref_df = interp_linear(ref_df, df, time=time, tolerance=tolerance)
+        else:
+            ref_df = ref_df.join_asof(df, on=time, strategy=method, tolerance=tolerance)
+    return ref_df
+
+# %% ../../../../nbs/data_structure/timeseries/align.ipynb 7
+class ClockIndex(NamedTuple):
+    lo: np.ndarray  # previous (or nearest) source sample of each target time
+    hi: np.ndarray  # next source sample
+    weight: np.ndarray | None  # weight of the next sample, `None` for `nearest`
+    inside: np.ndarray  # whether the target time is within the source times
+
+
+def as_ns(time) -> np.ndarray:
+    return np.asarray(time, dtype="datetime64[ns]").view(np.int64)
+
+
+def clock_index(
+    src_time: np.ndarray,  # sorted source times
+    dst_time: np.ndarray,  # sorted target times
+    method: Literal["linear", "nearest"] = "linear",
+) -> ClockIndex:
+    """Neighbouring samples of `src_time` for each time of `dst_time`"""
+    s, d = as_ns(src_time), as_ns(dst_time)
+    if not len(s):
+        zeros = np.zeros(len(d), dtype=np.intp)
+        outside = np.zeros(len(d), dtype=bool)
+        weight = None if method == "nearest" else np.zeros(len(d))
+        return ClockIndex(zeros, zeros, weight, outside)
+    i = np.searchsorted(s, d, side="right")
+    lo = np.clip(i - 1, 0, len(s) - 1)
+    hi = np.clip(i, 0, len(s) - 1)
+    inside = (d >= s[0]) & (d <= s[-1])
+
+    if method == "nearest":
+        lo = np.where(d - s[lo] <= s[hi] - d, lo, hi)
+        return ClockIndex(lo, lo, None, inside)
+    span = (s[hi] - s[lo]).astype(np.float64)
+    weight = np.divide(d - s[lo], span, out=np.zeros(len(d)), where=span > 0)
+    return ClockIndex(lo, hi, weight, inside)
+
+
+def interp_index(
+    values: np.ndarray,  # samples along the first axis
+    idx: ClockIndex,  # from `clock_index` of the times of `values`
+) -> np.ndarray:
+    """Interpolate `values` with a precomputed `idx`, NaN outside of the source times"""
+    values = np.asarray(values, dtype=np.float64)
+    if not len(values):
+        return np.full((len(idx.inside), *values.shape[1:]), np.nan)
+    if idx.weight is None:
+        out = values[idx.lo]
+    else:
+        w = idx.weight.reshape(-1, *[1] * (values.ndim - 1))
+        out = values[idx.lo] * (1 - w)
+        out += values[idx.hi] * w
+    out[~idx.inside] = np.nan
+    return out
+
+
+def interp_to(
+    values: np.ndarray,  # samples along the first axis
+    src_time: np.ndarray,  # sorted times of `values`
+    dst_time: np.ndarray,  # sorted times to interpolate at
+    method: Literal["linear", "nearest"] = "linear",
+) -> np.ndarray:
+    """Interpolate `values` from `src_time` to `dst_time`, NaN outside of `src_time`"""
+    return interp_index(values, clock_index(src_time, dst_time, method))
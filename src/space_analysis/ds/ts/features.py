@@ -0,0 +1,152 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../../nbs/data_structure/timeseries/features.ipynb.
+
+# %% auto 0
+__all__ = ['rolling_features']
+
+# %% ../../../../nbs/data_structure/timeseries/features.ipynb 1
+import polars as pl
+from datetime import timedelta
+
+# %% ../../../../nbs/data_structure/timeseries/features.ipynb 2
+def bin_stats(
+    ldf: pl.LazyFrame, every: timedelta, cols: list[str], time="time"
+) -> pl.LazyFrame:
+    """Statistics of the field per bin of `every`, that can be merged across bins"""
+    mag = pl.sum_horizontal(pl.col(c) ** 2 for c in cols).sqrt()
+    return (
+        ldf.select(time, *cols)
+        .filter(
+            pl.all_horizontal(pl.col(cols).is_not_null() & pl.col(cols).is_finite())
+        )
+        .with_columns(_mag=mag)
+        .group_by(pl.col(time).dt.truncate(every))
+        .agg(
+            pl.len().alias("_n"),
+            pl.col("_mag").sum().alias("_s_mag"),
+            pl.col("_mag").min().alias("_min_mag"),
+            pl.col("_mag").max().alias("_max_mag"),
+            *[pl.col(c).mean().alias(f"_m_{c}") for c in cols],
+            # centred, as `sum(x**2) - n * mean**2` cancels on offset fields
+            *[
+                ((pl.col(c) - pl.col(c).mean()) ** 2).sum().alias(f"_M2_{c}")
+                for c in cols
+            ],
+            *[pl.col(c).min_by(time).alias(f"_first_{c}") for c in cols],
+            *[pl.col(c).max_by(time).alias(f"_last_{c}") for c in cols],
+        )
+    )
+
+
+def combine_bins(
+    bins: pl.LazyFrame, every: timedelta, k: int, cols: list[str], time="time"
+):
+    """Statistics of windows of `k` consecutive bins, labelled by their first bin
+
+    Sums of squared deviations are merged with the parallel (Chan) formula, on bin means taken relative to a global offset.
+    """
+    # regular grid of bins, so that windows are `k` rows
+    grid = bins.select(
+        pl.datetime_range(pl.col(time).min(), pl.col(time).max(), every).alias(time)
+    )
+    sums = ["_n", "_s_mag", *[f"_{s}_{c}" for s in ("M2", "d", "dd") for c in cols]]
+    idx = pl.int_range(pl.len())
+    filled = pl.col("_n") > 0
+    # first and last non-empty bins of each window
+    first_bin = pl.when(filled).then(idx).backward_fill().shift(k - 1)
+    last_bin = pl.when(filled).then(idx).forward_fill()
+    n = pl.col("_n")
+    # deviations of the bin means from an offset, so that their moments stay small
+    d = {c: pl.col(f"_m_{c}") - pl.col(f"_m_{c}").mean() for c in cols}
+    return (
+        grid.join(bins, on=time, how="left")
+        .sort(time)
+        .with_columns(
+            *[(n * d[c]).alias(f"_d_{c}") for c in cols],
+            *[(n * d[c] ** 2).alias(f"_dd_{c}") for c in cols],
+        )
+        .with_columns(pl.col(sums).fill_null(0))
+        .with_columns(
+            pl.col(sums).rolling_sum(k),
+            pl.col("_min_mag").rolling_min(k, min_samples=1),
+            pl.col("_max_mag").rolling_max(k, min_samples=1),
+            *[
+                pl.when(first_bin <= idx)
+                .then(pl.col(f"_first_{c}").backward_fill().shift(k - 1))
+                .alias(f"_first_{c}")
+                for c in cols
+            ],
+            *[
+                pl.when(last_bin > idx - k)
+                .then(pl.col(f"_last_{c}").forward_fill())
+                .alias(f"_last_{c}")
+                for c in cols
+            ],
+            pl.col(time) - (k - 1) * every,
+        )
+        .filter(idx >= k - 1, n > 0)
+        .with_columns(
+            (
+                pl.col(f"_M2_{c}") + pl.col(f"_dd_{c}") - pl.col(f"_d_{c}") ** 2 / n
+            ).alias(f"_M2_{c}")
+            for c in cols
+        )
+    )
+
+
+def features(cols: list[str], time="time") -> list[pl.Expr]:
+    n = pl.col("_n")
+    mag = pl.col("_s_mag") / n
+    first = [pl.col(f"_first_{c}") for c in cols]
+    last = [pl.col(f"_last_{c}") for c in cols]
+    dot = pl.sum_horizontal(f * ll for f, ll in zip(first, last))
+    norm_first = pl.sum_horizontal(f**2 for f in first).sqrt()
+    norm_last = pl.sum_horizontal(ll**2 for ll in last).sqrt()
+    dB = pl.sum_horizontal((ll - f) ** 2 for f, ll in zip(first, last)).sqrt()
+
+    def std(c):
+        var = pl.col(f"_M2_{c}").clip(lower_bound=0) / (n - 1)
+        return var.sqrt().alias(f"{c}_std")
+
+    return [
+        pl.col(time),
+        n.alias("count"),
+        mag.alias("B_mag"),
+        *[std(c) for c in cols],
+        (pl.col("_min_mag") / pl.col("_max_mag")).alias("B_min_max_ratio"),
+        (dot / (norm_first * norm_last))
+        .clip(-1, 1)
+        .arccos()
+        .degrees()
+        .alias("rotation_angle"),
+        (dB / mag).alias("dB_over_B"),
+    ]
+
+# %% ../../../../nbs/data_structure/timeseries/features.ipynb 3
+def rolling_features(
+    ldf: pl.LazyFrame | pl.DataFrame,
+    every: timedelta,
+    period: timedelta = None,  # window length, a multiple of `every`; defaults to `every` (tumbling windows)
+    cols: list[str] = None,  # field components, defaults to all columns but `time`
+    time="time",
+) -> pl.LazyFrame:
+    """Windowed statistics of the field, over windows of `period` starting every `every`
+
+    Windows are labelled by their start time, only full windows with at least one valid sample are kept.
+
+    - `B_mag`: mean $|B|$
+    - `{col}_std`: standard deviation of each component
+    - `B_min_max_ratio`: ratio of the minimum to the maximum $|B|$
+    - `rotation_angle`: angle in degrees between the first and last field of the window
+    - `dB_over_B`: $|B_{last} - B_{first}|$ over the mean $|B|$
+    """
+    ldf = ldf.lazy()
+    cols = cols or [c for c in ldf.collect_schema().names() if c != time]
+    period = period or every
+    k = period / every
+    if k != int(k):
+        raise ValueError(f"`period` ({period}) must be a multiple of `every` ({every})")
+
+    bins = bin_stats(ldf, every, cols, time)
+    if k > 1:
+        bins = combine_bins(bins, every, int(k), cols, time)
+    return bins.select(features(cols, time)).sort(time)
@@ -0,0 +1,157 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../../nbs/data_structure/timeseries/mva.ipynb.
+
+# %% auto 0
+__all__ = ['mva', 'orient', 'batch_mva', 'sliding_mva', 'rolling_mva']
+
+# %% ../../../../nbs/data_structure/timeseries/mva.ipynb 1
+import numpy as np
+import polars as pl
+from datetime import timedelta
+
+# %% ../../../../nbs/data_structure/timeseries/mva.ipynb 2
+PAIRS = np.array([(0, 0), (0, 1), (0, 2), (1, 1), (1, 2), (2, 2)])
+PAIR_INDEX = np.array([[0, 1, 2], [1, 3, 4], [2, 4, 5]])  # (i, j) -> index in `PAIRS`
+
+
+def cumsum0(x: np.ndarray):
+    """Cumulative sum along the last axis, starting with zero"""
+    out = np.zeros(
+        (*x.shape[:-1], x.shape[-1] + 1), dtype=np.result_type(x, np.float64)
+    )
+    np.cumsum(x, axis=-1, out=out[..., 1:])
+    return out
+
+
+def window_covariance(B: np.ndarray, lo: np.ndarray, hi: np.ndarray):
+    """Sample counts and covariance matrices of `B` over the windows `[lo, hi)`, ignoring non-finite samples"""
+    # components first, so that cumulative sums run over contiguous memory
+    X = np.array(B.T, dtype=np.float64, order="C")
+    valid = np.isfinite(X).all(axis=0)
+    # centre the block to limit the cancellation of the cumulative sums
+    if valid.all():
+        X -= X.mean(axis=1, keepdims=True)
+    else:
+        if valid.any():
+            X -= X[:, valid].mean(axis=1, keepdims=True)
+        X[:, ~valid] = 0.0
+
+    N = cumsum0(valid)
+    S1 = cumsum0(X)
+    S2 = cumsum0(X[PAIRS[:, 0]] * X[PAIRS[:, 1]])
+
+    counts = (N[hi] - N[lo]).astype(np.int64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = (S1[:, hi] - S1[:, lo]) / counts
+        cov = (S2[:, hi] - S2[:, lo]) / counts - mean[PAIRS[:, 0]] * mean[PAIRS[:, 1]]
+    return counts, cov.T[:, PAIR_INDEX]
+
+
+def blocks(lo: np.ndarray, reach: np.ndarray, chunk: int):
+    """Consecutive ranges of windows spanning at most `chunk` samples (or a single window)
+
+    `reach` is the running maximum of the window ends.
+    """
+    j0 = 0
+    while j0 < len(lo):
+        j1 = max(np.searchsorted(reach, lo[j0] + chunk, side="right"), j0 + 1)
+        yield j0, j1
+        j0 = j1
+
+# %% ../../../../nbs/data_structure/timeseries/mva.ipynb 3
+def mva(B: np.ndarray):
+    """Eigenvalues (decreasing) and eigenvectors (columns) of the covariance matrix of `B` (n, 3)"""
+    B = B[np.isfinite(B).all(axis=1)]
+    cov = (B - B.mean(axis=0)).T @ (B - B.mean(axis=0)) / len(B)
+    return orient(*np.linalg.eigh(cov))
+
+
+def orient(eigvals: np.ndarray, eigvecs: np.ndarray):
+    """Sort eigen pairs by decreasing eigenvalue and make the eigenvector frame right-handed"""
+    eigvals = eigvals[..., ::-1]
+    eigvecs = eigvecs[..., ::-1].copy()
+    eigvecs[..., 2] *= np.sign(np.linalg.det(eigvecs))[..., None]
+    return eigvals, eigvecs
+
+
+def batch_mva(
+    B: np.ndarray,  # (n, 3) magnetic field
+    lo: np.ndarray,  # first sample of each window, non-decreasing
+    hi: np.ndarray,  # end (exclusive) of each window
+    min_count: int = 3,  # windows with fewer valid samples are NaN
+    chunk: int = 2**22,  # maximum number of samples per block of windows
+):
+    """MVA of `B` over the windows `[lo, hi)`
+
+    Returns the number of valid samples, the eigenvalues (m, 3) sorted by decreasing value, and the eigenvectors (m, 3, 3), as columns, of each window.
+    """
+    B = np.asarray(B, dtype=np.float64)
+    lo, hi = np.asarray(lo), np.asarray(hi)
+    m = len(lo)
+    counts = np.zeros(m, dtype=np.int64)
+    cov = np.empty((m, 3, 3))
+
+    # blocks bound the memory of the cumulative sums and their magnitude
+    reach = np.maximum.accumulate(hi) if m else hi
+    for j0, j1 in blocks(lo, reach, chunk):
+        start, stop = lo[j0], reach[j1 - 1]
+        counts[j0:j1], cov[j0:j1] = window_covariance(
+            B[start:stop], lo[j0:j1] - start, hi[j0:j1] - start
+        )
+
+    ok = counts >= min_count
+    eigvals = np.full((m, 3), np.nan)
+    eigvecs = np.full((m, 3, 3), np.nan)
+    eigvals[ok], eigvecs[ok] = orient(*np.linalg.eigh(cov[ok]))
+    return counts, eigvals, eigvecs
+
+
+def sliding_mva(
+    B: np.ndarray,
+    window: int,  # window length in samples
+    step: int = 1,  # step between windows in samples
+    **kwargs,
+):
+    """MVA of `B` over windows of `window` samples every `step` samples"""
+    lo = np.arange(0, len(B) - window + 1, step)
+    return batch_mva(B, lo, lo + window, **kwargs)
+
+# %% ../../../../nbs/data_structure/timeseries/mva.ipynb 4
+def rolling_mva(
+    df: pl.DataFrame,
+    window: timedelta,
+    every: timedelta,
+    cols: list[str] = None,  # field components, defaults to all columns but `time`
+    time="time",
+    **kwargs,
+) -> pl.DataFrame:
+    """MVA over windows of duration `window` starting every `every`, for time-sorted `df`
+
+    Windows are labelled by their start time; trailing windows running past the last sample are dropped. `lambda1` to `lambda3` are the maximum, intermediate and minimum variances, and `e1` to `e3` the corresponding directions.
+    """
+    cols = cols or [c for c in df.columns if c != time]
+    t = df[time].to_numpy()
+    B = df.select(cols).to_numpy()
+
+    window, every = np.timedelta64(window), np.timedelta64(every)
+    if len(t):
+        starts = np.arange(t[0], t[-1], every)
+        # windows are `[start, start + window)`, the data end one sampling interval after the last sample
+        end = t[-1] + (np.median(np.diff(t)) if len(t) > 1 else 0)
+        starts = starts[starts + window <= end]  # drop truncated trailing windows
+    else:
+        starts = t[:0]
+    lo = np.searchsorted(t, starts, side="left")
+    hi = np.searchsorted(t, starts + window, side="left")
+
+    counts, eigvals, eigvecs = batch_mva(B, lo, hi, **kwargs)
+    vector = pl.Array(pl.Float64, 3)
+    return pl.DataFrame(
+        {
+            time: pl.Series(starts).cast(df.schema[time]),
+            "count": counts,
+            **{f"lambda{i + 1}": eigvals[:, i] for i in range(3)},
+            **{
+                f"e{i + 1}": pl.Series(eigvecs[:, :, i], dtype=vector) for i in range(3)
+            },
+        }
+    )
@@ -5,10 +5,14 @@ __all__ = ['DEFAULT_XFORMATTER', 'format_time_axis', 'hide_xaxis_labels', 'polis
            'broadcast', 'standardize_to_matrix', 'tsplot']
 
 # %% ../../../../nbs/data_structure/timeseries/plot.ipynb 0
-from xarray import DataArray
-import holoviews as hv
+from typing import TYPE_CHECKING
 import matplotlib.dates as mdates
-import hvplot.xarray  # noqa
+from ...utils.imports import lazy_import
+
+_hv = lazy_import("holoviews")
+if TYPE_CHECKING:
+    import holoviews as hv
+    from xarray import DataArray
 
 # %% ../../../../nbs/data_structure/timeseries/plot.ipynb 1
 DEFAULT_XFORMATTER = mdates.ConciseDateFormatter(
@@ -19,7 +23,7 @@ DEFAULT_XFORMATTER = mdates.ConciseDateFormatter(
 def format_time_axis(layout, xformatter=DEFAULT_XFORMATTER):
     for panel in layout:
         for e in panel:
-            if hv.Store().current_backend == "matplotlib":
+            if _hv.Store().current_backend == "matplotlib":
                 e.opts(xformatter=xformatter)
 
 
@@ -29,9 +33,9 @@ def hide_xaxis_labels(layout):
         panel.opts(xaxis=None)
 
 
-def polish_plot(plots: list[list[hv.Element]]):
-    overlay_plots = [hv.Overlay(plot) for plot in plots]
-    layout = hv.Layout(overlay_plots).cols(1)
+def polish_plot(plots: list[list["hv.Element"]]):
+    overlay_plots = [_hv.Overlay(plot) for plot in plots]
+    layout = _hv.Layout(overlay_plots).cols(1)
     hide_xaxis_labels(layout)
     format_time_axis(layout)
     return layout
@@ -55,7 +59,7 @@ def nested_get(d, keys, default=None):
     return d
 
 
-def format_da_attrs_tplot(da: DataArray):
+def format_da_attrs_tplot(da: "DataArray"):
     """Format attributes for `tplot` DataArray."""
 
     if da.attrs.get("long_name") is None:
@@ -85,8 +89,10 @@ def standardize_to_matrix(lst):
     return [e if isinstance(e, list) else [e] for e in lst]
 
 
-def _tsplot(data: DataArray):
+def _tsplot(data: "DataArray"):
     """time series plot for xarray dataarray"""
+    import hvplot.xarray  # noqa: F401, registers the `hvplot` accessor
+
     data = format_da_attrs_tplot(data)
     by = next(x for x in data.dims if x != "time") if len(data.dims) > 1 else None
     labels = data.attrs.get("long_name")
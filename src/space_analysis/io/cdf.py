@@ -1,12 +1,16 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/io/30_cdf.ipynb.
 
 # %% auto 0
-__all__ = ['inspect_cdf', 'cdf2pl']
+__all__ = ['inspect_cdf', 'cdf2pl', 'read_cdfs', 'cdf_schema', 'scan_cdf']
 
 # %% ../../../nbs/io/30_cdf.ipynb 1
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
 import pycdfpp
 import numpy as np
 import polars as pl
+from polars.io.plugins import register_io_source
 from typing import Literal
 
 # %% ../../../nbs/io/30_cdf.ipynb 2
@@ -25,6 +29,84 @@ def inspect_cdf(
     return vars
 
 # %% ../../../nbs/io/30_cdf.ipynb 3
+CDF_DTYPES = {
+    pycdfpp.DataType.CDF_BYTE: pl.Int8,
+    pycdfpp.DataType.CDF_INT1: pl.Int8,
+    pycdfpp.DataType.CDF_INT2: pl.Int16,
+    pycdfpp.DataType.CDF_INT4: pl.Int32,
+    pycdfpp.DataType.CDF_INT8: pl.Int64,
+    pycdfpp.DataType.CDF_UINT1: pl.UInt8,
+    pycdfpp.DataType.CDF_UINT2: pl.UInt16,
+    pycdfpp.DataType.CDF_UINT4: pl.UInt32,
+    pycdfpp.DataType.CDF_FLOAT: pl.Float32,
+    pycdfpp.DataType.CDF_REAL4: pl.Float32,
+    pycdfpp.DataType.CDF_DOUBLE: pl.Float64,
+    pycdfpp.DataType.CDF_REAL8: pl.Float64,
+}
+
+
+def var_columns(var_name: str, var: pycdfpp.Variable) -> list[str]:
+    """Column names of a variable once flattened into a dataframe."""
+    if len(var.shape) == 1:  # One-dimensional data
+        return [var_name]
+    # labels = cdf[var_attrs["LABL_PTR_1"][0]].values
+    return [f"{var_name}_{i}" for i in range(var.shape[1])]
+
+
+def record_bounds(epoch: np.ndarray, time_range=None) -> slice:
+    """Slice of the records of the sorted `epoch` within `time_range` (both ends included)."""
+    if time_range is None:
+        return slice(None)
+    # also accept `pyspedas` style time strings, like "2021-01-01/00:00:00"
+    start, stop = (
+        np.datetime64(t.replace("/", "T") if isinstance(t, str) else t, "ns")
+        for t in time_range
+    )
+    return slice(
+        np.searchsorted(epoch, start, side="left"),
+        np.searchsorted(epoch, stop, side="right"),
+    )
+
+
+def read_cdf(
+    file_path: str,
+    var_names: list[str],
+    time_range=None,
+    columns: list[str] = None,
+) -> pl.DataFrame:
+    """Read the records of `var_names` within `time_range`, decoding only the variables needed for `columns`."""
+    # variables are loaded lazily by `pycdfpp`, so skipped variables are never decoded
+    cdf = pycdfpp.load(file_path)
+    epoch_var = cdf[var_names[0]].attributes["DEPEND_0"][0]
+    epoch_time = pycdfpp.to_datetime64(cdf[epoch_var])
+    records = record_bounds(epoch_time, time_range)
+
+    data = {"time": epoch_time[records]}
+
+    for var_name in var_names:
+        var = cdf[var_name]
+        var_cols = var_columns(var_name, var)
+        if columns is not None and not set(var_cols) & set(columns):
+            continue
+
+        var_values = var.values[records]
+        var_attrs = var.attributes
+
+        # Handle FILLVAL
+        if "FILLVAL" in var_attrs:
+            fillval = var_attrs["FILLVAL"].value[0]
+            var_values[var_values == fillval] = np.nan
+
+        if len(var_values.shape) == 1:
+            data[var_name] = var_values
+        else:
+            for i, col in enumerate(var_cols):
+                data[col] = var_values[:, i]
+
+    df = pl.DataFrame(data).fill_nan(None)
+    return df if columns is None else df.select(columns)
+
+# %% ../../../nbs/io/30_cdf.ipynb 4
 def cdf2pl(
     file_path: str,  # The path to the CDF file.
     var_names: str
@@ -32,37 +114,103 @@ def cdf2pl(
 ) -> pl.LazyFrame:  # A lazy dataframe containing the requested data.
     """
     Convert a CDF file to Polars Dataframe.
+
+    Notes: the whole file is read eagerly, see `scan_cdf` for a lazy reader.
     """
 
     # Ensure var_names is always a list
     if isinstance(var_names, str):
         var_names = [var_names]
 
-    cdf = pycdfpp.load(file_path)
-    epoch_var = cdf[var_names[0]].attributes["DEPEND_0"][0]
-    epoch_time = pycdfpp.to_datetime64(cdf[epoch_var])
+    return read_cdf(file_path, var_names).lazy()
 
-    columns = {"time": epoch_time}
+# %% ../../../nbs/io/30_cdf.ipynb 5
+def read_cdfs(
+    files: list[str],  # The paths to the CDF files.
+    var_names: str
+    | list[str],  # The name(s) of the variable(s) to retrieve from the CDF files.
+    time_range: list = None,  # Only records within `[start, stop]` are kept.
+    columns: list[str] = None,  # Only these columns are kept.
+    max_workers: int = None,  # The number of files decoded concurrently.
+    executor: type[Executor] = ThreadPoolExecutor,
+) -> pl.LazyFrame:
+    """
+    Decode CDF files in parallel and concatenate them in time order.
+
+    Each file is filtered and projected before the concatenation, and the per-file chunks are kept as they are (no rechunk).
+    """
 
+    if isinstance(var_names, str):
+        var_names = [var_names]
+    if not files:
+        raise ValueError("No CDF files to read")
+
+    func = partial(
+        read_cdf, var_names=var_names, time_range=time_range, columns=columns
+    )
+    with executor(max_workers) as pool:
+        dfs = list(pool.map(func, files))
+
+    non_empty = [df for df in dfs if not df.is_empty()]
+    if not non_empty:
+        return dfs[0].lazy()
+    non_empty.sort(key=lambda df: df["time"].min())
+    return pl.concat(non_empty, rechunk=False).lazy()
+
+# %% ../../../nbs/io/30_cdf.ipynb 7
+def cdf_schema(
+    file_path: str,
+    var_names: list[str],
+) -> dict[str, pl.DataType]:
+    """Schema of the dataframe built from `var_names`, read from the metadata only."""
+    cdf = pycdfpp.load(file_path)
+    schema = {"time": pl.Datetime("ns")}
     for var_name in var_names:
         var = cdf[var_name]
-        var_values = var.values
-        var_attrs = var.attributes
+        dtype = CDF_DTYPES.get(var.type, pl.Float64)
+        schema.update({col: dtype for col in var_columns(var_name, var)})
+    return schema
 
-        # Handle FILLVAL
-        if "FILLVAL" in var_attrs:
-            fillval = var_attrs["FILLVAL"].value[0]
-            var_values[var_values == fillval] = np.nan
-
-        if len(var_values.shape) == 1:  # One-dimensional data
-            columns[var_name] = var_values
-        else:  # Multi-dimensional data
-            # Dynamically create column names based on the shape of the field values
 
-            # labels = cdf[var_attrs["LABL_PTR_1"][0]].values
+def scan_cdf(
+    paths: str | list[str],  # The path(s) to the CDF file(s), in time order.
+    var_names: str
+    | list[str],  # The name(s) of the variable(s) to retrieve from the CDF files.
+    time_range: list = None,  # Only records within `[start, stop]` are read.
+) -> pl.LazyFrame:  # A lazy dataframe supporting projection and predicate pushdown.
+    """
+    Lazily scan CDF file(s) into a Polars LazyFrame.
+    """
 
-            for i in range(var_values.shape[1]):
-                columns[f"{var_name}_{i}"] = var_values[:, i]
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    if isinstance(var_names, str):
+        var_names = [var_names]
 
-    df = pl.DataFrame(columns).fill_nan(None).lazy()
-    return df
+    schema = cdf_schema(paths[0], var_names)
+
+    def source(
+        with_columns: list[str] | None,
+        predicate: pl.Expr | None,
+        n_rows: int | None,
+        batch_size: int | None,
+    ):
+        columns = with_columns
+        if columns is not None and predicate is not None:
+            columns = list(dict.fromkeys(columns + predicate.meta.root_names()))
+
+        n_read = 0
+        for path in paths:
+            df = read_cdf(path, var_names, time_range, columns)
+            if predicate is not None:
+                df = df.filter(predicate)
+            if with_columns is not None:
+                df = df.select(with_columns)
+            if n_rows is not None:
+                df = df.head(n_rows - n_read)
+            n_read += df.height
+            yield df
+            if n_rows is not None and n_read >= n_rows:
+                break
+
+    return register_io_source(source, schema=schema)
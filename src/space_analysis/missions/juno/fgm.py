@@ -1,18 +1,25 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../../../nbs/missions/juno/fgm.ipynb.
 
 # %% auto 0
-__all__ = ['JunoPhases', 'JunoFGMCoords', 'JunoFGMTimeResolutions', 'PDS_URL_FMT', 'load_jno_lbl', 'unpack_and_convert',
-           'UnpackConvert', 'download_data']
+__all__ = ['JunoPhases', 'JunoFGMCoords', 'JunoFGMTimeResolutions', 'JUNO_FGM_DIR', 'PDS_URL_FMT', 'jno_table', 'load_jno_lbl',
+           'unpack_and_convert', 'UnpackConvert', 'default_processor', 'download_data', 'download_many', 'juno_fgm_dir',
+           'scan_juno_fgm']
 
 # %% ../../../../nbs/missions/juno/fgm.ipynb 2
 import os
+import re
 import polars as pl
+from pathlib import Path
+from datetime import timedelta
 from zipfile import ZipFile
+from concurrent.futures import Executor, ThreadPoolExecutor
 import pooch
 from pooch.processors import Unzip
 
 from pipe import filter
-from ...utils.lbl import load_lbl
+from ...utils.lbl import parse_label, read_lbl, read_table
+from ...utils.cache import DEFAULT_CACHE_DIR, tmp_suffix, to_datetime
+from ...utils.pds import fetch_urls
 
 from typing import Literal, Callable
 from functools import partial
@@ -23,33 +30,72 @@ JunoPhases = Literal["CRUISE", "JUPITER"]
 JunoFGMCoords = Literal["SE", "SS", "PL"]
 JunoFGMTimeResolutions = Literal["1SEC", "1MIN", "FULL"]
 
+JUNO_FGM_DIR = DEFAULT_CACHE_DIR / "juno" / "fgm"
+"""Root of the partitioned Parquet dataset"""
+
 # %% ../../../../nbs/missions/juno/fgm.ipynb 6
+ROW_GROUP_SIZE = 2**17
+
+
+def member_output(member: str, extract_dir, fmt="arrow", partition=False):
+    """Output path of the converted `member`, under `year=YYYY/doy=DDD` hive partitions if `partition`"""
+    if not partition:
+        return os.path.join(extract_dir, f"{os.path.splitext(member)[0]}.{fmt}")
+    stem = Path(member).stem
+    year, doy = re.search(r"_(\d{4})(\d{3})", stem).groups()
+    return os.path.join(
+        extract_dir, f"year={int(year)}", f"doy={int(doy)}", f"{stem}.{fmt}"
+    )
+
+
+def is_up_to_date(output_fp: str, fname: str):
+    """Whether `output_fp` exists and is newer than the archive `fname`"""
+    return os.path.exists(output_fp) and os.path.getmtime(
+        output_fp
+    ) >= os.path.getmtime(fname)
+
+
 def unzip_convert_lbl(
-    member: str, fname: str, extract_dir, load_func: Callable, clean=True, fmt="arrow"
+    member: str,
+    fname: str,
+    extract_dir,
+    load_func: Callable,
+    fmt="arrow",
+    partition=False,
 ):
-    with ZipFile(fname, "r") as zip_file:
-        lbl_fp = zip_file.extract(member, path=extract_dir)
-        sts_fp = zip_file.extract(member.replace(".lbl", ".sts"), path=extract_dir)
+    output_fp = member_output(member, extract_dir, fmt, partition)
+    if is_up_to_date(output_fp, fname):
+        return output_fp
 
-        # Convert the file to a different format
-        df = load_func(lbl_fp).collect()
-        output_fp = lbl_fp.replace("lbl", fmt)
-        df.write_ipc(output_fp)
+    # Stream the label and the table from the archive, without extracting them
+    with ZipFile(fname, "r") as zip_file:
+        label = parse_label(zip_file.read(member).decode(errors="replace"))
+        data = zip_file.read(member.replace(".lbl", ".sts"))
 
-        # Remove the lbl and sts files
-        if clean:
-            os.remove(lbl_fp)
-            os.remove(sts_fp)
+    # Convert the file to a different format, replacing the output atomically
+    df = load_func(read_table(label, data)).collect()
+    os.makedirs(os.path.dirname(output_fp), exist_ok=True)
+    tmp_fp = f"{output_fp}.{tmp_suffix()}"
+    if fmt == "parquet":
+        df.write_parquet(tmp_fp, statistics=True, row_group_size=ROW_GROUP_SIZE)
+    else:
+        df.write_ipc(tmp_fp)
+    os.replace(tmp_fp, output_fp)
 
-        return output_fp
+    return output_fp
 
 # %% ../../../../nbs/missions/juno/fgm.ipynb 7
-def load_jno_lbl(file: str):
-    df: pl.DataFrame = pl.from_dataframe(load_lbl(file))
+def jno_table(df: pl.DataFrame | pl.LazyFrame) -> pl.LazyFrame:
+    """Derive the time of a Juno FGM table and drop the unused columns"""
+    df = df.lazy()
+    utc = pl.col("SAMPLE UTC")
+    if df.collect_schema()["SAMPLE UTC"].is_temporal():
+        year = utc.dt.truncate("1y")
+    else:
+        year = utc.str.slice(0, 4).str.to_datetime("%Y")
     return (
-        df.lazy()
-        .with_columns(
-            time=pl.col("SAMPLE UTC").str.slice(0, 4).str.to_datetime("%Y")
+        df.with_columns(
+            time=year
             + pl.duration(
                 milliseconds=(pl.col("DECIMAL DAY") - 1) * 24 * 60 * 60 * 1000
             )
@@ -59,14 +105,29 @@ def load_jno_lbl(file: str):
     )
 
 
-def unpack_and_convert(fname, extract_dir, process_func=unzip_convert_lbl):
+def load_jno_lbl(file: str):
+    return jno_table(read_lbl(file))
+
+
+def unpack_and_convert(
+    fname,
+    extract_dir,
+    process_func=unzip_convert_lbl,
+    max_workers: int = None,
+    executor: Executor = None,  # shared pool, used instead of a pool of `max_workers`
+    **kwargs,  # passed to `process_func`, like `fmt` and `partition`
+):
     """
     Post-processing hook to unzip a file and convert it to a different format in real-time. (Otherwise the files unzipped would take up too much space on the user's computer.)
 
+    Members are converted in parallel across a thread pool (decoding and writing with Polars release the GIL, and threads are safe with Polars' own thread pool, unlike forked processes); those whose output is newer than the archive are skipped.
+
     Parameters
     ----------
     fname : str
        Full path of the zipped file in local storage
+    max_workers : int
+       Number of threads, at most this many members are decoded in memory at the same time
 
     """
 
@@ -75,31 +136,76 @@ def unpack_and_convert(fname, extract_dir, process_func=unzip_convert_lbl):
         members = list(zip_file.namelist() | filter(lambda x: x.endswith(".lbl")))
 
     func = partial(
-        process_func, fname=fname, extract_dir=extract_dir, load_func=load_jno_lbl
+        process_func,
+        fname=fname,
+        extract_dir=extract_dir,
+        load_func=jno_table,
+        **kwargs,
     )
-    futures = list(map(func, members))
-
-    return futures
+    if executor is not None:
+        return list(executor.map(func, members))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(func, members))
 
 
 class UnpackConvert(Unzip):
     old_fmt = "lbl"
     new_fmt = "arrow"
+    partition = False  # write `year=YYYY/doy=DDD` hive partitions
+    max_workers: int = None  # number of threads used for the conversion
+    executor: Executor = None  # shared conversion pool, see `download_many`
+
+    def __init__(
+        self,
+        members=None,
+        extract_dir=None,
+        new_fmt: str = None,
+        partition: bool = None,
+        max_workers: int = None,
+        executor: Executor = None,
+    ):
+        super().__init__(members=members, extract_dir=extract_dir)
+        self.new_fmt = new_fmt or self.new_fmt
+        self.partition = partition or self.partition
+        self.max_workers = max_workers or self.max_workers
+        self.executor = executor or self.executor
 
     def _extract_file(self, fname, extract_dir):
-        unpack_and_convert(fname, extract_dir)
+        unpack_and_convert(
+            fname,
+            extract_dir,
+            max_workers=self.max_workers,
+            executor=self.executor,
+            fmt=self.new_fmt,
+            partition=self.partition,
+        )
 
     def _all_members(self, fname):
         """Return all members from a given archive."""
         with ZipFile(fname, "r") as zip_file:
             files = zip_file.namelist()
             oldfiles = [f for f in files if f.endswith(self.old_fmt)]
-            return [f.replace(self.old_fmt, self.new_fmt) for f in oldfiles]
+            return [
+                member_output(f, "", self.new_fmt, self.partition) for f in oldfiles
+            ]
 
 # %% ../../../../nbs/missions/juno/fgm.ipynb 8
 PDS_URL_FMT = "https://pds-ppi.igpp.ucla.edu/ditdos/download?id=pds://PPI/{dataset}/DATA/{phase}/{coord}/{datatype}"
 
 
+def default_processor(
+    coord, datatype, fmt="arrow", root=JUNO_FGM_DIR, executor: Executor = None
+):
+    if fmt == "parquet":
+        return UnpackConvert(
+            extract_dir=str(juno_fgm_dir(root, coord, datatype)),
+            new_fmt=fmt,
+            partition=True,
+            executor=executor,
+        )
+    return UnpackConvert(executor=executor)
+
+
 def download_data(
     dataset="JNO-SS-3-FGM-CAL-V1.0",
     phase: JunoPhases = "CRUISE",
@@ -107,12 +213,14 @@ def download_data(
     datatype: JunoFGMTimeResolutions = "1SEC",  # time resolution
     processor: Callable = None,
     url_fmt=PDS_URL_FMT,
-    fmt="arrow",
+    fmt="arrow",  # "parquet" writes into the partitioned dataset under `root`
+    root=JUNO_FGM_DIR,  # root of the partitioned dataset, see `scan_juno_fgm`
 ) -> list[str]:
     url = url_fmt.format(dataset=dataset, phase=phase, coord=coord, datatype=datatype)
 
     if processor is None:
-        processor = UnpackConvert()  # default processor, needed to be created here!!!
+        # default processor, needed to be created here!!!
+        processor = default_processor(coord, datatype, fmt, root)
 
     files = pooch.retrieve(
         url=url,
@@ -122,3 +230,56 @@ def download_data(
     )
 
     return sorted(files | filter(lambda x: x.endswith(f".{fmt}")))
+
+
+def download_many(
+    targets: list[tuple | dict],  # `(dataset, phase, coord, datatype)` of each archive
+    fmt="parquet",
+    root=JUNO_FGM_DIR,
+    path=None,  # download directory, defaults to the one of `pooch.retrieve`
+    max_workers: int = 4,  # maximum number of concurrent downloads
+    url_fmt=PDS_URL_FMT,
+    convert_workers: int = None,  # threads converting the members of all the archives
+) -> list[str]:
+    """Download and convert several archives concurrently, resuming partial downloads
+
+    The archives share a single conversion pool, so that concurrent downloads do not multiply the workers.
+    """
+    keys = ("dataset", "phase", "coord", "datatype")
+    targets = [t if isinstance(t, dict) else dict(zip(keys, t)) for t in targets]
+    urls = [url_fmt.format(**t) for t in targets]
+    with ThreadPoolExecutor(max_workers=convert_workers) as executor:
+        processors = [
+            default_processor(t["coord"], t["datatype"], fmt, root, executor)
+            for t in targets
+        ]
+        results = fetch_urls(urls, path, processors, max_workers=max_workers)
+    files = {f for files in results for f in files if f.endswith(f".{fmt}")}
+    return sorted(files)
+
+# %% ../../../../nbs/missions/juno/fgm.ipynb 10
+def juno_fgm_dir(root=JUNO_FGM_DIR, coord="SE", datatype="1SEC") -> Path:
+    return Path(root) / f"coord={coord}" / f"datatype={datatype}"
+
+
+def scan_juno_fgm(
+    time_range: list,
+    coord: JunoFGMCoords = "SE",
+    datatype: JunoFGMTimeResolutions = "1SEC",
+    root=JUNO_FGM_DIR,
+) -> pl.LazyFrame:
+    """Scan the partitioned Juno FGM dataset within `time_range`"""
+    start, stop = (to_datetime(t) for t in time_range)
+    source = juno_fgm_dir(root, coord, datatype) / "**" / "*.parquet"
+    ldf = pl.scan_parquet(source, hive_partitioning=True)
+
+    # a file may extend slightly past the end of its day
+    first, last = start - timedelta(days=1), stop
+    day = pl.col("year") * 1000 + pl.col("doy")
+    return ldf.filter(
+        day.is_between(
+            first.year * 1000 + first.timetuple().tm_yday,
+            last.year * 1000 + last.timetuple().tm_yday,
+        ),
+        pl.col("time").is_between(start, stop, closed="left"),
+    ).drop("coord", "datatype", "year", "doy")
@@ -4,19 +4,23 @@
 __all__ = ['download_data', 'load_data']
 
 # %% ../../../../nbs/missions/wind/mag.ipynb 1
-import polars as pl
-from ...io.cdf import cdf2pl
-import pyspedas
+from ...io.cdf import read_cdfs
+from ...utils.imports import lazy_import
 
-from functools import partial
+_pyspedas = lazy_import("pyspedas")
 
 # %% ../../../../nbs/missions/wind/mag.ipynb 2
 def download_data(**kwargs):
-    return pyspedas.psp.fields(downloadonly=True, **kwargs)
+    return _pyspedas.psp.fields(downloadonly=True, **kwargs)
 
 # %% ../../../../nbs/missions/wind/mag.ipynb 3
-def load_data(var_names="psp_fld_l2_mag_RTN", **kwargs):
+def load_data(
+    var_names="psp_fld_l2_mag_RTN",
+    max_workers: int = None,  # The number of files decoded concurrently.
+    **kwargs,
+):
     files = download_data(**kwargs)
-    load_func = partial(cdf2pl, var_names=var_names)
 
-    return pl.concat(load_func(file) for file in files)
+    return read_cdfs(
+        files, var_names, time_range=kwargs.get("trange"), max_workers=max_workers
+    )
@@ -4,16 +4,16 @@
 __all__ = ['DataVars', 'DataTypes', 'download_data', 'load_data']
 
 # %% ../../../../nbs/missions/wind/plasma.ipynb 1
-import polars as pl
-from ...io.cdf import cdf2pl
-import pyspedas
+from ...io.cdf import read_cdfs
+from ...utils.imports import lazy_import
 
-from functools import partial
 from typing import Literal
 
+_pyspedas = lazy_import("pyspedas")
+
 # %% ../../../../nbs/missions/wind/plasma.ipynb 2
 def download_data(**kwargs):
-    return pyspedas.wind.swe(downloadonly=True, **kwargs)
+    return _pyspedas.wind.swe(downloadonly=True, **kwargs)
 
 # %% ../../../../nbs/missions/wind/plasma.ipynb 3
 DataVars = Literal[
@@ -30,10 +30,11 @@ DataTypes = Literal["k0", "h0", "h5"]
 def load_data(
     var_names: list[DataVars] = ["Np", "V_GSE", "THERMAL_SPD"],
     datatype: DataTypes = "k0",
+    max_workers: int = None,  # The number of files decoded concurrently.
     **kwargs,
 ):
     files = download_data(datatype=datatype, **kwargs)
 
-    load_func = partial(cdf2pl, var_names=var_names)
-
-    return pl.concat(load_func(file) for file in files)
+    return read_cdfs(
+        files, var_names, time_range=kwargs.get("trange"), max_workers=max_workers
+    )
@@ -2,16 +2,21 @@
 
 # %% auto 0
 __all__ = ['DEFAULT_B_UNIT', 'DEFAULT_N_UNIT', 'DEFAULT_SPEED_UNIT', 'DEFAULT_LENGTH_UNIT', 'DEFAULT_CURRENT_UNIT',
-           'DEFAULT_PARTICLE', 'DEFAULT_B_TIME_GRADIENT_UNIT', 'np_Alfven_speed', 'np_Alfven_current',
-           'np_inertial_length', 'np_gradient_current']
+           'DEFAULT_PARTICLE', 'DEFAULT_B_TIME_GRADIENT_UNIT', 'fast_Alfven_speed', 'fast_Alfven_current',
+           'fast_inertial_length', 'fast_gradient_current', 'fast_beta', 'np_Alfven_speed', 'np_Alfven_current',
+           'np_inertial_length', 'np_gradient_current', 'np_beta']
 
 # %% ../../../../nbs/plasma/00_formulary_numpy.ipynb 1
 import numpy as np
 import astropy.units as u
-from astropy.constants import mu0, e
-from plasmapy.particles import ParticleLike
-from plasmapy.formulary import Alfven_speed
-from plasmapy.formulary.lengths import inertial_length
+from astropy.constants import mu0, e, c, eps0, m_e
+from functools import cache
+from typing import TYPE_CHECKING
+from ...utils.imports import lazy_import
+
+_plasmapy = lazy_import("plasmapy")
+if TYPE_CHECKING:
+    from plasmapy.particles import ParticleLike
 
 DEFAULT_B_UNIT = u.nT
 DEFAULT_N_UNIT = u.cm**-3
@@ -22,20 +27,127 @@ DEFAULT_PARTICLE = "p+"
 
 DEFAULT_B_TIME_GRADIENT_UNIT = DEFAULT_B_UNIT / u.s
 
-# %% ../../../../nbs/plasma/00_formulary_numpy.ipynb 2
+# %% ../../../../nbs/plasma/00_formulary_numpy.ipynb 3
+@cache
+def Alfven_speed_factor(ion, B_unit, n_unit, speed_unit) -> float:
+    ion = _plasmapy.particles.Particle(ion)
+    mass = ion.mass + ion.charge_number * m_e
+    return (B_unit / np.sqrt(mu0 * n_unit * mass)).to(speed_unit).value
+
+
+@cache
+def Alfven_current_factor(speed_unit, n_unit, current_unit) -> float:
+    return (e.si * speed_unit * n_unit).to(current_unit).value
+
+
+@cache
+def inertial_length_factor(ion, n_unit, length_unit) -> float:
+    ion = _plasmapy.particles.Particle(ion)
+    return (
+        (c / np.sqrt(n_unit * ion.charge**2 / (eps0 * ion.mass))).to(length_unit).value
+    )
+
+
+@cache
+def gradient_current_factor(B_gradient_unit, speed_unit, current_unit) -> float:
+    return (B_gradient_unit / speed_unit / mu0).to(current_unit).value
+
+
+@cache
+def beta_factor(T_unit, n_unit, B_unit) -> float:
+    energy = (1 * T_unit).to(u.J, equivalencies=u.temperature_energy())
+    return (2 * mu0 * n_unit * energy / B_unit**2).to(u.dimensionless_unscaled).value
+
+# %% ../../../../nbs/plasma/00_formulary_numpy.ipynb 4
+def fast_Alfven_speed(
+    B: np.ndarray,
+    density: np.ndarray,
+    ion: "ParticleLike" = DEFAULT_PARTICLE,
+    sign=True,
+    B_unit: u.Unit = DEFAULT_B_UNIT,
+    n_unit: u.Unit = DEFAULT_N_UNIT,
+    speed_unit: u.Unit = DEFAULT_SPEED_UNIT,
+    out: np.ndarray = None,
+) -> np.ndarray:
+    out = np.sqrt(density, out=out)
+    np.divide(B, out, out=out)
+    if not sign:
+        np.abs(out, out=out)
+    out *= Alfven_speed_factor(ion, B_unit, n_unit, speed_unit)
+    return out
+
+
+def fast_Alfven_current(
+    Alfven_speed: np.ndarray,
+    density: np.ndarray,
+    speed_unit: u.Unit = DEFAULT_SPEED_UNIT,
+    n_unit: u.Unit = DEFAULT_N_UNIT,
+    current_unit: u.Unit = DEFAULT_CURRENT_UNIT,
+    out: np.ndarray = None,
+) -> np.ndarray:
+    out = np.multiply(Alfven_speed, density, out=out, dtype=np.float64)
+    out *= Alfven_current_factor(speed_unit, n_unit, current_unit)
+    return out
+
+
+def fast_inertial_length(
+    density: np.ndarray,
+    ion: "ParticleLike" = DEFAULT_PARTICLE,
+    n_unit: u.Unit = DEFAULT_N_UNIT,
+    length_unit: u.Unit = DEFAULT_LENGTH_UNIT,
+    out: np.ndarray = None,
+) -> np.ndarray:
+    out = np.sqrt(density, out=out)
+    return np.divide(inertial_length_factor(ion, n_unit, length_unit), out, out=out)
+
+
+def fast_gradient_current(
+    B_gradient: np.ndarray,
+    speed: np.ndarray,
+    B_gradient_unit: u.Unit = DEFAULT_B_TIME_GRADIENT_UNIT,
+    speed_unit: u.Unit = DEFAULT_SPEED_UNIT,
+    current_unit: u.Unit = DEFAULT_CURRENT_UNIT,
+    out: np.ndarray = None,
+) -> np.ndarray:
+    out = np.divide(B_gradient, speed, out=out)
+    out *= gradient_current_factor(B_gradient_unit, speed_unit, current_unit)
+    return out
+
+
+def fast_beta(
+    T: np.ndarray,
+    n: np.ndarray,
+    B: np.ndarray,
+    T_unit: u.Unit = u.eV,
+    n_unit: u.Unit = DEFAULT_N_UNIT,
+    B_unit: u.Unit = DEFAULT_B_UNIT,
+    out: np.ndarray = None,
+) -> np.ndarray:
+    out = np.multiply(T, n, out=out, dtype=np.float64)
+    out *= beta_factor(T_unit, n_unit, B_unit)
+    np.divide(out, B, out=out)
+    return np.divide(out, B, out=out)
+
+# %% ../../../../nbs/plasma/00_formulary_numpy.ipynb 5
 def np_Alfven_speed(
     B: np.ndarray,  # magnetic field in the plasma, could be a component, as plasmapy will take `abs` of it
     density: np.ndarray,  # particle density of the plasma
-    ion: ParticleLike = DEFAULT_PARTICLE,
+    ion: "ParticleLike" = DEFAULT_PARTICLE,
     sign=True,
     B_unit: u.Unit = DEFAULT_B_UNIT,
     n_unit: u.Unit = DEFAULT_N_UNIT,
     speed_unit: u.Unit = DEFAULT_SPEED_UNIT,
+    fast=False,  # use the fast backend, returning a plain array
 ):
+    if fast:
+        return fast_Alfven_speed(B, density, ion, sign, B_unit, n_unit, speed_unit)
+
     B_u = B * B_unit
     density_u = density * n_unit
 
-    Alfven_speed_u = Alfven_speed(B=B_u, density=density_u, ion=ion).to(speed_unit)
+    Alfven_speed_u = _plasmapy.formulary.Alfven_speed(
+        B=B_u, density=density_u, ion=ion
+    ).to(speed_unit)
     # The result is always positive because of the plasmapy
     if sign:
         return np.sign(B_u) * Alfven_speed_u
@@ -49,30 +161,60 @@ def np_Alfven_current(
     speed_unit: u.Unit = DEFAULT_SPEED_UNIT,
     n_unit: u.Unit = DEFAULT_N_UNIT,
     current_unit: u.Unit = DEFAULT_CURRENT_UNIT,
+    fast=False,
 ):
+    if fast:
+        return fast_Alfven_current(
+            Alfven_speed, density, speed_unit, n_unit, current_unit
+        )
+
     Alfven_speed_u = Alfven_speed * speed_unit
     density_u = density * n_unit
     return (e.si * Alfven_speed_u * density_u).to(current_unit)
 
-# %% ../../../../nbs/plasma/00_formulary_numpy.ipynb 3
+# %% ../../../../nbs/plasma/00_formulary_numpy.ipynb 6
 def np_inertial_length(
     density: np.ndarray,
-    ion: ParticleLike = DEFAULT_PARTICLE,
+    ion: "ParticleLike" = DEFAULT_PARTICLE,
     n_unit: u.Unit = DEFAULT_N_UNIT,
     length_unit: u.Unit = DEFAULT_LENGTH_UNIT,
+    fast=False,
 ):
+    if fast:
+        return fast_inertial_length(density, ion, n_unit, length_unit)
+
     density_u = density * n_unit
-    return inertial_length(density_u, ion).to(length_unit)
+    return _plasmapy.formulary.inertial_length(density_u, ion).to(length_unit)
 
-# %% ../../../../nbs/plasma/00_formulary_numpy.ipynb 4
+# %% ../../../../nbs/plasma/00_formulary_numpy.ipynb 7
 def np_gradient_current(
     B_gradient,
     speed,
     B_gradient_unit=DEFAULT_B_TIME_GRADIENT_UNIT,
     speed_unit=DEFAULT_SPEED_UNIT,
     current_unit=DEFAULT_CURRENT_UNIT,
+    fast=False,
 ):
+    if fast:
+        return fast_gradient_current(
+            B_gradient, speed, B_gradient_unit, speed_unit, current_unit
+        )
+
     B_gradient_u = B_gradient * B_gradient_unit
     speed_u = speed * speed_unit
 
     return (B_gradient_u / speed_u / mu0).to(current_unit)
+
+# %% ../../../../nbs/plasma/00_formulary_numpy.ipynb 8
+def np_beta(
+    T: np.ndarray,  # temperature of the plasma
+    n: np.ndarray,  # particle density of the plasma
+    B: np.ndarray,  # magnetic field in the plasma
+    T_unit: u.Unit = u.eV,
+    n_unit: u.Unit = DEFAULT_N_UNIT,
+    B_unit: u.Unit = DEFAULT_B_UNIT,
+    fast=False,
+):
+    if fast:
+        return fast_beta(T, n, B, T_unit, n_unit, B_unit)
+    return _plasmapy.formulary.beta(T=T * T_unit, n=n * n_unit, B=B * B_unit)
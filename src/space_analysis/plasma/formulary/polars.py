@@ -1,24 +1,143 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../../../nbs/plasma/00_formulary_polars.ipynb.
 
 # %% auto 0
-__all__ = ['df_beta', 'df_Alfven_speed', 'ldf_Alfven_speed', 'df_Alfven_current', 'thermal_spd2temp', 'df_thermal_spd2temp',
-           'df_inertial_length', 'df_gradient_current']
+__all__ = ['pl_Alfven_speed', 'pl_Alfven_current', 'pl_inertial_length', 'pl_gradient_current', 'pl_beta', 'pl_thermal_spd2temp',
+           'PlasmaExpr', 'df_beta', 'df_Alfven_speed', 'ldf_Alfven_speed', 'df_Alfven_current', 'thermal_spd2temp',
+           'df_thermal_spd2temp', 'df_inertial_length', 'df_gradient_current']
 
 # %% ../../../../nbs/plasma/00_formulary_polars.ipynb 1
 import astropy.units as u
 from astropy.constants import m_p
-from plasmapy.formulary import beta
+from typing import TYPE_CHECKING
 from space_analysis.plasma.formulary.numpy import (
-    np_Alfven_speed,
-    np_Alfven_current,
-    np_inertial_length,
-    np_gradient_current,
+    DEFAULT_B_UNIT,
+    DEFAULT_N_UNIT,
+    DEFAULT_SPEED_UNIT,
+    DEFAULT_LENGTH_UNIT,
+    DEFAULT_CURRENT_UNIT,
+    DEFAULT_PARTICLE,
+    DEFAULT_B_TIME_GRADIENT_UNIT,
+    Alfven_speed_factor,
+    Alfven_current_factor,
+    inertial_length_factor,
+    gradient_current_factor,
+    beta_factor,
 )
 import polars as pl
 
-# %% ../../../../nbs/plasma/00_formulary_polars.ipynb 2
+if TYPE_CHECKING:
+    from plasmapy.particles import ParticleLike
+
+# %% ../../../../nbs/plasma/00_formulary_polars.ipynb 3
+IntoExpr = str | pl.Expr
+
+
+def col_expr(col: IntoExpr) -> pl.Expr:
+    return pl.col(col) if isinstance(col, str) else col
+
+# %% ../../../../nbs/plasma/00_formulary_polars.ipynb 4
+def pl_Alfven_speed(
+    B: IntoExpr = "B",  # magnetic field in the plasma, could be a component
+    density: IntoExpr = "plasma_density",  # particle density of the plasma
+    ion: "ParticleLike" = DEFAULT_PARTICLE,
+    sign=True,  # keep the sign of `B`
+    B_unit: u.Unit = DEFAULT_B_UNIT,
+    n_unit: u.Unit = DEFAULT_N_UNIT,
+    speed_unit: u.Unit = DEFAULT_SPEED_UNIT,
+) -> pl.Expr:
+    B = col_expr(B)
+    if not sign:
+        B = B.abs()
+    factor = Alfven_speed_factor(ion, B_unit, n_unit, speed_unit)
+    return B / col_expr(density).sqrt() * factor
+
+
+def pl_Alfven_current(
+    Alfven_speed: IntoExpr = "Alfven_speed",
+    density: IntoExpr = "plasma_density",
+    speed_unit: u.Unit = DEFAULT_SPEED_UNIT,
+    n_unit: u.Unit = DEFAULT_N_UNIT,
+    current_unit: u.Unit = DEFAULT_CURRENT_UNIT,
+) -> pl.Expr:
+    factor = Alfven_current_factor(speed_unit, n_unit, current_unit)
+    return col_expr(Alfven_speed) * col_expr(density) * factor
+
+
+def pl_inertial_length(
+    density: IntoExpr = "plasma_density",
+    ion: "ParticleLike" = DEFAULT_PARTICLE,
+    n_unit: u.Unit = DEFAULT_N_UNIT,
+    length_unit: u.Unit = DEFAULT_LENGTH_UNIT,
+) -> pl.Expr:
+    factor = inertial_length_factor(ion, n_unit, length_unit)
+    return factor / col_expr(density).sqrt()
+
+
+def pl_gradient_current(
+    B_gradient: IntoExpr,
+    speed: IntoExpr,
+    B_gradient_unit: u.Unit = DEFAULT_B_TIME_GRADIENT_UNIT,
+    speed_unit: u.Unit = DEFAULT_SPEED_UNIT,
+    current_unit: u.Unit = DEFAULT_CURRENT_UNIT,
+) -> pl.Expr:
+    factor = gradient_current_factor(B_gradient_unit, speed_unit, current_unit)
+    return col_expr(B_gradient) / col_expr(speed) * factor
+
+
+def pl_beta(
+    T: IntoExpr = "T",  # temperature of the plasma
+    n: IntoExpr = "plasma_density",  # particle density of the plasma
+    B: IntoExpr = "B",  # magnetic field in the plasma
+    T_unit: u.Unit = u.eV,
+    n_unit: u.Unit = DEFAULT_N_UNIT,
+    B_unit: u.Unit = DEFAULT_B_UNIT,
+) -> pl.Expr:
+    factor = beta_factor(T_unit, n_unit, B_unit)
+    return col_expr(T) * col_expr(n) / col_expr(B).pow(2) * factor
+
+
+def pl_thermal_spd2temp(
+    speed: IntoExpr,
+    speed_unit: u.Unit = u.km / u.s,
+) -> pl.Expr:
+    factor = (m_p * speed_unit**2 / 2).to("eV").value
+    return col_expr(speed).pow(2) * factor
+
+# %% ../../../../nbs/plasma/00_formulary_polars.ipynb 5
+@pl.api.register_expr_namespace("plasma")
+class PlasmaExpr:
+    """Plasma formulary as a `pl.Expr` namespace, e.g. `pl.col("B").plasma.Alfven_speed("n")`."""
+
+    def __init__(self, expr: pl.Expr):
+        self._expr = expr
+
+    def Alfven_speed(self, density: IntoExpr = "plasma_density", **kwargs):
+        """Alfven speed with the expression as magnetic field."""
+        return pl_Alfven_speed(self._expr, density, **kwargs)
+
+    def Alfven_current(self, density: IntoExpr = "plasma_density", **kwargs):
+        """Alfven current with the expression as Alfven speed."""
+        return pl_Alfven_current(self._expr, density, **kwargs)
+
+    def inertial_length(self, **kwargs):
+        """Inertial length with the expression as density."""
+        return pl_inertial_length(self._expr, **kwargs)
+
+    def gradient_current(self, speed: IntoExpr, **kwargs):
+        """Gradient current with the expression as magnetic field gradient."""
+        return pl_gradient_current(self._expr, speed, **kwargs)
+
+    def beta(self, n: IntoExpr = "plasma_density", B: IntoExpr = "B", **kwargs):
+        """Plasma beta with the expression as temperature."""
+        return pl_beta(self._expr, n, B, **kwargs)
+
+    def thermal_spd2temp(self, **kwargs):
+        """Temperature with the expression as thermal speed."""
+        return pl_thermal_spd2temp(self._expr, **kwargs)
+
+# %% ../../../../nbs/plasma/00_formulary_polars.ipynb 7
 def df_beta(
-    df: pl.DataFrame,
+    df: pl.DataFrame | pl.LazyFrame,
     T: str = "T",  # temperature of the plasma
     n: str = "plasma_density",  # particle density of the plasma
     B: str = "B",  # magnetic field in the plasma,
@@ -26,74 +145,56 @@ def df_beta(
     T_unit: u.Unit = u.eV,
     n_unit: u.Unit = u.cm**-3,
     B_unit: u.Unit = u.nT,
-) -> pl.DataFrame:
-    _T = df[T].to_numpy() * T_unit
-    _n = df[n].to_numpy() * n_unit
-    _B = df[B].to_numpy() * B_unit
-
-    _beta = beta(T=_T, n=_n, B=_B)
-
-    return df.with_columns(pl.Series(_beta).alias(col_name))
+):
+    return df.with_columns(pl_beta(T, n, B, T_unit, n_unit, B_unit).alias(col_name))
 
-# %% ../../../../nbs/plasma/00_formulary_polars.ipynb 3
+# %% ../../../../nbs/plasma/00_formulary_polars.ipynb 8
 def df_Alfven_speed(
-    df: pl.DataFrame,
-    B: str = "B",  # magnetic field in the plasma, could be a component, as plasmapy will take `abs` of it
+    df: pl.DataFrame | pl.LazyFrame,
+    B: str = "B",  # magnetic field in the plasma, could be a component
     density: str = "plasma_density",  # particle density of the plasma
     col_name: str = "Alfven_speed",
     **kwargs,
 ):
-    B_temp = df[B].to_numpy()
-    n_temp = df[density].to_numpy()
-
-    _Alfven_speed = np_Alfven_speed(B=B_temp, density=n_temp, **kwargs)
-    return df.with_columns(pl.Series(_Alfven_speed).alias(col_name))
+    return df.with_columns(pl_Alfven_speed(B, density, **kwargs).alias(col_name))
 
 
 def ldf_Alfven_speed(ldf: pl.LazyFrame, **kwargs):
-    return ldf.collect().pipe(df_Alfven_speed, **kwargs).lazy()
+    return df_Alfven_speed(ldf, **kwargs)
 
 
 def df_Alfven_current(
-    df: pl.DataFrame,
+    df: pl.DataFrame | pl.LazyFrame,
     Alfven_speed="Alfven_speed",
     density="plasma_density",
     col_name: str = "j_Alfven",
     **kwargs,
 ):
-    Alfven_speed_np = df[Alfven_speed].to_numpy()
-    density_np = df[density].to_numpy()
-    result = np_Alfven_current(
-        Alfven_speed=Alfven_speed_np, density=density_np, **kwargs
+    return df.with_columns(
+        pl_Alfven_current(Alfven_speed, density, **kwargs).alias(col_name)
     )
-    return df.with_columns(pl.Series(result).alias(col_name))
 
-# %% ../../../../nbs/plasma/00_formulary_polars.ipynb 4
+# %% ../../../../nbs/plasma/00_formulary_polars.ipynb 9
 def thermal_spd2temp(speed, speed_unit=u.km / u.s):
     return (m_p * (speed * speed_unit) ** 2 / 2).to("eV").value
 
 
 def df_thermal_spd2temp(df: pl.LazyFrame, speed_col, speed_unit=u.km / u.s):
-    df = df.collect()
-    return df.with_columns(
-        plasma_temperature=thermal_spd2temp(df[speed_col].to_numpy(), speed_unit)
-    ).lazy()
+    return df.lazy().with_columns(
+        pl_thermal_spd2temp(speed_col, speed_unit).alias("plasma_temperature")
+    )
 
-# %% ../../../../nbs/plasma/00_formulary_polars.ipynb 5
+# %% ../../../../nbs/plasma/00_formulary_polars.ipynb 10
 def df_inertial_length(
-    df: pl.DataFrame,
+    df: pl.DataFrame | pl.LazyFrame,
     density="plasma_density",
     col_name: str = "ion_inertial_length",
     **kwargs,
 ):
-    density_np = df[density].to_numpy()
-    result = np_inertial_length(density=density_np, **kwargs)
-
-    return df.with_columns(pl.Series(result).alias(col_name))
+    return df.with_columns(pl_inertial_length(density, **kwargs).alias(col_name))
 
-# %% ../../../../nbs/plasma/00_formulary_polars.ipynb 6
+# %% ../../../../nbs/plasma/00_formulary_polars.ipynb 11
 def df_gradient_current(df, B_gradient, speed, col_name, **kwargs):
-    B_gradient_np = df[B_gradient].to_numpy()
-    speed_np = df[speed].to_numpy()
-    result = np_gradient_current(B_gradient=B_gradient_np, speed=speed_np, **kwargs)
-    return df.with_columns(pl.Series(result).alias(col_name))
+    return df.with_columns(
+        pl_gradient_current(B_gradient, speed, **kwargs).alias(col_name)
+    )
@@ -1,50 +1,151 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/plasma/01_mhd_waves.ipynb.
 
 # %% auto 0
-__all__ = ['VpVg_fs']
+__all__ = ['VpVg', 'iter_VpVg', 'VpVg_fs']
 
 # %% ../../../nbs/plasma/01_mhd_waves.ipynb 1
 import numpy as np
-from numpy import cos, sin, sqrt
 
+# %% ../../../nbs/plasma/01_mhd_waves.ipynb 2
+MODES = {"slow": "s", "intermediate": "i", "fast": "f"}
 
-def VpVg_fs(cs, ca, theta=None):
-    """Calculates the phase velocities and group velocities for fast and slow waves."""
+
+def output_keys(modes) -> list[str]:
+    return [
+        k
+        for m in modes
+        for k in (f"Vp{MODES[m]}", f"Vg{MODES[m]}_perp", f"Vg{MODES[m]}_para")
+    ]
+
+
+def angle_grid(theta, dtype):
     if theta is None:
         theta = np.arange(0, 360, 1) * np.pi / 180
+    return np.asarray(theta, dtype=dtype)
+
+
+def magnetosonic(mode: str, terms: dict, result: dict, vp2: np.ndarray):
+    """Write the phase and group velocities of the fast or slow `mode` into `result`, using the shared `terms`"""
+    s = MODES[mode]
+    vp, perp, para = result[f"Vp{s}"], result[f"Vg{s}_perp"], result[f"Vg{s}_para"]
+
+    if mode == "fast":
+        np.add(terms["cm2"], terms["cn2"], out=vp2)
+        vp2 *= 0.5
+        np.sqrt(vp2, out=vp)
+        # sin (vp2 + k cos2) / vp
+        np.multiply(terms["k"], terms["cos2"], out=perp)
+        perp += vp2
+        perp *= terms["sin"]
+        perp /= vp
+        # cos (vp2 - k sin2) / vp
+        np.multiply(terms["k"], terms["sin2"], out=para)
+        np.subtract(vp2, para, out=para)
+    else:
+        # (cm2 - cn2) / 2, rationalized as it cancels perpendicular to the field
+        np.add(terms["cm2"], terms["cn2"], out=vp2)
+        np.divide(terms["p2cos2"], vp2, out=vp2)
+        np.sqrt(vp2, out=vp)
+        # sin (vp2 - k cos2) / vp, that is -sin vp**3 / cn2
+        np.multiply(vp2, vp, out=perp)
+        perp /= terms["cn2"]
+        np.negative(perp, out=perp)
+        perp *= terms["sin"]
+        # cos (vp2 + k sin2) / vp
+        np.multiply(terms["k"], terms["sin2"], out=para)
+        para += vp2
+    para *= terms["cos"]
+    para /= vp
+
+    # cs == ca along the field: both modes propagate at ca along the field, their
+    # perpendicular group velocity jumps from -ca/2 to ca/2 across it, 0 on average
+    degenerate = np.broadcast_to(terms["cn2"] == 0, vp.shape)
+    if degenerate.any():
+        np.copyto(perp, 0, where=degenerate)
+        np.copyto(para, np.sign(terms["cos"]) * vp, where=degenerate)
+
+# %% ../../../nbs/plasma/01_mhd_waves.ipynb 3
+def VpVg(
+    cs,  # sound speed
+    ca,  # Alfvén speed
+    theta=None,  # angles to the magnetic field in radians, defaults to a 1° grid
+    modes=("slow", "fast"),  # among "slow", "intermediate" and "fast"
+    out: np.ndarray = None,  # buffer of shape `(3 * len(modes), *shape)`
+    dtype=np.float64,
+) -> dict[str, np.ndarray]:
+    """Phase and group velocities of MHD modes, for arrays of `cs` and `ca` over angles `theta`"""
+    theta = angle_grid(theta, dtype)
+    cs, ca = np.asarray(cs, dtype=dtype), np.asarray(ca, dtype=dtype)
+    shape = np.broadcast_shapes(cs.shape, ca.shape) + theta.shape
+    # append the angle axes to the speeds
+    cs = cs.reshape(cs.shape + (1,) * theta.ndim)
+    ca = ca.reshape(ca.shape + (1,) * theta.ndim)
 
-    cos_angle = cos(theta)
-    sin_angle = sin(theta)
-
-    cm = sqrt(cs**2 + ca**2)
-
-    cn4 = cm**4 - 4 * cs**2 * ca**2 * cos_angle**2
-    cn2 = sqrt(cn4)
-
-    tmp2 = cm**2 - cn2
-
-    Cp_slow = sqrt(0.5 * (tmp2))
-    Cp_fast = sqrt(0.5 * (cm**2 + cn2))
-
-    Cg_slow_perp = (
-        sin_angle * Cp_slow * (1 - cs**2 * ca**2 / Cp_slow**2 / cn2 * cos_angle**2)
-    )
-    Cg_slow_para = (
-        cos_angle * Cp_slow * (1 + cs**2 * ca**2 / Cp_slow**2 / cn2 * sin_angle**2)
-    )
-
-    Cg_fast_perp = (
-        sin_angle * Cp_fast * (1 + cs**2 * ca**2 / Cp_fast**2 / cn2 * cos_angle**2)
-    )
-    Cg_fast_para = (
-        cos_angle * Cp_fast * (1 - cs**2 * ca**2 / Cp_fast**2 / cn2 * sin_angle**2)
-    )
-
-    return {
-        "Vps": Cp_slow,
-        "Vpf": Cp_fast,
-        "Vgs_perp": Cg_slow_perp,
-        "Vgs_para": Cg_slow_para,
-        "Vgf_perp": Cg_fast_perp,
-        "Vgf_para": Cg_fast_para,
-    }
+    keys = output_keys(modes)
+    if out is None:
+        out = np.empty((len(keys), *shape), dtype=dtype)
+    result = dict(zip(keys, out))
+
+    cos = np.cos(theta)
+    sin = np.sin(theta)
+    if "intermediate" in modes:
+        np.multiply(ca, np.abs(cos), out=result["Vpi"])
+        result["Vgi_perp"].fill(0)
+        np.multiply(ca, np.sign(cos), out=result["Vgi_para"])
+
+    if "slow" in modes or "fast" in modes:
+        cs2, ca2 = cs * cs, ca * ca
+        cm2 = cs2 + ca2
+        p = cs2 * ca2
+        cos2 = cos * cos
+
+        p2cos2 = np.multiply(2 * p, cos2)
+        cn2 = 2 * p2cos2
+        np.subtract(cm2 * cm2, cn2, out=cn2)
+        np.sqrt(cn2, out=cn2)
+        vp2 = np.empty_like(cn2)
+        # `k` is infinite where cn2 vanishes (cs == ca along the field), handled in `magnetosonic`
+        with np.errstate(invalid="ignore", divide="ignore"):
+            terms = dict(
+                cos=cos,
+                sin=sin,
+                cos2=cos2,
+                sin2=sin * sin,
+                cm2=cm2,
+                cn2=cn2,
+                p2cos2=p2cos2,
+                k=p / cn2,
+            )
+            for mode in ("slow", "fast"):
+                if mode in modes:
+                    magnetosonic(mode, terms, result, vp2)
+    return result
+
+
+def iter_VpVg(
+    cs,
+    ca,
+    theta=None,
+    modes=("slow", "fast"),
+    dtype=np.float64,
+    chunk: int = 4096,  # number of samples per chunk
+):
+    """`VpVg` over chunks of samples (the first axis of `cs` and `ca`), with memory bounded by the chunk size
+
+    Yields the slice of samples and their velocities. The output buffer is reused: arrays are overwritten by the next chunk.
+    """
+    cs, ca = np.broadcast_arrays(np.atleast_1d(cs), np.atleast_1d(ca))
+    theta = angle_grid(theta, dtype)
+    shape = (min(chunk, len(cs)), *cs.shape[1:], *theta.shape)
+    buffer = np.empty((len(output_keys(modes)), *shape), dtype=dtype)
+    for start in range(0, len(cs), chunk):
+        sl = slice(start, min(start + chunk, len(cs)))
+        out = buffer[:, : sl.stop - start]
+        yield sl, VpVg(cs[sl], ca[sl], theta, modes, out=out, dtype=dtype)
+
+
+def VpVg_fs(cs, ca, theta=None):
+    """Calculates the phase velocities and group velocities for fast and slow waves."""
+    result = VpVg(cs, ca, theta, modes=("slow", "fast"))
+    keys = ["Vps", "Vpf", "Vgs_perp", "Vgs_para", "Vgf_perp", "Vgf_para"]
+    return {k: result[k] for k in keys}
@@ -16,15 +16,41 @@ def resample(
     offset: timedelta = None,
     shift: timedelta = None,
     time_column="time",
+    aggs: str
+    | list[
+        str
+    ] = "mean",  # aggregation(s) of numeric columns, e.g. `["mean", "std", "count"]`
+    is_sorted: bool = False,  # whether `df` is already sorted by `time_column`
 ):
-    """Resample the DataFrame"""
+    """Resample the DataFrame
+
+    Non-overlapping windows (`period == every`) of unsorted data are computed with a plain `group_by` on the truncated time, which needs no input sort and runs in Polars' streaming engine. Sorted data and overlapping windows use `group_by_dynamic`, without sorting if `is_sorted`.
+
+    With multiple `aggs`, output columns are suffixed with the aggregation name.
+    """
     if period is None:
         period = every
     if shift is None:
         shift = period / 2
-    return (
-        df.sort(time_column)
-        .group_by_dynamic(time_column, every=every, period=period, offset=offset)
-        .agg(cs.numeric().mean())
-        .with_columns((pl.col(time_column) + shift))
-    )
+
+    if isinstance(aggs, str):
+        exprs = [getattr(cs.numeric(), aggs)()]
+    else:
+        exprs = [getattr(cs.numeric(), agg)().name.suffix(f"_{agg}") for agg in aggs]
+
+    if period == every and not is_sorted:
+        time = pl.col(time_column)
+        if offset:
+            time = (time - offset).dt.truncate(every) + offset
+        else:
+            time = time.dt.truncate(every)
+        df = df.group_by(time).agg(*exprs).sort(time_column)
+    else:
+        if is_sorted:
+            df = df.with_columns(pl.col(time_column).set_sorted())
+        else:
+            df = df.sort(time_column)
+        df = df.group_by_dynamic(
+            time_column, every=every, period=period, offset=offset
+        ).agg(*exprs)
+    return df.with_columns(pl.col(time_column) + shift)
@@ -0,0 +1,345 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/utils/18_cache.ipynb.
+
+# %% auto 0
+__all__ = ['DEFAULT_CACHE_DIR', 'MAX_FETCH', 'Fetcher', 'default_cache', 'split_timerange', 'fetch_split', 'CacheStats',
+           'ChunkCache', 'Coalescer', 'TTLCache']
+
+# %% ../../../nbs/utils/18_cache.ipynb 1
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from pathlib import Path
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Hashable
+
+import polars as pl
+from loguru import logger
+
+# %% ../../../nbs/utils/18_cache.ipynb 2
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "space_analysis"
+MAX_FETCH = timedelta(days=7)  # default longest time range of a single request
+
+Fetcher = Callable[[list[str], datetime, datetime], dict[str, pl.DataFrame]]
+"""Fetch the given parameters between `start` and `stop`, returning one dataframe per parameter.
+
+An empty dataframe means that there is no data and is cached; a missing (or `None`) parameter means that the fetch failed and is fetched again next time."""
+
+# %% ../../../nbs/utils/18_cache.ipynb 3
+def tmp_suffix() -> str:
+    """Suffix of temporary files, unique per process and thread"""
+    return f"{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def safe_name(name: str) -> str:
+    """`name` as a single path component"""
+    return name.replace("/", "_").replace("\\", "_")
+
+
+def to_datetime(t: str | date | datetime) -> datetime:
+    """Naive UTC datetime"""
+    if isinstance(t, str):
+        # `fromisoformat` only accepts a trailing `Z` from Python 3.11
+        t = datetime.fromisoformat(t[:-1] + "+00:00" if t.endswith("Z") else t)
+    if not isinstance(t, datetime):
+        return datetime.combine(t, datetime.min.time())
+    if t.tzinfo is not None:
+        t = t.astimezone(timezone.utc).replace(tzinfo=None)
+    return t
+
+
+def chunk_starts(start: datetime, stop: datetime, chunk: timedelta) -> list[datetime]:
+    """Starts of the fixed-width chunks (aligned on the Unix epoch) covering `[start, stop)`"""
+    start, stop = to_datetime(start), to_datetime(stop)
+    epoch = datetime(1970, 1, 1)
+    chunk_start = epoch + (start - epoch) // chunk * chunk
+    starts = []
+    while chunk_start < stop:
+        starts.append(chunk_start)
+        chunk_start += chunk
+    return starts
+
+# %% ../../../nbs/utils/18_cache.ipynb 4
+def split_timerange(
+    timerange: list, max_fetch: timedelta = MAX_FETCH
+) -> list[tuple[datetime, datetime]]:
+    """Consecutive intervals of at most `max_fetch` covering `timerange`, the whole range if `max_fetch` is None"""
+    start, stop = (to_datetime(t) for t in timerange)
+    bounds = []
+    while max_fetch and start < stop:
+        bounds.append((start, min(start + max_fetch, stop)))
+        start += max_fetch
+    return bounds or [(start, stop)]
+
+
+def fetch_split(
+    fetch: Callable[[datetime, datetime], Any],
+    timerange: list,
+    max_fetch: timedelta = MAX_FETCH,
+    max_workers: int = 4,  # maximum number of concurrent fetches
+) -> list[tuple[tuple[datetime, datetime], Any]]:
+    """Intervals of `split_timerange` with the result of `fetch` on each, fetched concurrently, in time order"""
+    bounds = split_timerange(timerange, max_fetch)
+    if len(bounds) == 1:
+        return [(bounds[0], fetch(*bounds[0]))]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(zip(bounds, pool.map(lambda b: fetch(*b), bounds)))
+
+# %% ../../../nbs/utils/18_cache.ipynb 5
+@dataclass
+class CacheStats:
+    hits: int = 0  # number of chunks served from the cache
+    misses: int = 0  # number of chunks fetched
+    fetches: int = 0  # number of calls to the fetch function
+    evictions: int = 0  # number of chunks evicted
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def add(self, **counts: int):
+        """Increment the counters, from any thread"""
+        with self._lock:
+            for name, n in counts.items():
+                setattr(self, name, getattr(self, name) + n)
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+# %% ../../../nbs/utils/18_cache.ipynb 6
+class ChunkCache:
+    """On-disk cache of time series, stored as Parquet files of fixed-width time chunks with a size-bounded LRU eviction."""
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_DIR
+        / "chunks",  # only holds chunks, see `clear`
+        chunk: timedelta = timedelta(days=1),  # width of the time chunks
+        max_size: int = 10 * 2**30,  # maximum size of the cache in bytes
+        time: str = "time",  # name of the time column
+        max_fetch: timedelta = MAX_FETCH,  # longest time range of a single fetch, the whole gap if None
+        max_workers: int = 4,  # maximum number of concurrent fetches
+    ):
+        self.path = Path(path)
+        self.chunk = chunk
+        self.max_size = max_size
+        self.time = time
+        self.max_fetch = max_fetch
+        self.max_workers = max_workers
+        self.stats = CacheStats()
+
+    def chunk_path(
+        self, provider: str, dataset: str, parameter: str, chunk_start: datetime
+    ) -> Path:
+        fname = f"{chunk_start:%Y%m%dT%H%M%S}.parquet"
+        names = (safe_name(n) for n in (provider, dataset, parameter))
+        return self.path.joinpath(*names, fname)
+
+    def _write(self, df: pl.DataFrame, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{tmp_suffix()}")
+        df.write_parquet(tmp_path)
+        os.replace(tmp_path, path)
+
+    def _store(self, df: pl.DataFrame, paths: list[Path], starts: list[datetime]):
+        """Split `df` into the chunks starting at `starts`, empty chunks are cached so that they are not fetched again"""
+        for path, start in zip(paths, starts):
+            chunk_df = df.filter(
+                pl.col(self.time).is_between(start, start + self.chunk, closed="left")
+            )
+            self._write(chunk_df, path)
+
+    def get(
+        self,
+        provider: str,
+        dataset: str,
+        parameters: list[str],
+        timerange: list,
+        fetch: Fetcher,
+    ) -> dict[str, pl.LazyFrame]:
+        """Get `parameters` of `dataset` within `timerange`, only fetching the chunks not cached yet."""
+        start, stop = (to_datetime(t) for t in timerange)
+        starts = chunk_starts(start, stop, self.chunk)
+        paths = {
+            p: [self.chunk_path(provider, dataset, p, s) for s in starts]
+            for p in parameters
+        }
+
+        # group consecutive chunks missing the same parameters into gaps, each fetched in one call
+        max_chunks = self.max_fetch // self.chunk if self.max_fetch else len(starts)
+        max_chunks = max(max_chunks, 1)
+        gaps: list[tuple[tuple[str], int, int]] = []
+        for i in range(len(starts)):
+            missing = tuple(p for p in parameters if not paths[p][i].exists())
+            self.stats.add(hits=len(parameters) - len(missing), misses=len(missing))
+            if not missing:
+                continue
+            if (
+                gaps
+                and gaps[-1][0] == missing
+                and gaps[-1][2] == i - 1
+                and i - gaps[-1][1] < max_chunks
+            ):
+                gaps[-1] = (missing, gaps[-1][1], i)
+            else:
+                gaps.append((missing, i, i))
+
+        def fetch_gap(missing, first, last):
+            gap_start, gap_stop = starts[first], starts[last] + self.chunk
+            logger.debug(f"Fetching {dataset} {missing} from {gap_start} to {gap_stop}")
+            return fetch(list(missing), gap_start, gap_stop)
+
+        # store each gap as soon as it is fetched, so that completed chunks survive a failure
+        errors = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(fetch_gap, *gap): gap for gap in gaps}
+            for future in as_completed(futures):
+                missing, first, last = futures[future]
+                try:
+                    data = future.result()
+                except Exception as exc:
+                    logger.warning(f"Failed to fetch {dataset} {missing}: {exc!r}")
+                    errors.append(exc)
+                    continue
+                self.stats.add(fetches=1)
+                for p in missing:
+                    if data.get(p) is None:
+                        logger.warning(f"No answer for {dataset} {p}, not cached")
+                        continue
+                    self._store(
+                        data[p], paths[p][first : last + 1], starts[first : last + 1]
+                    )
+        if errors:
+            raise errors[0]
+
+        paths = {p: [path for path in paths[p] if path.exists()] for p in parameters}
+        used = [path for p in parameters for path in paths[p]]
+        for path in used:
+            os.utime(path)
+        self.evict(keep=used)
+
+        empty = pl.LazyFrame(schema={self.time: pl.Datetime("ns")})
+        return {
+            p: pl.concat(
+                [empty, *(pl.scan_parquet(path) for path in paths[p])],
+                how="diagonal_relaxed",
+            ).filter(pl.col(self.time).is_between(start, stop, closed="left"))
+            for p in parameters
+        }
+
+    def files(self) -> list[Path]:
+        return list(self.path.rglob("*.parquet"))
+
+    def size(self) -> int:
+        """Total size of the cache in bytes"""
+        return sum(f.stat().st_size for f in self.files())
+
+    def evict(self, keep: list[Path] = []):
+        """Remove the least recently used chunks until the cache fits in `max_size`, except those in `keep`."""
+        entries = sorted(
+            ((f, f.stat()) for f in self.files()), key=lambda e: e[1].st_mtime_ns
+        )
+        size = sum(stat.st_size for _, stat in entries)
+        keep = set(keep)
+        for f, stat in entries:
+            if size <= self.max_size:
+                break
+            if f in keep:
+                continue
+            f.unlink()
+            size -= stat.st_size
+            self.stats.add(evictions=1)
+
+    def clear(self):
+        """Remove the whole cache directory"""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+default_cache = ChunkCache()
+
+# %% ../../../nbs/utils/18_cache.ipynb 8
+class Coalescer:
+    """Share the result of concurrent calls with the same key"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight: dict[Hashable, Future] = {}
+        self.coalesced = 0  # number of calls served by another caller's request
+
+    def __call__(self, key: Hashable, func: Callable, *args, **kwargs):
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+            else:
+                self.coalesced += 1
+        if not owner:
+            return future.result()
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+# %% ../../../nbs/utils/18_cache.ipynb 9
+class TTLCache:
+    """JSON values cached in memory and on disk, expiring after `ttl`"""
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_DIR / "metadata",
+        ttl: timedelta = timedelta(days=1),
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._memory: dict[str, tuple[float, Any]] = {}
+        self._coalesce = Coalescer()
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{key.replace('/', '_')}.json"
+
+    def _fresh(self, timestamp: float) -> bool:
+        return time.time() - timestamp < self.ttl.total_seconds()
+
+    def get(self, key: str, fetch: Callable[[], Any]):
+        """Value of `key`, fetched once (even for concurrent callers) when missing or expired"""
+        entry = self._memory.get(key)
+        if entry is not None and self._fresh(entry[0]):
+            self.stats.add(hits=1)
+            return entry[1]
+        return self._coalesce(key, self._load, key, fetch)
+
+    def _load(self, key: str, fetch: Callable[[], Any]):
+        file = self._file(key)
+        if file.exists() and self._fresh(mtime := file.stat().st_mtime):
+            self.stats.add(hits=1)
+            self._memory[key] = (mtime, json.loads(file.read_text()))
+            return self._memory[key][1]
+
+        self.stats.add(misses=1, fetches=1)
+        value = fetch()
+        if value is None:  # failed request, not cached
+            return value
+        file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = file.with_name(f"{file.name}.{tmp_suffix()}")
+        tmp_file.write_text(json.dumps(value))
+        os.replace(tmp_file, file)
+        self._memory[key] = (time.time(), value)
+        return value
+
+    def clear(self):
+        self._memory.clear()
+        shutil.rmtree(self.path, ignore_errors=True)
@@ -1,43 +1,187 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/utils/21_cdas.ipynb.
 
 # %% auto 0
-__all__ = ['cdas', 'get_dataset_variables', 'get_data', 'Variables']
+__all__ = ['POOL_SIZE', 'metadata_cache', 'coalesce', 'get_cdas', 'get_variables', 'get_dataset_variables', 'clip_time',
+           'combine_pieces', 'get_data', 'da2pldf', 'cdas_fetch', 'get_polars', 'Variables']
 
 # %% ../../../nbs/utils/21_cdas.ipynb 1
+import threading
+import numpy as np
+from datetime import timedelta
 from cdasws import CdasWs
+import requests
+from requests.adapters import HTTPAdapter
 from loguru import logger
 from cdasws.datarepresentation import DataRepresentation
 import xarray as xr
 import polars as pl
 from ..core import Dataset as V
+from .cache import DEFAULT_CACHE_DIR, MAX_FETCH, ChunkCache
+from .cache import Coalescer, TTLCache, fetch_split
+from ..ds.ts.align import align
 from pydantic import ConfigDict, model_validator
 
 # %% ../../../nbs/utils/21_cdas.ipynb 2
-cdas = CdasWs()
+POOL_SIZE = (
+    16  # keep-alive connections of the shared client, one per concurrent request
+)
+
+metadata_cache = TTLCache(DEFAULT_CACHE_DIR / "cdas", ttl=timedelta(days=1))
+coalesce = Coalescer()
+
+_cdas: CdasWs = None
+_cdas_lock = threading.Lock()
+
+
+def get_cdas() -> CdasWs:
+    """Shared CDAS client, created on first use"""
+    global _cdas
+    with _cdas_lock:
+        if _cdas is None:
+            _cdas = CdasWs()
+            # the default pool keeps 10 connections, more concurrent requests would reconnect.
+            # `_session` is private to cdasws (a `requests.Session` in 1.8), see the pin in `pyproject.toml`
+            session = getattr(_cdas, "_session", None)
+            if not isinstance(session, requests.Session):
+                logger.warning(
+                    "CdasWs has no `requests` session, keeping its default pool"
+                )
+            else:
+                adapter = HTTPAdapter(
+                    pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE
+                )
+                session.mount("https://", adapter)
+    return _cdas
+
+
+def __getattr__(name):
+    if name == "cdas":  # module-level client, for backwards compatibility
+        return get_cdas()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # %% ../../../nbs/utils/21_cdas.ipynb 3
-def get_dataset_variables(dataset: str):
-    variables_dict = cdas.get_variables(dataset)
-    for variable in variables_dict:
-        logger.info(variable["Name"], variable["LongDescription"])
+def get_variables(dataset: str) -> list[dict]:
+    """Descriptions of the variables of `dataset`"""
 
-    return [variable["Name"] for variable in variables_dict]
+    def fetch():
+        variables = get_cdas().get_variables(dataset)
+        for variable in variables or []:
+            logger.debug(f"{variable['Name']}: {variable['LongDescription']}")
+        return variables
 
+    return metadata_cache.get(f"variables_{dataset}", fetch)
 
-def get_data(dataset, timerange, variables: list = None) -> xr.Dataset:
-    variables = variables or get_dataset_variables(dataset)
 
-    _, data = cdas.get_data(
+def get_dataset_variables(dataset: str):
+    variables = get_variables(dataset)
+    if variables is None:  # failed fetches are not cached
+        raise ValueError(
+            f"No variable metadata for {dataset}, the request to CDAS failed"
+        )
+    return [variable["Name"] for variable in variables]
+
+
+def _get_data(dataset, variables: list, start, stop) -> xr.Dataset:
+    _, data = get_cdas().get_data(
         dataset,
         variables=variables,
-        time0=timerange[0],
-        time1=timerange[1],
+        time0=start,
+        time1=stop,
         DataRepresentation=DataRepresentation.XARRAY,
     )
-
     return data
 
-# %% ../../../nbs/utils/21_cdas.ipynb 4
+
+def clip_time(data: xr.Dataset, stop) -> xr.Dataset:
+    """Samples before `stop` along all the time dimensions"""
+    stop = np.datetime64(stop)
+    return data.isel(
+        {
+            dim: (data[dim] < stop).values
+            for dim in data.dims
+            if dim in data.coords and data[dim].dtype.kind == "M"
+        }
+    )
+
+
+def combine_pieces(pieces: list[tuple[tuple, xr.Dataset | None]]) -> xr.Dataset | None:
+    """Concatenate consecutive requests along their time dimensions"""
+    datasets = [
+        data if i == len(pieces) - 1 else clip_time(data, stop)
+        for i, ((_, stop), data) in enumerate(pieces)
+        if data is not None
+    ]
+    if len(datasets) < len(pieces):
+        logger.warning(
+            f"{len(pieces) - len(datasets)} of {len(pieces)} requests failed"
+        )
+    if len(datasets) <= 1:
+        return datasets[0] if datasets else None
+    return xr.combine_by_coords(
+        datasets,
+        data_vars="minimal",
+        coords="minimal",
+        compat="override",
+        join="outer",
+        combine_attrs="override",
+    )
+
+
+def get_data(
+    dataset,
+    timerange,
+    variables: list = None,
+    max_fetch: timedelta = MAX_FETCH,  # longest time range of a single request
+) -> xr.Dataset:
+    """Data of `dataset`, long time ranges are fetched as concurrent requests"""
+    variables = variables or get_dataset_variables(dataset)
+
+    def fetch(start, stop):
+        key = (dataset, tuple(variables), str(start), str(stop))
+        return coalesce(key, _get_data, dataset, variables, start, stop)
+
+    return combine_pieces(fetch_split(fetch, timerange, max_fetch))
+
+# %% ../../../nbs/utils/21_cdas.ipynb 5
+def da2pldf(da: xr.DataArray, time="time") -> pl.DataFrame:
+    """Convert a CDAS variable to a Polars DataFrame"""
+    values = da.values
+    data = {time: da[da.dims[0]].values}
+    if values.ndim == 1:
+        data[da.name] = values
+    else:
+        data.update({f"{da.name}_{i}": values[:, i] for i in range(values.shape[1])})
+    return pl.DataFrame(data)
+
+
+def cdas_fetch(dataset: str):
+    """Fetch function of `ChunkCache` for CDAS datasets"""
+
+    def fetch(variables: list[str], start, stop):
+        data = get_data(dataset, [start, stop], variables)
+        if data is None:
+            return {}
+        return {var: da2pldf(data[var]) for var in variables if var in data}
+
+    return fetch
+
+
+def get_polars(
+    dataset: str,
+    timerange,
+    variables: list = None,
+    cache: ChunkCache = None,  # on-disk cache, like `default_cache`
+    **kwargs,  # passed to `align`
+) -> pl.LazyFrame:
+    variables = variables or get_dataset_variables(dataset)
+    fetch = cdas_fetch(dataset)
+    if cache is None:
+        ldfs = [df.lazy() for df in fetch(variables, *timerange).values()]
+    else:
+        ldfs = list(cache.get("cdas", dataset, variables, timerange, fetch).values())
+    return align(ldfs, **kwargs)
+
+# %% ../../../nbs/utils/21_cdas.ipynb 7
 class Variables(V):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -48,6 +192,7 @@ class Variables(V):
     def check_products(self):
         if self.parameters is None:
             self.parameters = get_dataset_variables(self.dataset)
+        return self
 
     def retrieve_data(self):
         self.data = get_data(self.dataset, self.timerange, self.parameters)
@@ -58,7 +203,9 @@ class Variables(V):
             self.retrieve_data()
         return self.data
 
-    def to_polars(self):
+    def to_polars(self, cache: ChunkCache = None):
+        if cache is not None:
+            return get_polars(self.dataset, self.timerange, self.parameters, cache)
         return pl.DataFrame(self.to_pandas().reset_index())
 
     def to_pandas(self):
@@ -0,0 +1,45 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/utils/00_imports.ipynb.
+
+# %% auto 0
+__all__ = ['lazy_import', 'run_python', 'import_time', 'loaded_modules']
+
+# %% ../../../nbs/utils/00_imports.ipynb 1
+import sys
+import subprocess
+import importlib.util
+from statistics import median
+from types import ModuleType
+
+# %% ../../../nbs/utils/00_imports.ipynb 2
+def lazy_import(name: str) -> ModuleType:
+    """Import module `name` on first attribute access"""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+# %% ../../../nbs/utils/00_imports.ipynb 4
+def run_python(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout
+
+
+def import_time(module: str, repeat: int = 3) -> float:
+    """Median time in seconds to import `module` in a fresh interpreter"""
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    return median(float(run_python(code).split()[-1]) for _ in range(repeat))
+
+
+def loaded_modules(module: str) -> set[str]:
+    """Modules actually loaded (not only registered lazily) when importing `module` in a fresh interpreter"""
+    code = f"""import sys, {module}
+print("\\n".join(k for k, v in list(sys.modules.items()) if type(v).__name__ != "_LazyModule"))"""
+    return set(run_python(code).split())
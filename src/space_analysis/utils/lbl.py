@@ -1,13 +1,194 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/io/31_lbl.ipynb.
 
 # %% auto 0
-__all__ = ['HTTP_PROTOCOLS', 'load_lbl']
+__all__ = ['HTTP_PROTOCOLS', 'parse_label', 'UnsupportedTableError', 'read_table', 'read_lbl', 'load_lbl']
 
 # %% ../../../nbs/io/31_lbl.ipynb 2
+import re
+from pathlib import Path
+
+import numpy as np
 import pandas
-import pdr
+import polars as pl
+
+# %% ../../../nbs/io/31_lbl.ipynb 4
+VALUE_PAIRS = {'"': '"', "(": ")", "{": "}"}
+
+
+def parse_value(value: str):
+    value = value.strip()
+    if value.startswith('"'):
+        return " ".join(value.strip('"').split())
+    if value.startswith(("(", "{")):
+        return tuple(parse_value(v) for v in value[1:-1].split(",") if v.strip())
+    if m := re.fullmatch(r"(\S+)\s*<(.+)>", value):
+        return (parse_value(m[1]), m[2])
+    for type in (int, float):
+        try:
+            return type(value)
+        except ValueError:
+            pass
+    return value.strip("'")
+
+
+def label_statements(text: str):
+    """`(key, value)` statements of a label, joining values spanning multiple lines"""
+    lines = iter(re.sub(r"/\*.*?\*/", "", text, flags=re.S).splitlines())
+    for line in lines:
+        key, sep, value = line.partition("=")
+        key = key.strip()
+        if key == "END":
+            return
+        if not sep:
+            continue
+        value = value.strip()
+        close = VALUE_PAIRS.get(value[:1])
+        while close and close not in value[1:]:
+            value += " " + next(lines).strip()
+        yield key, value
+
+# %% ../../../nbs/io/31_lbl.ipynb 5
+def parse_label(text: str) -> dict:
+    """Parse a PDS3 label. Nested objects are dictionaries under their name, repeated ones are lists."""
+    label = {}
+    stack = [label]
+    for key, value in label_statements(text):
+        if key in ("OBJECT", "GROUP"):
+            obj = {}
+            current = stack[-1]
+            if value not in current:
+                current[value] = obj
+            elif isinstance(current[value], list):
+                current[value].append(obj)
+            else:
+                current[value] = [current[value], obj]
+            stack.append(obj)
+        elif key in ("END_OBJECT", "END_GROUP"):
+            stack.pop()
+        else:
+            stack[-1][key] = parse_value(value)
+    return label
+
+# %% ../../../nbs/io/31_lbl.ipynb 6
+TIME_FORMATS = {
+    r"\d{4}-\d{3}T": "%Y-%jT%H:%M:%S%.f",
+    r"\d{4}-\d{2}-\d{2}T": "%Y-%m-%dT%H:%M:%S%.f",
+}
+
+
+def table_columns(table: dict) -> list[tuple[str, str, int, int]]:
+    """`(name, data_type, offset, bytes)` of the table columns, expanding the items of vector columns"""
+    columns = table.get("COLUMN", [])
+    columns = columns if isinstance(columns, list) else [columns]
+    fields = []
+    for col in columns:
+        name, data_type = col["NAME"], col["DATA_TYPE"]
+        start = col["START_BYTE"] - 1
+        items = col.get("ITEMS", 1)
+        if items == 1:
+            fields.append((name, data_type, start, col["BYTES"]))
+            continue
+        item_bytes = col["ITEM_BYTES"]
+        item_offset = col.get("ITEM_OFFSET", item_bytes)
+        for i in range(items):
+            fields.append(
+                (f"{name}_{i}", data_type, start + i * item_offset, item_bytes)
+            )
+    return fields
+
+
+def table_offset(label: dict, name: str = "TABLE") -> int:
+    """Byte offset of the table, from the pointer `^TABLE = ("file", record)`, `("file", byte <BYTES>)` or `record`"""
+    pointer = label.get(f"^{name}", 1)
+    if isinstance(pointer, str):
+        return 0
+    if isinstance(pointer, tuple) and isinstance(pointer[0], str):
+        pointer = pointer[1] if len(pointer) > 1 else 1
+    if isinstance(pointer, tuple):
+        return pointer[0] - 1
+    return (pointer - 1) * label.get("RECORD_BYTES", 0)
 
-# %% ../../../nbs/io/31_lbl.ipynb 3
+
+def decode_column(s: pl.Series, data_type: str) -> pl.Series:
+    s = s.cast(pl.String).str.strip_chars()
+    if "REAL" in data_type or "FLOAT" in data_type:
+        return s.cast(pl.Float64)
+    if "INTEGER" in data_type:
+        return s.cast(pl.Int64)
+    if data_type in ("TIME", "DATE"):
+        s = s.str.strip_suffix("Z")
+        for pattern, fmt in TIME_FORMATS.items():
+            if s.len() and re.match(pattern, s[0]):
+                return s.str.to_datetime(fmt, time_unit="ns")
+    return s
+
+# %% ../../../nbs/io/31_lbl.ipynb 7
+class UnsupportedTableError(ValueError):
+    """The table is valid PDS3 but in a format that `read_table` does not decode"""
+
+
+def read_table(
+    label: dict,  # parsed label, see `parse_label`
+    data: bytes | np.ndarray,  # content of the table file
+    name: str = "TABLE",  # name of the table object
+) -> pl.DataFrame:
+    """Decode a fixed-width ASCII table described by `label`"""
+    table = label[name]
+    if table.get("INTERCHANGE_FORMAT", "ASCII") != "ASCII":
+        raise UnsupportedTableError("Only ASCII tables are supported")
+
+    offset = table_offset(label, name)
+    stride = (
+        table["ROW_BYTES"]
+        + table.get("ROW_PREFIX_BYTES", 0)
+        + table.get("ROW_SUFFIX_BYTES", 0)
+    )
+    rows = (len(data) - offset) // stride
+    rows = min(rows, table.get("ROWS", rows))
+
+    fields = table_columns(table)
+    prefix = table.get("ROW_PREFIX_BYTES", 0)
+    dtype = np.dtype(
+        {
+            "names": [f"f{i}" for i in range(len(fields))],
+            "formats": [f"S{nbytes}" for *_, nbytes in fields],
+            "offsets": [prefix + start for _, _, start, _ in fields],
+            "itemsize": stride,
+        }
+    )
+    records = np.frombuffer(data, dtype=dtype, count=rows, offset=offset)
+    return pl.DataFrame(
+        [
+            decode_column(pl.Series(name, records[f"f{i}"]), data_type)
+            for i, (name, data_type, *_) in enumerate(fields)
+        ]
+    )
+
+
+def read_lbl(
+    filepath: str | Path,  # path of the label file
+    name: str = "TABLE",  # name of the table object
+) -> pl.DataFrame:
+    """Read the table described by a PDS3 label, memory-mapping the table file"""
+    filepath = Path(filepath)
+    label = parse_label(filepath.read_text(errors="replace"))
+
+    pointer = label.get(f"^{name}")
+    file = pointer[0] if isinstance(pointer, tuple) else pointer
+    if isinstance(file, str):
+        data_path = filepath.parent / file
+        if not data_path.exists():  # file names are case-insensitive in PDS
+            matches = [
+                p for p in filepath.parent.iterdir() if p.name.lower() == file.lower()
+            ]
+            data_path = matches[0] if matches else data_path
+    else:  # attached label
+        data_path = filepath
+
+    data = np.memmap(data_path, dtype=np.uint8, mode="r")
+    return read_table(label, data, name)
+
+# %% ../../../nbs/io/31_lbl.ipynb 8
 HTTP_PROTOCOLS = ("http", "https")
 
 
@@ -22,7 +203,12 @@ def load_lbl(filepath: str, type: str = "table") -> pandas.DataFrame:
         A pandas DataFrame containing the loaded data.
     """
     if type == "table":
-        df = pdr.read(filepath).TABLE
+        try:
+            df = read_lbl(filepath).to_pandas()
+        except UnsupportedTableError:
+            import pdr
+
+            df = pdr.read(filepath).TABLE
     elif type == "index":
         df = pandas.read_csv(filepath, delimiter=",", quotechar='"')
         df.columns = df.columns.str.replace(" ", "")
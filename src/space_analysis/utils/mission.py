@@ -1,13 +1,16 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/examples/10_mission_info.ipynb.
 
 # %% auto 0
-__all__ = ['parse_mission_yaml', 'parse_missions_yaml', 'find_instrument', 'parse_missions', 'merge_dfs']
+__all__ = ['parse_mission_yaml', 'parse_missions_yaml', 'find_instrument', 'parse_missions', 'merge_dfs', 'MissionCatalog',
+           'load_catalog', 'load_cdas_instruments']
 
 # %% ../../../nbs/examples/10_mission_info.ipynb 0
 import yaml
 import polars as pl
-from ..core import Mission, Instrument, InstrumentSuite
+from ..core import Mission, Instrument, InstrumentSuite, Dataset
 from pathlib import Path
+from datetime import datetime
+from functools import lru_cache
 
 # %% ../../../nbs/examples/10_mission_info.ipynb 1
 def parse_mission_yaml(file: Path):
@@ -30,20 +33,213 @@ def find_instrument(instruments: list[Instrument | InstrumentSuite], ins_type):
     return [i for i in ins_in_suite + ins_out_suite if i.type == ins_type]
 
 
-def parse_missions(data: list[Mission], info, ins_type=None):
-    rows = []
-
-    for mission in data:
-        if ins_type is None:
-            rows.append([mission.name, mission.model_dump(warnings="none").get(info)])
-            continue
-        instruments = find_instrument(mission.instruments, ins_type)
-        for i in instruments:
-            rows.append([mission.name, i.model_dump(warnings="none").get(info)])
-
-    return pl.DataFrame(rows, schema=["Mission", info], orient="row")
+def parse_missions(data: "list[Mission] | MissionCatalog", info, ins_type=None):
+    catalog = (
+        data if isinstance(data, MissionCatalog) else MissionCatalog.from_missions(data)
+    )
+    if ins_type is None:
+        df = catalog.missions
+    else:
+        df = catalog.query(type=ins_type).unique(
+            ["mission", "suite", "instrument"], maintain_order=True
+        )
+    if info == "name":  # the catalog keeps names in the `mission`/`instrument` columns
+        value = pl.col("mission" if ins_type is None else "instrument").alias(info)
+    else:
+        value = pl.col(info) if info in df.columns else pl.lit(None).alias(info)
+    return df.select(pl.col("mission").alias("Mission"), value)
 
 
 # Define the merge function
 def merge_dfs(left: pl.DataFrame, right, on="Mission", how="full", coalesce=True):
     return left.join(right, on=on, how=how, coalesce=coalesce)
+
+# %% ../../../nbs/examples/10_mission_info.ipynb 4
+CADENCE_UNITS = {
+    "ms": 1e-3,
+    "s": 1.0,
+    "sec": 1.0,
+    "min": 60.0,
+    "h": 3600.0,
+    "hr": 3600.0,
+}
+
+
+def cadence_expr(col: str = "time_resolutions") -> pl.Expr:
+    """Finest sampling interval in seconds of strings like `"11 Hz"`, `"0.25-1 Hz"` or `"1 min"`"""
+    s = pl.col(col).cast(pl.String)
+    values = s.str.extract_all(r"\d+(?:\.\d+)?").list.eval(
+        pl.element().cast(pl.Float64)
+    )
+    unit = s.str.extract(r"([A-Za-z]+)\s*$")
+    factor = unit.replace_strict(CADENCE_UNITS, default=None, return_dtype=pl.Float64)
+    return (
+        pl.when(unit == "Hz")
+        .then(1 / values.list.max())
+        .otherwise(values.list.min() * factor)
+    )
+
+
+def flat_instruments(mission: Mission):
+    """`(suite, instrument)` pairs of `mission`, with instruments taken out of their suites"""
+    for i in mission.instruments:
+        if isinstance(i, InstrumentSuite):
+            yield from ((i.name, j) for j in i.instruments)
+        else:
+            yield None, i
+
+
+def dataset_rows(datasets: list[Dataset]):
+    """One row per dataset variable, or per dataset if it has no variables"""
+    for ds in datasets or [None]:
+        variables = list((ds.variables or {}).values()) if ds else []
+        for v in variables or [None]:
+            timerange = (v and v.timerange) or (ds and ds.timerange) or [None, None]
+            yield {
+                "dataset": ds and (ds.dataset or ds.name),
+                "variable": v and v.name,
+                "unit": v and v.unit,
+                "ts": (v and v.ts) or (ds and ds.ts),
+                "start": timerange[0],
+                "stop": timerange[-1],
+            }
+
+
+def catalog_rows(mission: Mission):
+    members = list(flat_instruments(mission))
+    if mission.datasets or not members:
+        members.append((None, None))  # datasets not attached to an instrument
+    exclude = {"name", "datasets", "instruments", "names_list"}
+    for suite, ins in members:
+        fields = ins.model_dump(warnings="none", exclude=exclude) if ins else {}
+        datasets = ins.datasets if ins else mission.datasets
+        for row in dataset_rows(datasets):
+            yield {
+                "mission": mission.name,
+                "suite": suite,
+                "instrument": ins and ins.name,
+                **fields,
+                **row,
+            }
+
+# %% ../../../nbs/examples/10_mission_info.ipynb 5
+class MissionCatalog:
+    """Columnar catalog of missions, one row per mission × instrument × dataset × variable"""
+
+    def __init__(self, missions: pl.DataFrame, table: pl.DataFrame):
+        self.missions = missions  # one row per mission
+        self.table = table
+
+    @classmethod
+    def from_missions(cls, data: list[Mission]):
+        exclude = {"name", "instruments", "datasets", "names_list"}
+        missions = pl.from_dicts(
+            [
+                {"mission": m.name, **m.model_dump(warnings="none", exclude=exclude)}
+                for m in data
+            ],
+            infer_schema_length=None,
+        )
+        for c in ("launch_date", "end_date"):
+            if c not in missions.columns:
+                missions = missions.with_columns(pl.lit(None, pl.Date).alias(c))
+
+        table = pl.from_dicts(
+            [row for m in data for row in catalog_rows(m)], infer_schema_length=None
+        )
+        if "time_resolutions" not in table.columns:
+            table = table.with_columns(time_resolutions=pl.lit(None, pl.String))
+        dates = missions.select(
+            "mission",
+            pl.col("launch_date", "end_date").cast(pl.Datetime("us")),
+        )
+        table = (
+            table.join(dates, on="mission", how="left")
+            .with_columns(
+                cadence=pl.coalesce(
+                    pl.col("ts").cast(pl.Duration("us")).dt.total_microseconds() / 1e6,
+                    cadence_expr(),
+                ),
+                start=pl.coalesce(
+                    pl.col("start").cast(pl.Datetime("us")), "launch_date"
+                ),
+                stop=pl.coalesce(pl.col("stop").cast(pl.Datetime("us")), "end_date"),
+            )
+            .drop("ts", "launch_date", "end_date")
+            .cast({c: pl.String for c in ("dataset", "variable", "unit")})
+        )
+        columns = ["mission", "suite", "instrument", "type", "cadence"]
+        table = table.select(*columns, pl.exclude(columns))
+        return cls(missions, table)
+
+    @classmethod
+    def from_yaml(cls, dir: Path, suffixs=[".yaml", ".yml"]):
+        return cls.from_missions(parse_missions_yaml(dir, suffixs))
+
+    def query(
+        self,
+        type: str = None,  # instrument type, like `"magnetometer"`
+        mission: str | list[str] = None,
+        max_cadence: float = None,  # in seconds
+        covering: datetime | tuple[datetime, datetime] = None,
+    ) -> pl.DataFrame:
+        """Rows matching all the given criteria
+
+        Rows are covering if their time coverage overlaps the `covering` time or time range; missing stop dates are treated as ongoing.
+        """
+        predicates = []
+        if type is not None:
+            predicates.append(pl.col("type") == type)
+        if mission is not None:
+            missions = [mission] if isinstance(mission, str) else mission
+            predicates.append(pl.col("mission").is_in(missions))
+        if max_cadence is not None:
+            predicates.append(pl.col("cadence") <= max_cadence)
+        if covering is not None:
+            start, stop = covering if isinstance(covering, tuple) else (covering,) * 2
+            predicates.append(
+                (pl.col("start") <= stop)
+                & (pl.col("stop").is_null() | (pl.col("stop") >= start))
+            )
+        return self.table.filter(*predicates) if predicates else self.table
+
+
+@lru_cache(maxsize=8)
+def _compile_catalog(files: tuple[tuple[Path, int], ...]):
+    return MissionCatalog.from_missions([parse_mission_yaml(f) for f, _ in files])
+
+
+def load_catalog(dir: Path, suffixs=[".yaml", ".yml"]) -> MissionCatalog:
+    """Catalog of the mission yaml files in `dir`, recompiled only when one of them changes"""
+    files = sorted(
+        (f, f.stat().st_mtime_ns) for f in Path(dir).iterdir() if f.suffix in suffixs
+    )
+    return _compile_catalog(tuple(files))
+
+# %% ../../../nbs/examples/10_mission_info.ipynb 7
+@lru_cache(maxsize=8)
+def _read_cdas_instruments(file: Path, mtime: int):
+    df = pl.read_json(file)
+    return (
+        df.explode("ObservatoryInstruments")
+        .select(
+            pl.col("Name").alias("observatory_group"),
+            pl.col("ObservatoryInstruments").struct.field("Name").alias("observatory"),
+            pl.col("ObservatoryInstruments").struct.field("InstrumentDescription"),
+        )
+        .explode("InstrumentDescription")
+        .unnest("InstrumentDescription")
+        .rename(
+            {
+                "Name": "instrument",
+                "ShortDescription": "short_description",
+                "LongDescription": "long_description",
+            }
+        )
+    )
+
+
+def load_cdas_instruments(file: Path) -> pl.DataFrame:
+    """Observatory groups and instruments from a CDAS listing (`obs_groups_and_instrs.json`), one row per instrument"""
+    file = Path(file)
+    return _read_cdas_instruments(file, file.stat().st_mtime_ns)
@@ -1,16 +1,172 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/utils/20_pds.ipynb.
 
 # %% auto 0
-__all__ = ['PDS_URL', 'pds_download']
+__all__ = ['PDS_URL', 'HashRegistry', 'body_offset', 'response_validator', 'fetch_url', 'fetch_urls', 'pds_download']
 
 # %% ../../../nbs/utils/20_pds.ipynb 1
+import copy
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from threading import Lock
+from typing import Callable
+from concurrent.futures import ThreadPoolExecutor
+
 import pooch
+import requests
 from pooch import Unzip
+from pooch.utils import unique_file_name
+from requests.adapters import HTTPAdapter
+from loguru import logger
+
+# %% ../../../nbs/utils/20_pds.ipynb 3
+class HashRegistry:
+    """Hashes of the downloaded files, recorded after their first successful fetch"""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path) / "hashes.json"
+        self._lock = Lock()
+
+    def _read(self) -> dict[str, str]:
+        return json.loads(self.path.read_text()) if self.path.exists() else {}
+
+    def get(self, name: str) -> str | None:
+        with self._lock:
+            return self._read().get(name)
+
+    def set(self, name: str, hash: str):
+        with self._lock:
+            hashes = self._read()
+            hashes[name] = hash
+            tmp_path = self.path.with_name(
+                f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            tmp_path.write_text(json.dumps(hashes, indent=1))
+            os.replace(tmp_path, self.path)
+
+
+def body_offset(response: requests.Response, offset: int) -> int | None:
+    """Offset in the file at which the body of `response` starts, `None` if it does not continue the partial file of size `offset`"""
+    content_range = response.headers.get("Content-Range", "")
+    match response.status_code:
+        case 200:
+            return 0
+        case 206:  # partial content, "bytes start-end/size"
+            start = re.match(r"bytes (\d+)-", content_range)
+            return offset if start and int(start[1]) == offset else None
+        case (
+            416
+        ):  # range not satisfiable, "bytes */size": complete if the size is the offset
+            size = re.match(r"bytes \*/(\d+)", content_range)
+            return offset if size and int(size[1]) == offset else None
+    return None
+
+
+def response_validator(response: requests.Response) -> str | None:
+    """Strong validator of the response, for `If-Range`"""
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified")
+
+
+def fetch_url(
+    url: str,
+    path: str | Path = None,  # cache directory, defaults to the one of `pooch.retrieve`
+    session: requests.Session = None,
+    registry: HashRegistry = None,
+    chunk_size: int = 2**20,
+    timeout: float = 60,
+) -> tuple[str, str]:
+    """Download `url`, resuming a partial download. Returns the file and the action taken, as in `pooch.retrieve`."""
+    path = Path(path or pooch.os_cache("pooch"))
+    path.mkdir(parents=True, exist_ok=True)
+    session = session or requests.Session()
+    registry = registry or HashRegistry(path)
+
+    name = unique_file_name(url)
+    fname = path / name
+    known_hash = registry.get(name)
+
+    action = "download"
+    if fname.exists():
+        file_hash = f"sha256:{pooch.file_hash(fname)}"
+        if known_hash in (None, file_hash):
+            registry.set(name, file_hash)
+            return str(fname), "fetch"
+        logger.warning(f"Hash mismatch for {fname}, downloading it again")
+        fname.unlink()
+        action = "update"
+
+    part = fname.with_name(f"{name}.part")
+    part_validator = fname.with_name(f"{name}.part.validator")
+    for _ in range(2):  # resume the partial file, or restart from scratch once
+        offset = part.stat().st_size if part.exists() else 0
+        headers = {}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            if part_validator.exists():  # full content if the file changed since
+                headers["If-Range"] = part_validator.read_text()
+        with session.get(url, headers=headers, stream=True, timeout=timeout) as r:
+            if r.status_code not in (206, 416):
+                r.raise_for_status()
+            start = body_offset(r, offset)
+            if start is not None:
+                if start == 0 and (value := response_validator(r)):
+                    part_validator.write_text(value)
+                if r.status_code != 416:
+                    with open(part, "ab" if start else "wb") as f:
+                        for chunk in r.iter_content(chunk_size):
+                            f.write(chunk)
+                break
+        logger.warning(f"Cannot resume {url} at byte {offset}, downloading it again")
+        part.unlink(missing_ok=True)
+        part_validator.unlink(missing_ok=True)
+    else:
+        raise ValueError(f"Server did not send the requested range of {url}")
+
+    file_hash = f"sha256:{pooch.file_hash(part)}"
+    if known_hash not in (None, file_hash):
+        part.unlink()
+        raise ValueError(f"Hash of {url} does not match, expected {known_hash}")
+    part.replace(fname)
+    part_validator.unlink(missing_ok=True)
+    registry.set(name, file_hash)
+    return str(fname), action
+
+
+def fetch_urls(
+    urls: list[str],
+    path: str | Path = None,
+    processor: Callable
+    | list[Callable] = None,  # pooch processor(s), one per url if a list
+    max_workers: int = 4,  # maximum number of concurrent downloads and connections
+) -> list:
+    """Download `urls` concurrently, processing each file as soon as it is downloaded."""
+    path = Path(path or pooch.os_cache("pooch"))
+    # processors like `pooch.Unzip` update their state when called, each url gets its own
+    if not isinstance(processor, list):
+        processor = [copy.copy(processor) for _ in urls]
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    registry = HashRegistry(path)
+
+    def task(url, processor):
+        fname, action = fetch_url(url, path, session, registry)
+        return processor(fname, action, None) if processor else fname
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(task, urls, processor))
 
-# %% ../../../nbs/utils/20_pds.ipynb 4
+# %% ../../../nbs/utils/20_pds.ipynb 6
 PDS_URL = "https://pds-ppi.igpp.ucla.edu/ditdos/download?id=pds://PPI"
 
-# %% ../../../nbs/utils/20_pds.ipynb 5
+# %% ../../../nbs/utils/20_pds.ipynb 7
 def pds_download(
     mission,  # planetary missions
     instrument,
@@ -26,13 +182,9 @@ def pds_download(
     # phase_url = PARAMS[mission][instrument][dataset]["url_format"]
     url = f"{pds_url}/{phase_url}/{coord}/{datatype}"
 
-    files = pooch.retrieve(
-        url=url,
-        known_hash=None,
-        path=path,
-        processor=Unzip(
-            extract_dir=f"{mission}/{instrument}/{dataset}/{coord}/{datatype}"
-        ),
+    processor = Unzip(
+        extract_dir=f"{mission}/{instrument}/{dataset}/{coord}/{datatype}"
     )
+    (files,) = fetch_urls([url], path=path, processor=processor)
 
     return files
@@ -1,30 +1,50 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/utils/19_speasy.ipynb.
 
 # %% auto 0
-__all__ = ['DEFAULT_PROVIDER', 'get_provider', 'get_dataset_index', 'get_dataset_parameters', 'get_parameter_index',
-           'get_products', 'get_data', 'get_polars_ldf', 'Variable', 'Variables', 'SVariables']
+__all__ = ['DEFAULT_PROVIDER', 'INVENTORY_DIR', 'INVENTORY_MAX_AGE', 'get_provider', 'get_dataset_index',
+           'get_dataset_parameters', 'get_parameter_index', 'InventoryIndex', 'get_inventory_index', 'get_products',
+           'get_data', 'spz_fetch', 'get_cached_polars_ldf', 'get_polars_ldf', 'Variable', 'fetch_data', 'Variables',
+           'SVariables']
 
 # %% ../../../nbs/utils/19_speasy.ipynb 1
 import speasy as spz
 
 from fastcore.all import patch
+import os
+import time
+from threading import Lock
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from difflib import get_close_matches
+from pathlib import Path
+import polars as pl
+from loguru import logger
 from pydantic import model_validator, ConfigDict
 from functools import cached_property
 from ..core import Variables as Vs
 from ..core import Variable as V
+from .cache import ChunkCache, DEFAULT_CACHE_DIR
+from .cache import MAX_FETCH, fetch_split
+from datetime import timedelta
+from speasy.products.variable import merge
 
 from speasy.core.dataprovider import DataProvider
 from speasy import SpeasyVariable
 from speasy.core.inventory import DatasetIndex, ParameterIndex
 
-import matplotlib.pyplot as plt
-from matplotlib.pyplot import Axes
+from typing import TYPE_CHECKING
+from .imports import lazy_import
+
 
 from humanize import naturalsize
 
 # for backwards compatibility
 from ..ds.spz.utils import get_time_resolution
-from ..ds.spz.io import spzvars2pldf  # noqa: F401
+from ..ds.spz.io import spzvar2pldf, spzvars2pldf  # noqa: F401
+from ..ds.ts.align import align
+
+_plt = lazy_import("matplotlib.pyplot")
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
 
 DEFAULT_PROVIDER = "cda"
 
@@ -50,7 +70,152 @@ def get_parameter_index(param: str, ds: str) -> ParameterIndex:
     ds_info = vars(get_dataset_index(ds))
     return ds_info[param]
 
-# %% ../../../nbs/utils/19_speasy.ipynb 4
+# %% ../../../nbs/utils/19_speasy.ipynb 5
+def index_meta(index, *names: str) -> str | None:
+    """First of the metadata `names` defined in a speasy index"""
+    for name in names:
+        if (value := getattr(index, name, None)) is not None:
+            return str(value)
+    return None
+
+# %% ../../../nbs/utils/19_speasy.ipynb 6
+INVENTORY_DIR = DEFAULT_CACHE_DIR / "inventory"
+INVENTORY_MAX_AGE = timedelta(days=7)  # age after which a snapshot is rebuilt
+
+
+class InventoryIndex:
+    """Flat index of a speasy inventory, one row per parameter"""
+
+    def __init__(
+        self,
+        df: pl.DataFrame,  # rows of each `(provider, dataset)` are contiguous
+        provider: str = None,  # default provider of the lookups, the first one if None
+    ):
+        self.df = df
+        self.rebuilt = False  # whether built from the inventory in this process
+        counts = df.select(pl.struct("provider", "dataset").rle()).to_series()
+        lengths = counts.struct.field("len")
+        keys = counts.struct.field("value").struct.unnest().rows()
+        self._datasets = dict(zip(keys, zip(lengths.cum_sum() - lengths, lengths)))
+        self.provider = provider or (keys[0][0] if keys else None)
+
+    @classmethod
+    def from_inventory(cls, datasets: dict[str, DatasetIndex], provider: str = "cda"):
+        rows = [
+            {
+                "provider": provider,
+                "dataset": ds_name,
+                "parameter": param.spz_name(),
+                "units": index_meta(param, "units", "UNITS"),
+                "description": index_meta(param, "description", "CATDESC"),
+                "cadence": index_meta(ds, "cadence", "dataset_time_resolution"),
+                "start_date": index_meta(ds, "start_date"),
+                "stop_date": index_meta(ds, "stop_date"),
+            }
+            for ds_name, ds in datasets.items()
+            for param in ds
+        ]
+        df = pl.DataFrame(
+            rows, schema={k: pl.String for k in rows[0]} if rows else None
+        )
+        dates = [
+            pl.col(c).str.strip_suffix("Z").str.to_datetime(strict=False)
+            for c in ("start_date", "stop_date")
+        ]
+        # parameters stay in inventory order within each dataset, so that snapshots load as is
+        df = df.with_columns(dates).sort("provider", "dataset", maintain_order=True)
+        return cls(df, provider)
+
+    @classmethod
+    def build(cls, provider: str = "cda"):
+        """Build the index from the speasy inventory of `provider`"""
+        index = cls.from_inventory(
+            get_provider(provider).flat_inventory.datasets, provider
+        )
+        index.rebuilt = True
+        return index
+
+    def save(self, path: str | Path):
+        # replaced atomically, as indexes loaded from the previous snapshot still map it
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        self.df.write_ipc(tmp_path, compression="uncompressed")
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str | Path):
+        # uncompressed IPC files are memory-mapped by Polars, and saved sorted
+        return cls(pl.read_ipc(path))
+
+    def __contains__(self, product: str):
+        """Whether `product` (dataset of the default provider or `provider/dataset/parameter`) is in the index"""
+        if product.count("/") < 2:
+            return (self.provider, product) in self._datasets
+        provider, dataset, parameter = product.split("/", 2)
+        return (provider, dataset) in self._datasets and parameter in self.parameters(
+            dataset, provider
+        )
+
+    def _rows(self, dataset: str, provider: str = None) -> pl.DataFrame:
+        offset, length = self._datasets[(provider or self.provider, dataset)]
+        return self.df.slice(offset, length)
+
+    def parameters(self, dataset: str, provider: str = None) -> list[str]:
+        return self._rows(dataset, provider)["parameter"].to_list()
+
+    def coverage(self, dataset: str, provider: str = None):
+        """Start and stop dates of `dataset`"""
+        row = self._rows(dataset, provider).row(0, named=True)
+        return row["start_date"], row["stop_date"]
+
+    def validate(self, products: list[str]) -> list[str]:
+        """Products not in the index"""
+        return [p for p in products if p not in self]
+
+    def search(self, query: str, fuzzy=False, n: int = 10) -> list[str]:
+        """Datasets starting with `query`, or the `n` closest ones if `fuzzy`"""
+        datasets = [ds for p, ds in self._datasets if p == self.provider]
+        if fuzzy:
+            return get_close_matches(query, datasets, n=n, cutoff=0.5)
+        return [ds for ds in datasets if ds.startswith(query)]
+
+
+_inventory_indexes: dict[Path, InventoryIndex] = {}
+_inventory_lock = Lock()
+
+
+def get_inventory_index(
+    provider: str = "cda",
+    path: str | Path = None,
+    max_age: timedelta = INVENTORY_MAX_AGE,
+    dataset: str = None,  # dataset that should be in the index
+) -> InventoryIndex:
+    """Inventory index of `provider`, loaded from its snapshot.
+
+    The snapshot is built on first use and rebuilt when older than `max_age`, or (once per process) when it misses `dataset`, e.g. added upstream since.
+    """
+    path = Path(path or INVENTORY_DIR / f"{provider}.arrow")
+    with _inventory_lock:
+        index = _inventory_indexes.get(path)
+        if (
+            not path.exists()
+            or time.time() - path.stat().st_mtime > max_age.total_seconds()
+        ):
+            index = InventoryIndex.build(provider)
+            index.save(path)
+        elif index is None:
+            index = InventoryIndex.load(path)
+        if dataset is not None and dataset not in index and not index.rebuilt:
+            logger.info(
+                f"{dataset} is not in the {provider} inventory snapshot, rebuilding it"
+            )
+            index = InventoryIndex.build(provider)
+            index.save(path)
+        _inventory_indexes[path] = index
+    return index
+
+# %% ../../../nbs/utils/19_speasy.ipynb 8
 @patch
 def preview(self: SpeasyVariable):
     print("===========================================")
@@ -67,22 +232,68 @@ def preview(self: SpeasyVariable):
     print(f"Values:       {self.values[:3]}")
     print("===========================================")
 
-# %% ../../../nbs/utils/19_speasy.ipynb 6
+# %% ../../../nbs/utils/19_speasy.ipynb 10
 def get_products(v: V, provider):
     return [f"{provider}/{v.dataset}/{p}" for p in v.parameter]
 
 
-def get_data(v: V, provider, timerange=None):
+def get_data(
+    v: V,
+    provider,
+    timerange=None,
+    max_fetch: timedelta = MAX_FETCH,  # longest time range of a single request
+):
+    """Data of the products of `v`, long time ranges are fetched as concurrent requests"""
     products = get_products(v, provider)
     timerange = timerange or v.timerange
-    return spz.get_data(products, timerange)
-
-
-def get_polars_ldf(v: V, provider=DEFAULT_PROVIDER, timerange=None):
-    products = get_products(v, provider)
+    pieces = fetch_split(
+        lambda start, stop: spz.get_data(products, [start, stop]), timerange, max_fetch
+    )
+    if len(pieces) == 1:
+        return pieces[0][1]
+    return [merge(data[i] for _, data in pieces) for i in range(len(products))]
+
+
+def spz_fetch(provider: str, dataset: str):
+    """Fetch function of `ChunkCache` for speasy products"""
+
+    def fetch(parameters: list[str], start, stop):
+        products = [f"{provider}/{dataset}/{p}" for p in parameters]
+        data = spz.get_data(products, [start, stop])
+        return {
+            p: spzvar2pldf(var).collect()
+            for p, var in zip(parameters, data)
+            if var is not None
+        }
+
+    return fetch
+
+
+def get_cached_polars_ldf(products: list[str], timerange, cache: ChunkCache, **kwargs):
+    """Get `products` (like `cda/WI_H2_MFI/BGSE`) through the on-disk `cache`."""
+    groups: dict[tuple[str, str], list[str]] = {}
+    for product in products:
+        provider, dataset, parameter = product.split("/", 2)
+        groups.setdefault((provider, dataset), []).append(parameter)
+
+    ldfs = []
+    for (provider, dataset), parameters in groups.items():
+        fetch = spz_fetch(provider, dataset)
+        ldfs.extend(cache.get(provider, dataset, parameters, timerange, fetch).values())
+    return align(ldfs, **kwargs)
+
+
+def get_polars_ldf(
+    v: V,
+    provider=DEFAULT_PROVIDER,
+    timerange=None,
+    cache: ChunkCache = None,  # on-disk cache, like `default_cache`
+    max_fetch: timedelta = MAX_FETCH,  # longest time range of a single request, without `cache`
+):
     timerange = timerange or v.timerange
-    data = spz.get_data(products, timerange)
-    return spzvars2pldf(data)
+    if cache is not None:
+        return get_cached_polars_ldf(get_products(v, provider), timerange, cache)
+    return spzvars2pldf(get_data(v, provider, timerange, max_fetch))
 
 
 class Variable(V):
@@ -116,11 +327,11 @@ class Variable(V):
             yy = yaml.load(f, Loader=yaml.FullLoader)
             return cls(**yy)
 
-# %% ../../../nbs/utils/19_speasy.ipynb 7
+# %% ../../../nbs/utils/19_speasy.ipynb 11
 @patch
-def plot(self: Variable, fig=None, ax: Axes = None):
+def plot(self: Variable, fig=None, ax: "Axes" = None):
     if fig is None and ax is None:
-        fig, ax = plt.subplots()
+        fig, ax = _plt.subplots()
 
     self.data.replace_fillval_by_nan().plot(ax=ax)
 
@@ -141,7 +352,56 @@ def dump(self: Variable, path: str):
         )
         yaml.dump(yy, f)
 
-# %% ../../../nbs/utils/19_speasy.ipynb 8
+# %% ../../../nbs/utils/19_speasy.ipynb 12
+def fetch_data(
+    variables: list[Variable],
+    max_workers: int = None,  # maximum number of concurrent requests
+    timeout: float = None,  # seconds to wait for each product, from the start of its request
+) -> list[SpeasyVariable | None]:
+    """Fetch the data of `variables` concurrently.
+
+    A product that fails or is not fetched within `timeout` is logged and returned as `None`, without aborting the others.
+    """
+    started: dict[int, float] = {}
+
+    def fetch(i: int):
+        started[i] = time.monotonic()
+        return variables[i].data
+
+    def deadline(i: int):
+        return started[i] + timeout if i in started else float("inf")
+
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    futures = {pool.submit(fetch, i): i for i in range(len(variables))}
+    pending, expired = set(futures), set()
+    while pending:
+        wait_time = None
+        if (
+            timeout is not None
+        ):  # until the earliest deadline, products queued are checked again shortly
+            wait_time = min(deadline(futures[f]) for f in pending) - time.monotonic()
+            wait_time = min(max(wait_time, 0), 0.1)
+        _, pending = wait(pending, timeout=wait_time, return_when=FIRST_COMPLETED)
+        now = time.monotonic()
+        timed_out = {f for f in pending if deadline(futures[f]) <= now}
+        expired |= timed_out
+        pending -= timed_out
+    pool.shutdown(wait=False, cancel_futures=True)
+
+    results = []
+    for future, i in futures.items():
+        product = variables[i].product
+        if future in expired:
+            logger.warning(f"Timed out fetching {product} after {timeout} s")
+            results.append(None)
+        elif (exc := future.exception()) is not None:
+            logger.warning(f"Failed to fetch {product}: {exc!r}")
+            results.append(None)
+        else:
+            results.append(future.result())
+    return results
+
+# %% ../../../nbs/utils/19_speasy.ipynb 13
 class Variables(Vs):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -150,6 +410,8 @@ class Variables(Vs):
     dataset: str = None
     provider: str = "cda"
     products: list[str | ParameterIndex] = None
+    max_workers: int = 8  # maximum number of concurrent requests
+    timeout: float = None  # seconds to wait for each product
 
     # initize products from provider and dataset if not provided
     @model_validator(mode="after")
@@ -161,8 +423,11 @@ class Variables(Vs):
                 ]
 
             else:
-                self.products = get_dataset_parameters(self.dataset, self.provider)
-                self.parameters = [member.spz_name() for member in self.products]
+                index = get_inventory_index(self.provider, dataset=self.dataset)
+                self.parameters = index.parameters(self.dataset)
+                self.products = [
+                    f"{self.provider}/{self.dataset}/{var}" for var in self.parameters
+                ]
         return self
 
     @model_validator(mode="after")
@@ -175,21 +440,30 @@ class Variables(Vs):
         return self
 
     @property
-    def data(self) -> list[SpeasyVariable]:
-        return [var.data for var in self.variables]
+    def data(self) -> list[SpeasyVariable | None]:
+        """Data of all the variables, fetched concurrently. Failed products are `None`."""
+        return fetch_data(self.variables, self.max_workers, self.timeout)
 
     @property
     def time_resolutions(self):
         return [var.time_resolution for var in self.variables]
 
-    def to_polars(self):
-        return spzvars2pldf(self.data)
+    def to_polars(self, cache: ChunkCache = None):
+        """Products aligned on the first one, failed products (other than the first) are left out"""
+        if cache is not None:
+            return get_cached_polars_ldf(self.products, self.timerange, cache)
+        data = self.data
+        if data[0] is None:
+            raise ValueError(
+                f"Could not fetch the reference product {self.products[0]}"
+            )
+        return spzvars2pldf([d for d in data if d is not None])
 
     def plot(self, gridspec_kw: dict = {"hspace": 0}):
         vars = self.variables
 
-        fig, axes = plt.subplots(nrows=len(vars), sharex=True, gridspec_kw=gridspec_kw)
-        axes: list[Axes] = axes if len(vars) > 1 else [axes]
+        fig, axes = _plt.subplots(nrows=len(vars), sharex=True, gridspec_kw=gridspec_kw)
+        axes: list["Axes"] = axes if len(vars) > 1 else [axes]
 
         for var, ax in zip(vars, axes):
             var.plot(ax=ax)